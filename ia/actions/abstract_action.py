@@ -1,11 +1,17 @@
 from abc import ABC, abstractmethod
 from typing import Optional
 
+from ia.utils.clock import Clock, SYSTEM_CLOCK
+
+
 class AbstractAction(ABC):
     """
     Abstract class for executing and controlling robot actions.
+    Waits must go through self.clock (set by ActionRepositoryFactory, real time by default).
     """
 
+    clock: Clock = SYSTEM_CLOCK
+
     @abstractmethod
     def execute(self) -> None:
         """
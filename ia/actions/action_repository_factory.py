@@ -11,6 +11,7 @@ from ia.actions.serial_port import SerialPort
 from ia.api.ax12.ax12_link_serial import AX12LinkSerial
 from ia.api.camera import Camera
 from ia.api.chrono import Chrono
+from ia.utils.clock import Clock
 
 
 class ActionRepositoryFactory:
@@ -22,6 +23,7 @@ class ActionRepositoryFactory:
         serial_ports: Optional[dict[str, SerialPort]],
         camera: Optional[Camera] = None,
         chrono: Optional[Chrono] = None,
+        clock: Optional[Clock] = None,
     ) -> ActionRepository:
         logger = logging.getLogger(__name__)
         action_repository = ActionRepository()
@@ -37,6 +39,7 @@ class ActionRepositoryFactory:
             "action_repository": action_repository,
             "camera": camera,
             "chrono": chrono,
+            "clock": clock,
         }
 
         for root, dirs, files in os.walk(folder):
@@ -59,6 +62,8 @@ class ActionRepositoryFactory:
                         raise ValueError(f"Unhandled action type: {action_type_name}")
 
                     action = cls.from_json(action_config.get("payload", {}), **deps)
+                    if clock is not None:
+                        action.clock = clock
                     action_repository.register_action(action_id, action)
 
                     if "alias" in action_config:
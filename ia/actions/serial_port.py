@@ -1,18 +1,22 @@
 import logging
 import time
+from typing import Optional
 
 import serial
 
+from ia.api.device_backend import DeviceBackend, HARDWARE_BACKEND
+
 
 class SerialPort:
     """Wrapper minimal autour de pyserial pour communiquer avec un actionneur."""
 
-    def __init__(self, port: str, baud_rate: int) -> None:
+    def __init__(self, port: str, baud_rate: int, backend: Optional[DeviceBackend] = None) -> None:
         self.logger = logging.getLogger(__name__)
+        backend = backend if backend is not None else HARDWARE_BACKEND
         try:
-            self.serial = serial.Serial(
-                port=port,
-                baudrate=baud_rate,
+            self.serial = backend.open_serial(
+                port,
+                baud_rate,
                 bytesize=serial.EIGHTBITS,
                 stopbits=serial.STOPBITS_ONE,
                 parity=serial.PARITY_NONE,
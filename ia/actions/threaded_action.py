@@ -19,8 +19,7 @@ class ThreadedAction(AbstractAction):
             return
         self._finished = False
         self._stop_requested = False
-        self._thread = threading.Thread(target=self._run, daemon=True)
-        self._thread.start()
+        self._thread = self.clock.start_thread(self._run)
 
     def finished(self) -> bool:
         return self._finished
@@ -31,7 +30,7 @@ class ThreadedAction(AbstractAction):
     def reset(self) -> None:
         if self._thread is not None and self._thread.is_alive():
             self.stop()
-            self._thread.join()
+            self.clock.join(self._thread)
         self._thread = None
         self._finished = False
         self._stop_requested = False
@@ -2,6 +2,7 @@
 from ia.actions.types.action_wait import ActionWait           # noqa: F401
 from ia.actions.types.action_list import ActionList           # noqa: F401
 from ia.actions.types.action_list_join import ActionListJoin  # noqa: F401
+from ia.actions.types.action_graph import ActionGraph         # noqa: F401
 from ia.actions.types.action_ax12 import ActionAX12           # noqa: F401
 from ia.actions.types.action_actuator import ActionActuator   # noqa: F401
 from ia.actions.types.action_pwm_servo import ActionPwmServo  # noqa: F401
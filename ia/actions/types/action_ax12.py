@@ -1,5 +1,4 @@
 import logging
-import time
 from typing import Optional
 
 from ia.actions.abstract_action import AbstractAction
@@ -61,7 +60,7 @@ class ActionAX12(AbstractAction):
             return True
         if self.command == "position" and self._command_sent:
             try:
-                time.sleep(0.05)
+                self.clock.sleep(0.05)
                 self._executed = not self.servo.is_moving()
             except Exception as e:
                 self.logger.warning(f"Error asking AX12 moving status : {e}")
@@ -0,0 +1,149 @@
+import logging
+from typing import Optional
+
+from ia.actions.registry import action_type
+from ia.actions.threaded_action import ThreadedAction
+
+
+@action_type("graph")
+class ActionGraph(ThreadedAction):
+    """
+    Execute un graphe de dependances d'actions : chaque noeud demarre des que
+    tous les noeuds de son champ "after" sont termines.
+    """
+
+    def __init__(self, action_repository, nodes: list[dict], flags: Optional[list[str]] = None) -> None:
+        super().__init__(flags)
+        self.logger = logging.getLogger(__name__)
+        self.action_repository = action_repository
+        self.nodes = nodes
+        # Instants de debut/fin (s, relatifs au lancement du graphe) de chaque noeud
+        self.timings: dict[str, tuple[float, float]] = {}
+        self.critical_path: list[str] = []
+
+    @classmethod
+    def from_json(cls, payload: dict, **deps) -> 'ActionGraph':
+        if "nodes" not in payload:
+            raise ValueError("'nodes' not found in graph action config payload")
+        nodes = []
+        for node in payload["nodes"]:
+            if "id" not in node:
+                raise ValueError("'id' missing in graph action node")
+            nodes.append({
+                "id": node["id"],
+                "action": node.get("action", node["id"]),
+                "after": list(node.get("after", [])),
+            })
+        cls._check_nodes(nodes)
+        return cls(deps["action_repository"], nodes, payload.get("flags"))
+
+    @staticmethod
+    def _check_nodes(nodes: list[dict]) -> None:
+        ids = [node["id"] for node in nodes]
+        if len(ids) != len(set(ids)):
+            raise ValueError(f"Duplicated node id in graph action: {ids}")
+        actions = [node["action"].upper() for node in nodes]
+        if len(actions) != len(set(actions)):
+            raise ValueError(f"An action can only be referenced once in a graph action: {actions}")
+        for node in nodes:
+            unknown = [dep for dep in node["after"] if dep not in ids]
+            if unknown:
+                raise ValueError(f"Node '{node['id']}' depends on unknown node(s): {', '.join(unknown)}")
+
+        # Tri topologique (Kahn) pour detecter les cycles
+        remaining = {node["id"]: set(node["after"]) for node in nodes}
+        while remaining:
+            ready = [node_id for node_id, after in remaining.items() if not after]
+            if not ready:
+                raise ValueError(f"Cycle detected in graph action between nodes: {', '.join(remaining)}")
+            for node_id in ready:
+                del remaining[node_id]
+            for after in remaining.values():
+                after.difference_update(ready)
+
+    def reset(self) -> None:
+        super().reset()
+        self.timings = {}
+        self.critical_path = []
+        for node in self.nodes:
+            if self.action_repository.has_action(node["action"]):
+                self.action_repository.get_action(node["action"]).reset()
+            else:
+                self.logger.error(f"no action with id {node['action']} found in action graph")
+
+    def check_action_list_for_missing(self):
+        missing_ids = [n["action"] for n in self.nodes if not self.action_repository.has_action(n["action"])]
+        if missing_ids:
+            raise ValueError(f"Actions missing from repository: {', '.join(missing_ids)}")
+
+    def _run(self) -> None:
+        t0 = self.clock.now()
+        pending = {node["id"]: node for node in self.nodes}
+        running = {}
+        done: dict[str, float] = {}
+        starts: dict[str, float] = {}
+
+        while pending or running:
+            if self._stop_requested:
+                for action in running.values():
+                    action.stop()
+                break
+
+            for node_id, node in list(pending.items()):
+                if not all(dep in done for dep in node["after"]):
+                    continue
+                del pending[node_id]
+                starts[node_id] = self.clock.now() - t0
+                if not self.action_repository.has_action(node["action"]):
+                    self.logger.error(f"no action with id {node['action']} found in action graph")
+                    done[node_id] = starts[node_id]
+                    continue
+                action = self.action_repository.get_action(node["action"])
+                try:
+                    action.reset()
+                    action.execute()
+                    self.logger.info(f"graph node {node_id} ({node['action']}) started")
+                    running[node_id] = action
+                except Exception as e:
+                    self.logger.error(f"Exception error {e}")
+                    done[node_id] = self.clock.now() - t0
+
+            for node_id, action in list(running.items()):
+                try:
+                    finished = action.finished()
+                except Exception as e:
+                    self.logger.error(f"Exception error {e}")
+                    finished = True
+                if finished:
+                    del running[node_id]
+                    done[node_id] = self.clock.now() - t0
+                    self.logger.info(f"graph node {node_id} finished")
+
+            # Les noeuds sans action declenchent de nouveaux departs sans attendre
+            if running:
+                self.clock.sleep(0.01)
+
+        self.timings = {node_id: (starts[node_id], done[node_id]) for node_id in done}
+        self.critical_path = self._compute_critical_path()
+        self.logger.info(
+            f"graph finished in {self.clock.now() - t0:.3f}s, critical path: {' -> '.join(self.critical_path)}"
+        )
+        self._finished = True
+
+    def _compute_critical_path(self) -> list[str]:
+        """
+        Remonte depuis le noeud termine en dernier, en suivant a chaque fois la
+        dependance qui a fini le plus tard (celle qui a reellement retarde le depart).
+        """
+        if not self.timings:
+            return []
+        after = {node["id"]: node["after"] for node in self.nodes}
+        current = max(self.timings, key=lambda node_id: self.timings[node_id][1])
+        path = [current]
+        while True:
+            deps = [dep for dep in after[current] if dep in self.timings]
+            if not deps:
+                break
+            current = max(deps, key=lambda node_id: self.timings[node_id][1])
+            path.append(current)
+        return list(reversed(path))
@@ -1,5 +1,4 @@
 import logging
-import time
 from typing import List, Optional
 
 from ia.actions.registry import action_type
@@ -50,7 +49,7 @@ class ActionList(ThreadedAction):
                 action.execute()
                 logger.info(f"action with id {action_id} started")
                 while not action.finished() and not self._stop_requested:
-                    time.sleep(0.01)
+                    self.clock.sleep(0.01)
                 if self._stop_requested:
                     action.stop()
             except Exception as e:
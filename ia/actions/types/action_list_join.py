@@ -1,5 +1,4 @@
 import logging
-import time
 from typing import List, Optional
 
 from ia.actions.registry import action_type
@@ -53,6 +52,6 @@ class ActionListJoin(ThreadedAction):
                 for action in actions:
                     action.stop()
                 break
-            time.sleep(0.01)
+            self.clock.sleep(0.01)
 
         self._finished = True
\ No newline at end of file
@@ -1,4 +1,3 @@
-import time
 from typing import Optional
 
 from gpiozero import AngularServo
@@ -51,7 +50,7 @@ class ActionPwmServo(ThreadedAction):
                 if self._stop_requested:
                     return
                 self.servo.angle = angle
-                time.sleep(0.5)
+                self.clock.sleep(0.5)
             if not self.loop:
                 break
         self._finished = True
\ No newline at end of file
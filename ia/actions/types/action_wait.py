@@ -1,5 +1,4 @@
 import logging
-import time
 from typing import Optional
 
 from ia.actions.registry import action_type
@@ -22,8 +21,8 @@ class ActionWait(ThreadedAction):
 
     def _run(self) -> None:
         self.logger.info(f"start waiting of {self.duration_ms} millisecond(s)")
-        deadline = time.time() + (self.duration_ms / 1000.)
-        while time.time() < deadline and not self._stop_requested:
-            time.sleep(0.01)
+        deadline = self.clock.now() + (self.duration_ms / 1000.)
+        while self.clock.now() < deadline and not self._stop_requested:
+            self.clock.sleep(min(0.01, deadline - self.clock.now()))
         self.logger.info("waiting finished")
         self._finished = True
\ No newline at end of file
@@ -1,5 +1,4 @@
 import logging
-import time
 from typing import Optional
 
 from ia.actions.registry import action_type
@@ -30,6 +29,6 @@ class ActionWaitChrono(ThreadedAction):
         while not self._stop_requested:
             if self.chrono.timestamp_start is not None and self.chrono.get_time_since_beginning() >= self.target_seconds:
                 break
-            time.sleep(0.01)
+            self.clock.sleep(0.01)
         self.logger.info(f"Chrono reached {self.target_seconds}s")
         self._finished = True
\ No newline at end of file
@@ -1,7 +1,9 @@
 import logging
+from typing import Optional
 
 import serial
 
+from ia.api.device_backend import DeviceBackend, HARDWARE_BACKEND
 from ia.api.ax12.ax12_exception import AX12Exception
 
 
@@ -24,13 +26,14 @@ class AX12LinkSerial:
         is_rts_enabled() -> bool: Checks if the RTS (Request to Send) signal is enabled.
     """
 
-    def __init__(self, serial_port: str, baud_rate: int) -> None:
+    def __init__(self, serial_port: str, baud_rate: int, backend: Optional[DeviceBackend] = None) -> None:
         """
         Initializes the serial connection with the specified parameters.
 
         Args:
             serial_port (str): The serial port to use for the connection.
             baud_rate (int): The baud rate for the serial communication.
+            backend (DeviceBackend, optional): Opens the serial port, the real hardware by default.
 
         Raises:
             AX12Exception: If an error occurs during the initialization of the serial port.
@@ -39,10 +42,11 @@ class AX12LinkSerial:
         self.rts_enabled = False
         self.lecture = bytearray()
         self.logger = logging.getLogger(__name__)
+        backend = backend if backend is not None else HARDWARE_BACKEND
         try:
-            self.serial = serial.Serial(
-                port=serial_port,
-                baudrate=baud_rate,
+            self.serial = backend.open_serial(
+                serial_port,
+                baud_rate,
                 bytesize=serial.EIGHTBITS,
                 stopbits=serial.STOPBITS_ONE,
                 parity=serial.PARITY_NONE,
@@ -1,6 +1,7 @@
 import logging
-import threading
-from datetime import datetime
+from typing import Optional
+
+from ia.utils.clock import Clock, SYSTEM_CLOCK
 
 
 class Chrono:
@@ -11,9 +12,11 @@ class Chrono:
     match_duration : int
         The duration of the match in seconds.
     timestamp_start : float
-        The timestamp when the match started.
-    timer : threading.Timer
-        A timer object to handle the match duration.
+        The clock time (s) when the match started.
+    timer : object
+        The clock timer calling the match end.
+    clock : Clock
+        The clock service used to measure the match time (millisecond resolution).
     Methods
     -------
     __str__():
@@ -24,15 +27,16 @@ class Chrono:
         Returns the time elapsed since the match started in seconds.
     """
 
-    def __init__(self, match_duration: int) -> None:
+    def __init__(self, match_duration: int, clock: Optional[Clock] = None) -> None:
         """
         Initializes a new instance of the Chrono class.
         Args:
             match_duration (int): The duration of the match in seconds.
+            clock (Clock, optional): The clock service, real time by default.
         Attributes:
             match_duration (int): The duration of the match in seconds.
             timestamp_start (None or float): The start time of the match, initialized to None.
-            timer (None or threading.Timer): The timer object, initialized to None.
+            timer (None or object): The timer object, initialized to None.
         """
 
         self.logger = logging.getLogger(__name__)
@@ -40,6 +44,7 @@ class Chrono:
         self.match_duration = match_duration
         self.timestamp_start = None
         self.timer = None
+        self.clock = clock if clock is not None else SYSTEM_CLOCK
 
     def __str__(self) -> str:
         """
@@ -50,9 +55,7 @@ class Chrono:
             str: A string in the format "remaining_time / match_duration".
         """
 
-        current_time = int(datetime.now().timestamp())
-        chrono = self.match_duration - (current_time - self.timestamp_start)
-        return f"{chrono} / {self.match_duration}"
+        return f"{self.get_remaining_time():.1f} / {self.match_duration}"
 
     def start_match(self, match_end: callable) -> None:
         """
@@ -65,8 +68,7 @@ class Chrono:
         """
 
         self.start()
-        self.timer = threading.Timer(self.match_duration, match_end)
-        self.timer.start()
+        self.timer = self.clock.call_later(self.match_duration, match_end)
 
     def start(self) -> None:
         """
@@ -75,17 +77,27 @@ class Chrono:
         """
 
         self.logger.info("Starting match timer...")
-        self.timestamp_start = int(datetime.now().timestamp())
+        self.timestamp_start = self.clock.now()
 
-    def get_time_since_beginning(self) -> int:
+    def get_time_since_beginning(self) -> float:
         """
         Calculate the time elapsed since the start timestamp in seconds.
         Returns:
-            int: The time elapsed since the start timestamp in seconds.
+            float: The time elapsed since the start timestamp in seconds (millisecond resolution).
+        """
+
+        return self.clock.now() - self.timestamp_start
+
+    def get_remaining_time(self) -> float:
+        """
+        Calculate the remaining match time in seconds.
+        Returns:
+            float: The remaining time, or the full match duration if the match has not started yet.
         """
 
-        current_time = int(datetime.now().timestamp())
-        return current_time - self.timestamp_start
+        if self.timestamp_start is None:
+            return self.match_duration
+        return max(0, self.match_duration - self.get_time_since_beginning())
     
 # Example usage:
 # chrono = Chrono(match_duration=60)
@@ -1,8 +1,12 @@
 import logging
 logger = logging.getLogger(__name__)
 
+from typing import Optional
+
 from gpiozero import Button
 
+from ia.api.device_backend import DeviceBackend, HARDWARE_BACKEND
+
 class ColorSelector:
     """
     A class used to represent a Color Button.
@@ -17,15 +21,17 @@ class ColorSelector:
         Checks if the button is not pressed, indicating the detection of color 0.
     """
 
-    def __init__(self, pin: int) -> None:
+    def __init__(self, pin: int, backend: Optional[DeviceBackend] = None) -> None:
         """
         Initialize the ColorDetector with the specified pin.
         Args:
             pin (int): The pin number to which the ColorDetector is connected.
+            backend (DeviceBackend, optional): Provides the GPIO pin factory, the real hardware by default.
         """
 
         logger.info(f"Creating ColorSelector object with pin {pin}.")
-        self.button = Button(pin)
+        backend = backend if backend is not None else HARDWARE_BACKEND
+        self.button = Button(pin, pin_factory=backend.pin_factory)
     
     def is_color_0(self) -> bool:
         """
@@ -1,19 +1,36 @@
 import logging
 logger = logging.getLogger(__name__)
 
+import os
+import queue
+import re
 import socket
 import threading
+from typing import List, Optional
+
+# Trame : "{émetteur}/{session}.{numéro de séquence}|{message}\n", session absente des anciens émetteurs
+FRAME_PATTERN = re.compile(r"^(?P<who>[^/|]+)/(?:(?P<session>[0-9a-f]+)\.)?(?P<seq>\d+)\|(?P<message>.*)$", re.DOTALL)
 
 class CommunicationSocket:
     """
     A class to handle socket communication.
 
+    Messages are newline-delimited and prefixed with the sender id, a session id drawn at
+    startup and a sequence number, so that messages merged in one TCP segment are split again
+    and duplicates are dropped. A new session id means the sender restarted: its sequence
+    numbers start over.
+    Received messages are stored in a thread-safe queue, drained with pop_messages().
+
     Attributes:
     -----------
     host : str
         The hostname or IP address of the server to connect to.
     port : int
         The port number of the server to connect to.
+    who : str
+        Identifier of this sender, prefixed to every message.
+    session : str
+        Random id of this sender instance, prefixed to every message.
     last_message : str or None
         The last message received from the server.
     sock : socket.socket
@@ -23,22 +40,24 @@ class CommunicationSocket:
 
     Methods:
     --------
-    __init__(self, host, port):
+    __init__(self, host, port, who):
         Initializes the CommunicationSocket with the given host and port, 
         and starts the connection and read thread.
     receive_message(self):
-        Continuously receives messages from the server and updates the 
-        last_message attribute.
+        Continuously receives messages from the server and queues them.
+    pop_messages(self):
+        Returns and removes every message received since the last call.
     send_message(self, message):
         Sends a message to the server.
     """
 
-    def __init__(self, host: str, port: int) -> None:
+    def __init__(self, host: str, port: int, who: Optional[str] = None) -> None:
         """
         Initializes the CommunicationSocket instance.
         Args:
             host (str): The hostname or IP address of the server to connect to.
             port (int): The port number of the server to connect to.
+            who (str, optional): Identifier of this sender, the local socket address by default.
         Attributes:
             host (str): The hostname or IP address of the server.
             port (int): The port number of the server.
@@ -51,12 +70,23 @@ class CommunicationSocket:
 
         self.host = host
         self.port = port
+        self.who = who
         self.last_message = None
+        self.inbound: queue.Queue[str] = queue.Queue()
+        self.session = os.urandom(4).hex()
+        self.sequence = 0
+        # Session et dernier numéro de séquence reçus par émetteur
+        self.sessions: dict[str, Optional[str]] = {}
+        self.last_sequences: dict[str, int] = {}
+        self.duplicates = 0
+        self.send_lock = threading.Lock()
         self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         try:
             self.sock.connect((self.host, self.port))
             logger.info(f"Connected to {self.host} on port {self.port}")
-            self.send_message("robot")
+            if self.who is None:
+                self.who = "%s:%d" % self.sock.getsockname()[:2]
+            self.sock.sendall(b"robot\n")
         except socket.error as e:
             logger.error(f"Failed to connect to {self.host} on port {self.port}: {e}")
         self.read_thread = threading.Thread(target=self.receive_message)
@@ -66,22 +96,73 @@ class CommunicationSocket:
     def receive_message(self) -> None:
         """
         Continuously receives messages from the socket.
-        This method runs an infinite loop that attempts to receive messages from the socket.
-        If a message is successfully received, it is decoded from UTF-8 and logged.
-        If the message has a length greater than 0, it is stored as the last received message.
-        If a socket error occurs during message reception, an error is logged.
+        This method runs a loop that reads the socket, splits the data on newlines and
+        queues every complete message, after removing duplicates by sequence number.
+        The loop ends when the server closes the connection.
         Raises:
             socket.error: If there is an error receiving the message from the socket.
         """
 
+        buffer = b""
         while True:
             try:
-                message = self.sock.recv(1024).decode('utf-8')
-                logger.info(f"Received message: {message}")
-                if len(message) > 0:
-                    self.last_message = message
+                data = self.sock.recv(4096)
             except socket.error as e:
                 logger.error(f"Failed to receive message: {e}")
+                return
+            if not data:
+                logger.error(f"Connection to {self.host} on port {self.port} closed")
+                return
+            buffer += data
+            *frames, buffer = buffer.split(b"\n")
+            for frame in frames:
+                if frame:
+                    self.handle_frame(frame.decode('utf-8', errors='replace'))
+
+    def handle_frame(self, frame: str) -> None:
+        """
+        Queues a received frame unless it was already received.
+        Args:
+            frame (str): The frame, without its trailing newline.
+        """
+
+        match = FRAME_PATTERN.match(frame)
+        if match is None:
+            # Émetteur sans numéro de séquence
+            message = frame
+        else:
+            who, session, message = match.group("who"), match.group("session"), match.group("message")
+            sequence = int(match.group("seq"))
+            if who in self.sessions and self.sessions[who] != session:
+                logger.info(f"{who} restarted, sequence numbers reset")
+                del self.last_sequences[who]
+            self.sessions[who] = session
+            last = self.last_sequences.get(who)
+            # Sans session (ancien émetteur), un numéro 1 correspond au redémarrage de l'émetteur
+            if last is not None and sequence <= last and (session is not None or sequence != 1):
+                self.duplicates += 1
+                logger.info(f"Duplicated message {who}/{sequence} ignored: {message}")
+                return
+            if last is not None and sequence > last + 1:
+                logger.warning(f"{sequence - last - 1} message(s) lost from {who}")
+            self.last_sequences[who] = sequence
+        logger.info(f"Received message: {message}")
+        self.last_message = message
+        self.inbound.put(message)
+
+    def pop_messages(self) -> List[str]:
+        """
+        Returns every message received since the last call, in reception order.
+        Returns:
+            list[str]: The received messages.
+        """
+
+        messages = []
+        while True:
+            try:
+                messages.append(self.inbound.get_nowait())
+            except queue.Empty:
+                return messages
 
     def send_message(self, message: str) -> None:
         """
@@ -96,7 +177,9 @@ class CommunicationSocket:
         """
 
         try:
-            self.sock.send(f"{message}".encode())
+            with self.send_lock:
+                self.sequence += 1
+                self.sock.sendall(f"{self.who}/{self.session}.{self.sequence}|{message}\n".encode())
             logger.info(f"Sent message: {message}")
         except socket.error as e:
-            logger.error(f"Failed to send message: {e}")
\ No newline at end of file
+            logger.error(f"Failed to send message: {e}")
@@ -1,9 +1,13 @@
 import logging
+import time
 
+from ia.api.device_backend import DeviceBackend, HARDWARE_BACKEND
 from ia.api.detection.lidar.lidar_coordinate import LidarCoordinate
 from ia.api.detection.lidar.lidar_mode import LidarMode
+from ia.api.telemetry import TelemetrySender
 from ia.asservissement import asserv
 from ia.asservissement.asserv import Asserv
+from ia.utils.metrics import METRICS, MetricsRegistry
 from ia.utils.position import Position
 
 logger = logging.getLogger(__name__)
@@ -11,7 +15,7 @@ logger = logging.getLogger(__name__)
 import serial
 import math
 import threading
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 class LidarRpA2:
     """
@@ -32,6 +36,9 @@ class LidarRpA2:
         parse_lidar_measures() -> None:
             Continuously reads and parses Lidar measurements.
 
+        parse_measures(serial_buffer: str, robot_position: Position) -> List[Position]:
+            Parses one Lidar line into table coordinates.
+
         start_scan() -> None:
             Starts the Lidar scan.
 
@@ -80,7 +87,9 @@ class LidarRpA2:
         get_detected_points() -> List[Tuple[int, int]]:
             Returns the list of points detected by the Lidar.
     """
-    def __init__(self, serial_port: str, baud_rate: int, quality: int, distance: int, period: int, asserv: Asserv) -> None:
+    def __init__(self, serial_port: str, baud_rate: int, quality: int, distance: int, period: int, asserv: Asserv,
+                 telemetry: Optional[TelemetrySender] = None, backend: Optional[DeviceBackend] = None,
+                 metrics: Optional[MetricsRegistry] = None) -> None:
         """
         Initializes the Lidar object with connection and configuration parameters.
 
@@ -91,17 +100,23 @@ class LidarRpA2:
             distance (int): The distance parameter for the Lidar.
             period (int): The period parameter for the Lidar.
             asserv (asserv): An instance of the Asserv class to get the current position.
+            telemetry (TelemetrySender, optional): Binary telemetry stream receiving every lidar frame.
+            backend (DeviceBackend, optional): Opens the serial port, the real hardware by default.
+            metrics (MetricsRegistry, optional): Receives the frame count, parse time and points per frame.
         """
 
         logger.info(f"Init Lidar on port {serial_port} with baud rate {baud_rate}")
-        self.lidar_serial = serial.Serial(
-            port=serial_port, 
-            baudrate=baud_rate,
+        backend = backend if backend is not None else HARDWARE_BACKEND
+        self.lidar_serial = backend.open_serial(
+            serial_port,
+            baud_rate,
             parity=serial.PARITY_NONE,
             stopbits=serial.STOPBITS_ONE
         )
         self.detected_points = []
         self.asserv = asserv
+        self.telemetry = telemetry
+        self.metrics = metrics if metrics is not None else METRICS
         self.read_thread = threading.Thread(target=self.parse_lidar_measures)
         self.read_thread.daemon = True
         self.read_thread.start()
@@ -131,9 +146,8 @@ class LidarRpA2:
 
         This method runs an infinite loop that reads data from the Lidar's serial port.
         It decodes the data from ASCII, strips any leading/trailing whitespace, and
-        splits the data into individual points. Each point is then parsed into x and y
-        coordinates, which are transformed relative to the current position and orientation
-        of the robot. The transformed coordinates are stored in the `detected_points` list.
+        parses the line with `parse_measures`, relative to the current position and orientation
+        of the robot. The transformed coordinates replace the `detected_points` list.
 
         Note:
             This method will block indefinitely. Ensure that it is run in a separate
@@ -142,43 +156,67 @@ class LidarRpA2:
 
         while True:
             serial_buffer = self.lidar_serial.readline().decode('ascii').strip()
-            self.detected_points.clear()
-            logger.debug(f"Lidar buffer: {serial_buffer}")
-            if len(serial_buffer) == 0:
-                continue
-            points = serial_buffer.split('#')
-            for point in points:
-                coordinates = point.split(';')
-                if len(coordinates) == 2:
-                    try:
-                        angle = float(coordinates[0])
-                        distance = float(coordinates[1])
-
-                        # Position relative au robot
-                        x_obstacle_relative_to_robot = distance * math.cos(angle)
-                        y_obstacle_relative_to_robot = distance * math.sin(angle)
-
-                        robot_position = self.asserv.position
-
-                        # Changement de repère (robot -> table)
-                        x_obstacle_relative_to_table = int(
-                            robot_position.x +
-                            x_obstacle_relative_to_robot * math.cos(robot_position.theta) -
-                            y_obstacle_relative_to_robot * math.sin(robot_position.theta)
-                        )
-                        y_obstacle_relative_to_table = int(
-                            robot_position.y +
-                            x_obstacle_relative_to_robot * math.sin(robot_position.theta) +
-                            y_obstacle_relative_to_robot * math.cos(robot_position.theta)
-                        )
-
-                        detected_point = Position(round(x_obstacle_relative_to_table), round(y_obstacle_relative_to_table))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Lidar buffer: {serial_buffer}")
+            start = time.perf_counter()
+            self.detected_points = self.parse_measures(serial_buffer, self.asserv.position)
+            self.metrics.histogram("lidar.parse").record(time.perf_counter() - start)
+            self.metrics.counter("lidar.frames").inc()
+            self.metrics.gauge("lidar.points").set(len(self.detected_points))
+            if self.telemetry is not None and serial_buffer:
+                self.telemetry.lidar_frame([(p.x, p.y) for p in self.detected_points])
+
+    @staticmethod
+    def parse_measures(serial_buffer: str, robot_position: Position) -> List[Position]:
+        """
+        Parses one Lidar line ("angle;distance#angle;distance...", polar coordinates in radians and mm).
+
+        Args:
+            serial_buffer (str): The stripped line read from the Lidar.
+            robot_position (Position): The robot position when the line was read.
+
+        Returns:
+            List[Position]: The detected points, in table coordinates.
+        """
+
+        detected_points = []
+        if len(serial_buffer) == 0:
+            return detected_points
+        debug = logger.isEnabledFor(logging.DEBUG)
+        cos_theta = math.cos(robot_position.theta)
+        sin_theta = math.sin(robot_position.theta)
+        for point in serial_buffer.split('#'):
+            coordinates = point.split(';')
+            if len(coordinates) == 2:
+                try:
+                    angle = float(coordinates[0])
+                    distance = float(coordinates[1])
+
+                    # Position relative au robot
+                    x_obstacle_relative_to_robot = distance * math.cos(angle)
+                    y_obstacle_relative_to_robot = distance * math.sin(angle)
+
+                    # Changement de repère (robot -> table)
+                    x_obstacle_relative_to_table = int(
+                        robot_position.x +
+                        x_obstacle_relative_to_robot * cos_theta -
+                        y_obstacle_relative_to_robot * sin_theta
+                    )
+                    y_obstacle_relative_to_table = int(
+                        robot_position.y +
+                        x_obstacle_relative_to_robot * sin_theta +
+                        y_obstacle_relative_to_robot * cos_theta
+                    )
+
+                    detected_point = Position(x_obstacle_relative_to_table, y_obstacle_relative_to_table)
+                    if debug:
                         logger.debug(f"Lidar detection: {detected_point}")
-                        self.detected_points.append(detected_point)
-                    except ValueError:
-                        logger.error(f"Parsing error: {point}")
-                else:
+                    detected_points.append(detected_point)
+                except ValueError:
                     logger.error(f"Parsing error: {point}")
+            else:
+                logger.error(f"Parsing error: {point}")
+        return detected_points
 
     def start_scan(self) -> None:
         """
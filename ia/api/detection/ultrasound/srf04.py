@@ -1,8 +1,10 @@
 import logging
+from typing import Optional
 
 from gpiozero import DistanceSensor
 
 from ia.api.detection.ultrasound.srf import Srf
+from ia.api.device_backend import DeviceBackend, HARDWARE_BACKEND
 
 logger = logging.getLogger(__name__)
 
@@ -36,7 +38,8 @@ class Srf04(Srf):
     """
 
 
-    def __init__(self, desc: str, trigger: int, echo: int, x: int, y: int, angle: int, threshold: int, window_size: int) -> None:
+    def __init__(self, desc: str, trigger: int, echo: int, x: int, y: int, angle: int, threshold: int, window_size: int,
+                 backend: Optional[DeviceBackend] = None) -> None:
         """
         Initializes the Srf04 sensor with the given parameters.
         Args:
@@ -46,14 +49,17 @@ class Srf04(Srf):
             y (int): Y-coordinate of the sensor's position.
             angle (int): Angle at which the sensor is mounted.
             threshold (int): Distance threshold for detection.
+            backend (DeviceBackend, optional): Provides the GPIO pin factory, the real hardware by default.
         """
 
         super().__init__(desc, x, y, angle, threshold, window_size)
         logger.info(f"Creating Srf04 object with trigger {trigger}, echo {echo}, x {x}, y {y}, angle {angle}, threshold {threshold}.")
+        backend = backend if backend is not None else HARDWARE_BACKEND
         self.sensor = DistanceSensor(
             echo=echo,
             trigger=trigger,
-            queue_len= self.window_size
+            queue_len= self.window_size,
+            pin_factory=backend.pin_factory
         )
 
     def get_distance(self) -> int:
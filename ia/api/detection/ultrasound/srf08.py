@@ -2,10 +2,10 @@ import logging
 import threading
 import time
 from collections import deque
-
-from smbus2 import SMBus
+from typing import Optional
 
 from ia.api.detection.ultrasound.srf import Srf
+from ia.api.device_backend import DeviceBackend, HARDWARE_BACKEND
 
 logger = logging.getLogger(__name__)
 
@@ -20,8 +20,11 @@ class Srf08(Srf):
     READ_TIMEOUT_S = 0.07
     POLL_INTERVAL_S = 0.001
 
-    def __init__(self, desc: str, address: int, x: int, y: int, angle: int, threshold: int, window_size: int) -> None:
+    def __init__(self, desc: str, address: int, x: int, y: int, angle: int, threshold: int, window_size: int,
+                 backend: Optional[DeviceBackend] = None) -> None:
         super().__init__(desc, x, y, angle, threshold, window_size)
+        # Ouvre le bus I2C (smbus2 sur le robot, émulateur hors du robot)
+        self.backend = backend if backend is not None else HARDWARE_BACKEND
         # La datasheet SRF08 donne des adresses 8 bits (bit R/W inclus, ex: 0xE0).
         # smbus2 / Linux attendent une adresse 7 bits : on divise par 2.
         # 226 / 2 = 113 = 0x71 par exemple
@@ -46,7 +49,7 @@ class Srf08(Srf):
         Configure le SRF08 en I2C avec gain maximum et portée ~602 mm.
         """
         try:
-            with SMBus(self.I2C_BUS) as bus:
+            with self.backend.open_i2c(self.I2C_BUS) as bus:
                 bus.write_byte_data(self.address, self.GAIN_REGISTER, 13, force=self._i2c_force)
                 bus.write_byte_data(self.address, self.RANGE_REGISTER, 13, force=self._i2c_force)
 
@@ -67,7 +70,7 @@ class Srf08(Srf):
         Returns:
             int: Numéro de version du firmware (ex: 2 pour SRF08, 6 pour SRF10).
         """
-        with SMBus(self.I2C_BUS) as bus:
+        with self.backend.open_i2c(self.I2C_BUS) as bus:
             version = bus.read_byte_data(self.address, self.COMMAND_REGISTER, force=self._i2c_force)
         logger.info("SRF08 0x%02X - version firmware : %d", self.address, version)
         return version
@@ -86,7 +89,7 @@ class Srf08(Srf):
         Lance une mesure SRF08 et renvoie la distance du 1er echo en mm.
         Utilise la mesure temporelle pour une conversion plus precise.
         """
-        with SMBus(self.I2C_BUS) as bus:
+        with self.backend.open_i2c(self.I2C_BUS) as bus:
             bus.write_byte_data(self.address, self.COMMAND_REGISTER, self.RANGING_US_COMMAND, force=self._i2c_force)
             time.sleep(self.READ_TIMEOUT_S)  # Délai initial pour que le capteur commence la mesure
 
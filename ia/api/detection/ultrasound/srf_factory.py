@@ -1,11 +1,14 @@
+from typing import Optional
+
 from ia.api.detection.ultrasound.srf import Srf
 from ia.api.detection.ultrasound.srf04 import Srf04
 from ia.api.detection.ultrasound.srf08 import Srf08
+from ia.api.device_backend import DeviceBackend
 
 
 class SrfFactory:
     @staticmethod
-    def build_srf(srf_config: dict, window_size: int) -> Srf:
+    def build_srf(srf_config: dict, window_size: int, backend: Optional[DeviceBackend] = None) -> Srf:
         """
         Build a Srf object from a config dict
         """
@@ -18,7 +21,8 @@ class SrfFactory:
                 y=srf_config['y'],
                 angle=srf_config['angle'],
                 threshold=srf_config['threshold'],
-                window_size=window_size
+                window_size=window_size,
+                backend=backend
             )
         elif srf_config['type'] == 'srf08':
             return Srf08(
@@ -28,6 +32,7 @@ class SrfFactory:
                 y=srf_config['y'],
                 angle=srf_config['angle'],
                 threshold=srf_config['threshold'],
-                window_size=window_size
+                window_size=window_size,
+                backend=backend
             )
         raise ValueError(f"Unhandled SRF type : {srf_config['type']}")
\ No newline at end of file
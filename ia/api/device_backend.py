@@ -0,0 +1,26 @@
+import serial
+
+
+class DeviceBackend:
+    """
+    Accès au matériel des drivers : ports série, bus I2C et broches GPIO.
+
+    L'implémentation de base ouvre le vrai matériel du robot. Un driver reçoit son backend par
+    son constructeur (HARDWARE_BACKEND par défaut) : ia.simulation.emulators.EmulatedBackend y
+    branche des émulateurs en mémoire, pour faire tourner et profiler les drivers hors du robot.
+    """
+
+    # Factory de broches gpiozero passée aux périphériques GPIO (None : celle par défaut de gpiozero)
+    pin_factory = None
+
+    def open_serial(self, port: str, baud_rate: int, **settings) -> serial.Serial:
+        """Ouvre un port série, settings étant les paramètres de serial.Serial (parity, stopbits, timeout...)."""
+        return serial.Serial(port=port, baudrate=baud_rate, **settings)
+
+    def open_i2c(self, bus: int):
+        """Ouvre un bus I2C (interface smbus2.SMBus, utilisable avec with)."""
+        from smbus2 import SMBus
+        return SMBus(bus)
+
+
+HARDWARE_BACKEND = DeviceBackend()
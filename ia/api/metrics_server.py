@@ -0,0 +1,79 @@
+import json
+import logging
+import os
+import socketserver
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+from ia.utils.metrics import MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORT = 9100
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class MetricsServer:
+    """
+    Point d'accès HTTP local aux métriques pendant le match, en TCP (host, port) ou sur une socket
+    Unix (path) :
+        - GET /metrics : instantané JSON du registre (histogrammes, compteurs, jauges)
+        - GET /summary : résumé texte, une ligne par métrique
+    Servi par un thread daemon, sans effet sur la boucle principale hors de la lecture des métriques.
+    """
+
+    def __init__(self, registry: MetricsRegistry, host: str = "127.0.0.1", port: int = DEFAULT_PORT,
+                 path: Optional[str] = None) -> None:
+        self.registry = registry
+        handler = self._handler()
+        if path is not None:
+            if os.path.exists(path):
+                os.unlink(path)
+            self.server = _UnixHTTPServer(path, handler)
+            self.address = path
+        else:
+            self.server = ThreadingHTTPServer((host, port), handler)
+            self.server.daemon_threads = True
+            self.address = f"http://{host}:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @classmethod
+    def from_config(cls, registry: MetricsRegistry, metrics_config: dict) -> 'MetricsServer':
+        return cls(registry, host=metrics_config.get("host", "127.0.0.1"),
+                   port=metrics_config.get("port", DEFAULT_PORT), path=metrics_config.get("path"))
+
+    def _handler(self):
+        registry = self.registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.rstrip("/") in ("", "/metrics"):
+                    body, content_type = json.dumps(registry.snapshot()).encode(), "application/json"
+                elif self.path.rstrip("/") == "/summary":
+                    body, content_type = "\n".join(registry.summary()).encode(), "text/plain; charset=utf-8"
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args) -> None:
+                # Pas de log par requête (client_address vide sur une socket Unix)
+                pass
+
+        return Handler
+
+    def start(self) -> None:
+        logger.info(f"Metrics endpoint on {self.address}")
+        self.thread.start()
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
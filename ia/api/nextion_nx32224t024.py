@@ -4,6 +4,9 @@ logger = logging.getLogger(__name__)
 import serial
 from time import sleep
 import threading
+from typing import Optional
+
+from ia.api.device_backend import DeviceBackend, HARDWARE_BACKEND
 
 class NextionNX32224T024:
     """
@@ -39,13 +42,14 @@ class NextionNX32224T024:
     A_END_OF_CMD = [0xff, 0xff, 0xff]
     S_END_OF_CMD = bytearray(A_END_OF_CMD)
 
-    def __init__(self, serial_port: str, baud_rate: int, color0: str) -> None:
+    def __init__(self, serial_port: str, baud_rate: int, color0: str, backend: Optional[DeviceBackend] = None) -> None:
         """
         Initializes the NextionNX32224T024 object.
         Args:
             serial_port (str): The serial port to which the Nextion display is connected.
             baud_rate (int): The baud rate for the serial communication.
             color0 (str): The name for color0.
+            backend (DeviceBackend, optional): Opens the serial port, the real hardware by default.
         Attributes:end
             status (str): The status of the display.
             color (str): The current color setting of the display.
@@ -60,9 +64,10 @@ class NextionNX32224T024:
         self.color = ""
         self.calibration_started = False
         self.color0 = color0
-        self.serial = serial.Serial(
-            port=serial_port,
-            baudrate=baud_rate,
+        backend = backend if backend is not None else HARDWARE_BACKEND
+        self.serial = backend.open_serial(
+            serial_port,
+            baud_rate,
             parity=serial.PARITY_NONE,
             stopbits=serial.STOPBITS_ONE,
             timeout=0.1
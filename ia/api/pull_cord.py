@@ -1,8 +1,12 @@
 import logging
 logger = logging.getLogger(__name__)
 
-from gpiozero import Button
 from time import sleep
+from typing import Optional
+
+from gpiozero import Button
+
+from ia.api.device_backend import DeviceBackend, HARDWARE_BACKEND
 
 class PullCord:
     """
@@ -22,15 +26,17 @@ class PullCord:
     """
 
 
-    def __init__(self, pin: int) -> None:
+    def __init__(self, pin: int, backend: Optional[DeviceBackend] = None) -> None:
         """
         Initializes the PullCord with the specified pin.
         Args:
             pin (int): The GPIO pin number to which the pull cord button is connected.
+            backend (DeviceBackend, optional): Provides the GPIO pin factory, the real hardware by default.
         """
 
         logger.info(f"Creating PullCord object with pin {pin}.")
-        self.button = Button(pin)
+        backend = backend if backend is not None else HARDWARE_BACKEND
+        self.button = Button(pin, pin_factory=backend.pin_factory)
 
     def get_state(self) -> bool:
         """
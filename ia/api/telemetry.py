@@ -0,0 +1,166 @@
+import logging
+import socket
+import struct
+import threading
+import time
+from enum import IntEnum
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Datagramme : en-tête de lot puis N enregistrements [type, horodatage ms] + charge utile à taille fixe
+MAGIC = b"TM"
+VERSION = 1
+BATCH_HEADER = struct.Struct("<2sB8sH")      # magic, version, robot (ascii), nombre d'enregistrements
+RECORD_HEADER = struct.Struct("<BI")         # type, ms depuis le démarrage de l'émetteur
+POSE = struct.Struct("<hhfBBhh")             # x, y, theta, status, pending, motor_left, motor_right
+DETECTION = struct.Struct("<Bhh")            # source, x, y
+LIDAR_FRAME = struct.Struct("<H")            # nombre de points, suivi de n x LIDAR_POINT
+LIDAR_POINT = struct.Struct("<hh")           # x, y
+STEP = struct.Struct("<HHBBH")               # id objectif, index step, type, sous-type, score
+
+# Datagramme envoyé au serveur par un client qui veut recevoir la télémétrie (à renouveler)
+SUBSCRIBE = b"TMSUB"
+DEFAULT_PORT = 1665
+MAX_DATAGRAM = 1400
+
+
+class RecordType(IntEnum):
+    POSE = 1
+    DETECTION = 2
+    LIDAR_FRAME = 3
+    STEP = 4
+
+
+class DetectionSource(IntEnum):
+    ULTRASOUND = 0
+    LIDAR = 1
+
+
+class TelemetrySender:
+    """
+    Émetteur de télémétrie binaire (UDP) : poses, trames lidar, détections et transitions de step.
+
+    Les enregistrements sont accumulés et envoyés par lots, au plus tard toutes les flush_interval
+    secondes ou dès qu'un datagramme est plein. L'envoi ne bloque jamais l'appelant : en cas
+    d'erreur réseau, le lot est perdu.
+    """
+
+    def __init__(self, host: str, port: int = DEFAULT_PORT, who: str = "", flush_interval: float = 0.02) -> None:
+        self.address = (host, port)
+        self.who = who.encode("ascii", errors="replace")[:8]
+        self.flush_interval = flush_interval
+        self.sent_batches = 0
+        self.dropped_batches = 0
+
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.setblocking(False)
+        self._lock = threading.Lock()
+        self._records: List[bytes] = []
+        self._size = BATCH_HEADER.size
+        self._t0 = time.monotonic()
+
+        self._thread = threading.Thread(target=self._flush_loop, daemon=True)
+        self._thread.start()
+        logger.info(f"Creating TelemetrySender to {host}:{port}")
+
+    def _timestamp(self) -> int:
+        return int((time.monotonic() - self._t0) * 1000) & 0xFFFFFFFF
+
+    def _append(self, record_type: RecordType, payload: bytes) -> None:
+        record = RECORD_HEADER.pack(record_type, self._timestamp()) + payload
+        with self._lock:
+            if self._size + len(record) > MAX_DATAGRAM:
+                self._flush_locked()
+            self._records.append(record)
+            self._size += len(record)
+
+    def pose(self, x: int, y: int, theta: float, status: int = 0, pending: int = 0,
+             motor_left: int = 0, motor_right: int = 0) -> None:
+        self._append(RecordType.POSE, POSE.pack(
+            _i16(x), _i16(y), theta, status & 0xFF, min(pending, 0xFF), _i16(motor_left), _i16(motor_right)
+        ))
+
+    def detection(self, source: DetectionSource, x: int, y: int) -> None:
+        self._append(RecordType.DETECTION, DETECTION.pack(source, _i16(x), _i16(y)))
+
+    def lidar_frame(self, points: List[Tuple[int, int]]) -> None:
+        """Trame lidar complète, découpée en plusieurs enregistrements si elle dépasse un datagramme."""
+        per_record = (MAX_DATAGRAM - BATCH_HEADER.size - RECORD_HEADER.size - LIDAR_FRAME.size) // LIDAR_POINT.size
+        for start in range(0, max(len(points), 1), per_record):
+            chunk = points[start:start + per_record]
+            payload = LIDAR_FRAME.pack(len(chunk)) + b"".join(LIDAR_POINT.pack(_i16(x), _i16(y)) for x, y in chunk)
+            self._append(RecordType.LIDAR_FRAME, payload)
+
+    def step(self, objective_id: int, step_index: int, step_type: int, sub_type: int, score: int) -> None:
+        self._append(RecordType.STEP, STEP.pack(
+            (objective_id or 0) & 0xFFFF, max(step_index, 0) & 0xFFFF, step_type, sub_type, (score or 0) & 0xFFFF
+        ))
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if not self._records:
+            return
+        datagram = BATCH_HEADER.pack(MAGIC, VERSION, self.who, len(self._records)) + b"".join(self._records)
+        self._records = []
+        self._size = BATCH_HEADER.size
+        try:
+            self._socket.sendto(datagram, self.address)
+            self.sent_batches += 1
+        except OSError:
+            self.dropped_batches += 1
+
+    def _flush_loop(self) -> None:
+        while True:
+            time.sleep(self.flush_interval)
+            self.flush()
+
+
+def _i16(value) -> int:
+    return max(-32768, min(32767, int(value)))
+
+
+def decode_batch(data: bytes) -> Optional[Tuple[str, List[tuple]]]:
+    """
+    Décode un datagramme de télémétrie.
+
+    Returns
+    -------
+    (robot, [(type, horodatage ms, valeurs)]) ou None si le datagramme n'est pas reconnu.
+    Les valeurs sont le tuple de la structure du type, sauf pour LIDAR_FRAME : liste des points (x, y).
+    """
+    if len(data) < BATCH_HEADER.size:
+        return None
+    magic, version, who, count = BATCH_HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        return None
+    records = []
+    offset = BATCH_HEADER.size
+    try:
+        for _ in range(count):
+            record_type, timestamp = RECORD_HEADER.unpack_from(data, offset)
+            offset += RECORD_HEADER.size
+            if record_type == RecordType.POSE:
+                values = POSE.unpack_from(data, offset)
+                offset += POSE.size
+            elif record_type == RecordType.DETECTION:
+                values = DETECTION.unpack_from(data, offset)
+                offset += DETECTION.size
+            elif record_type == RecordType.LIDAR_FRAME:
+                (nb_points,) = LIDAR_FRAME.unpack_from(data, offset)
+                offset += LIDAR_FRAME.size
+                end = offset + nb_points * LIDAR_POINT.size
+                values = list(LIDAR_POINT.iter_unpack(data[offset:end]))
+                offset = end
+            elif record_type == RecordType.STEP:
+                values = STEP.unpack_from(data, offset)
+                offset += STEP.size
+            else:
+                break
+            records.append((record_type, timestamp, values))
+    except struct.error:
+        pass
+    return who.rstrip(b"\0").decode("ascii", errors="replace"), records
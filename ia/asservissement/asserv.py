@@ -1,12 +1,17 @@
 import logging
+from typing import Optional
 
 import cbor2
 import crc
 
+from ia.api.device_backend import DeviceBackend, HARDWARE_BACKEND
+from ia.api.telemetry import TelemetrySender
 from ia.asservissement.asser_message import AsservMessage
 from ia.asservissement.asserv_response_listener import AsservResponseListener
 from ia.asservissement.asserv_status import AsservStatus
 from ia.asservissement.movement_direction import MovementDirection
+from ia.utils.clock import Clock, SYSTEM_CLOCK
+from ia.utils.metrics import METRICS, MetricsRegistry
 from ia.utils.position import Position
 
 logger = logging.getLogger(__name__)
@@ -56,13 +61,19 @@ class Asserv:
         go_start(is_color0): Executes the go start sequence based on the color configuration.
     """
 
-    def __init__(self, serial_port: str, baud_rate: int, gostart_config: dict) -> None:
+    def __init__(self, serial_port: str, baud_rate: int, gostart_config: dict,
+                 telemetry: Optional[TelemetrySender] = None, clock: Optional[Clock] = None,
+                 backend: Optional[DeviceBackend] = None, metrics: Optional[MetricsRegistry] = None) -> None:
         """
         Initializes the Asserv object with the given serial port, baud rate, and gostart configuration.
         Args:
             serial_port (str): The serial port to be used for communication.
             baud_rate (int): The baud rate for the serial communication.
             gostart_config (dict): Configuration settings for the gostart.
+            telemetry (TelemetrySender, optional): Binary telemetry stream receiving every position frame.
+            clock (Clock, optional): Clock service used by the waits, real time by default.
+            backend (DeviceBackend, optional): Opens the serial port, the real hardware by default.
+            metrics (MetricsRegistry, optional): Receives the frame rate and the parse backlog.
         Attributes:
             serial_port (str): The serial port to be used for communication.
             baud_rate (int): The baud rate for the serial communication.
@@ -80,13 +91,31 @@ class Asserv:
         self.serial_port = serial_port
         self.baud_rate = baud_rate
         logger.info(f"Creating Asserv object with serial port {serial_port} and baud rate {baud_rate}.")
-        self.serial = serial.Serial(
-            port=serial_port,
-            baudrate=baud_rate,
+        backend = backend if backend is not None else HARDWARE_BACKEND
+        self.serial = backend.open_serial(
+            serial_port,
+            baud_rate,
             parity=serial.PARITY_NONE,
             stopbits=serial.STOPBITS_ONE,
             timeout=0.01
         )
+        self._init_state(gostart_config, telemetry, clock, metrics)
+        self.serial.read()
+        logger.info('Start asser reading thread')
+        self.read_thread = threading.Thread(target=self.parse_asserv_position)
+        self.read_thread.daemon = True
+        self.read_thread.start()
+        logger.info('Start asserv update_position thread')
+        self.update_position_thread = threading.Thread(target=self._update_position_loop)
+        self.update_position_thread.daemon = True
+        self.update_position_thread.start()
+
+    def _init_state(self, gostart_config: dict, telemetry: Optional[TelemetrySender],
+                    clock: Optional[Clock] = None, metrics: Optional[MetricsRegistry] = None) -> None:
+        """
+        Initializes the robot state, independently of the serial link (shared with the simulated asserv).
+        """
+
         self.position = Position(0, 0)
         self.last_log = ''
         self.direction = None
@@ -98,23 +127,29 @@ class Asserv:
         self.motor_left_speed = 0
         self.motor_right_speed = 0
         self.gostart_config = gostart_config
+        self.telemetry = telemetry
+        self.clock = clock if clock is not None else SYSTEM_CLOCK
+        self.metrics = metrics if metrics is not None else METRICS
+        self._frames = self.metrics.counter("asserv.frames")
+        self._frame_interval = self.metrics.histogram("asserv.frame_interval")
+        self._backlog = self.metrics.gauge("asserv.backlog")
+        self._last_frame: Optional[float] = None
         self.reading_buffer = []
         self.lock = threading.Lock()
+        # Sérialise les écritures : l'arrêt d'urgence peut partir d'un autre thread que les commandes
+        self.write_lock = threading.Lock()
+        # Trame d'arrêt d'urgence encodée une fois pour toutes (pas de CBOR ni de CRC au moment de freiner)
+        self.emergency_stop_frame = self.formatMsg({"cmd": AsservMessage.emergency_stop.value})
         self.response_listener = AsservResponseListener()
-        self.serial.read()
-        logger.info('Start asser reading thread')
-        self.read_thread = threading.Thread(target=self.parse_asserv_position)
-        self.read_thread.daemon = True
-        self.read_thread.start()
-        logger.info('Start asserv update_position thread')
-        self.update_position_thread = threading.Thread(target=self._update_position_loop)
-        self.update_position_thread.daemon = True
-        self.update_position_thread.start()
 
     def get_next_command_id(self) -> int:
         self.last_sent_command_id += 1
         return self.last_sent_command_id
 
+    def _write(self, frame: bytes) -> None:
+        with self.write_lock:
+            self.serial.write(frame)
+
     def formatMsg(self, msg):
         """
         Format cbor message to send order
@@ -136,15 +171,25 @@ class Asserv:
         This method performs the following actions:
         - Logs an "emergencyStop" message.
         - Sets the robot's status to `STATUS_HALTED`.
-        - Sends a halt command ("h") to the robot's serial interface.
+        - Sends the pre-encoded emergency stop frame to the robot's serial interface.
         - Sets the movement direction to `NONE`.
         This method is typically used in emergency situations where the robot needs to stop all operations immediately.
+        It is safe to call from another thread than the one sending the movement commands (SafetyMonitor).
         """
 
-        logger.info("emergencyStop")
+        self._write(self.emergency_stop_frame)
         self.asserv_status = AsservStatus.STATUS_HALTED
-        self.serial.write(self.formatMsg({"cmd": AsservMessage.emergency_stop.value}))
         self.direction = MovementDirection.NONE
+        logger.info("emergencyStop")
+
+    def stop(self) -> None:
+        """
+        Stops the robot for good (end of match, definitive halt).
+        The emergency stop is sent again and the asserv is not reset afterwards.
+        """
+
+        logger.info("stop")
+        self.emergency_stop()
 
     def emergency_reset(self) -> None:
         """
@@ -155,7 +200,7 @@ class Asserv:
 
         logger.info("emergencyReset")
         self.asserv_status = AsservStatus.STATUS_IDLE
-        self.serial.write(self.formatMsg({"cmd": AsservMessage.emergency_stop_reset.value}))
+        self._write(self.formatMsg({"cmd": AsservMessage.emergency_stop_reset.value}))
 
     def go(self, dist: int) -> None:
         """
@@ -178,7 +223,7 @@ class Asserv:
         with self.lock:
             self.status_countdown = 2
         self.direction = MovementDirection.FORWARD if dist > 0 else MovementDirection.BACKWARD
-        self.serial.write(self.formatMsg({
+        self._write(self.formatMsg({
             "cmd": AsservMessage.straight.value,
             "D" : float(dist),
             "ID": self.get_next_command_id()
@@ -204,7 +249,7 @@ class Asserv:
         with self.lock:
             self.status_countdown = 2
         self.direction = MovementDirection.NONE
-        self.serial.write(self.formatMsg({
+        self._write(self.formatMsg({
             "cmd": AsservMessage.turn.value,
             "A": float(degree),
             "ID": self.get_next_command_id()
@@ -229,7 +274,7 @@ class Asserv:
         with self.lock:
             self.status_countdown = 2
         self.direction = MovementDirection.FORWARD
-        self.serial.write(self.formatMsg({
+        self._write(self.formatMsg({
             "cmd": AsservMessage.goto_front.value,
             "X" : float(position.x),
             "Y" : float(position.y),
@@ -255,7 +300,7 @@ class Asserv:
         with self.lock:
             self.status_countdown = 2
         self.direction = MovementDirection.FORWARD
-        self.serial.write(self.formatMsg({
+        self._write(self.formatMsg({
             "cmd": AsservMessage.goto_nostop.value,
             "X": float(position.x),
             "Y": float(position.y),
@@ -282,7 +327,7 @@ class Asserv:
         with self.lock:
             self.status_countdown = 2
         self.direction = MovementDirection.BACKWARD
-        self.serial.write(self.formatMsg({
+        self._write(self.formatMsg({
             "cmd": AsservMessage.goto_back.value,
             "X": float(position.x),
             "Y": float(position.y),
@@ -305,7 +350,7 @@ class Asserv:
         with self.lock:
             self.status_countdown = 2
         self.direction = MovementDirection.NONE
-        self.serial.write(self.formatMsg({
+        self._write(self.formatMsg({
             "cmd": AsservMessage.face.value,
             "X": float(position.x),
             "Y": float(position.y),
@@ -318,7 +363,7 @@ class Asserv:
         with self.lock:
             self.status_countdown = 2
         self.direction = MovementDirection.FORWARD
-        self.serial.write(self.formatMsg({
+        self._write(self.formatMsg({
             "cmd": AsservMessage.orbital_turn.value,
             "A" : float(degrees),
             "F" : float(1.0) if forward else float(0),
@@ -338,7 +383,7 @@ class Asserv:
         """
 
         logger.info(f"setOdometrie P{x}#{y}#{theta}")
-        self.serial.write(self.formatMsg({
+        self._write(self.formatMsg({
             "cmd": AsservMessage.set_position.value,
             "X" : float(x),
             "Y" : float(y),
@@ -357,9 +402,9 @@ class Asserv:
 
         logger.info(f"enableLowSpeed : {enable}")
         if enable:
-            self.serial.write(self.formatMsg({"cmd": AsservMessage.slow_speed_acc_mode.value}))
+            self._write(self.formatMsg({"cmd": AsservMessage.slow_speed_acc_mode.value}))
         else:
-            self.serial.write(self.formatMsg({"cmd": AsservMessage.normal_speed_acc_mode.value}))
+            self._write(self.formatMsg({"cmd": AsservMessage.normal_speed_acc_mode.value}))
 
     def set_speed(self, pct: int) -> None:
         """
@@ -386,7 +431,7 @@ class Asserv:
         """
 
         logger.info(f"setSpeed {pct}%")
-        self.serial.write(self.formatMsg({
+        self._write(self.formatMsg({
             "cmd": AsservMessage.max_motor_speed.value,
             "P" : float(pct),
             "ID": 0
@@ -404,10 +449,18 @@ class Asserv:
             time.sleep(0.001)
 
     def update_position(self) -> None:
+        # Trames décodées en attente de traitement
+        self._backlog.set(self.response_listener.get_nb_payload())
         while self.response_listener.get_nb_payload() > 0 :
             payload = self.response_listener.pop_payload()
+            now = self.clock.now()
+            if self._last_frame is not None:
+                self._frame_interval.record(now - self._last_frame)
+            self._last_frame = now
+            self._frames.inc()
             self.last_log = payload
-            logger.debug(f"Position : {self.last_log}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Position : {self.last_log}")
             self.position.x = int(payload['x'])
             self.position.y = int(payload['y'])
             self.position.theta = float(payload['theta'])
@@ -427,6 +480,11 @@ class Asserv:
             self.last_received_command_id = int(payload['cmd_id'])
             self.motor_left_speed = int(payload['motor_left'])
             self.motor_right_speed = int(payload['motor_right'])
+            if self.telemetry is not None:
+                self.telemetry.pose(
+                    self.position.x, self.position.y, self.position.theta, asserv_status_int,
+                    self.queue_size, self.motor_left_speed, self.motor_right_speed
+                )
 
     def wait_for_asserv(self) -> None:
         """
@@ -439,7 +497,7 @@ class Asserv:
         """
 
         while not (self.is_last_command_finished()):
-            time.sleep(0.005)
+            self.clock.sleep(0.005)
 
     def wait_for_halted_or_blocked(self, timeout_ms: int) -> None:
         """
@@ -450,9 +508,9 @@ class Asserv:
             None
         """
 
-        start_time = time.time_ns()
-        while self.asserv_status == AsservStatus.STATUS_RUNNING and ((time.time_ns() - start_time)  / 1000000) < timeout_ms:
-            time.sleep(0.01)
+        deadline = self.clock.now() + timeout_ms / 1000
+        while self.asserv_status == AsservStatus.STATUS_RUNNING and self.clock.now() < deadline:
+            self.clock.sleep(0.01)
 
     def is_last_command_finished(self) -> bool:
         return (self.last_received_command_id > self.last_sent_command_id or
@@ -484,7 +542,7 @@ class Asserv:
         """
 
         start = self.gostart_config[color]
-        time.sleep(0.15)
+        self.clock.sleep(0.15)
         for instruction in start:
             temp = instruction
             logger.debug(temp)
@@ -496,7 +554,7 @@ class Asserv:
                 self.go(temp["dist"])
                 self.wait_for_halted_or_blocked(1000)
                 self.emergency_stop()
-                time.sleep(2)
+                self.clock.sleep(2)
                 self.emergency_reset()
                 logger.info(f"Go timed end {temp['dist']}")
             elif temp["type"] == "turn":
@@ -529,5 +587,5 @@ class Asserv:
             else:
                 raise Exception(f"Unknown instruction {temp}")
             self.wait_for_asserv()
-            time.sleep(0.25)
+            self.clock.sleep(0.25)
         logger.info("goStart finished")
\ No newline at end of file
@@ -0,0 +1,290 @@
+import argparse
+import ast
+import json
+import math
+import re
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ia.utils.position import Position
+
+# Format des lignes de log : '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+LOG_LINE = re.compile(r"^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3}) - (\S+) - (\w+) - (.*)$")
+SET_SPEED = re.compile(r"^setSpeed (\d+)%")
+
+
+class TrajectoryEstimator:
+    """
+    Estime la durée des déplacements de l'asservissement.
+
+    Modèle
+        - ligne droite : profil trapézoïdal (accélération, vitesse max, décélération),
+          la vitesse max étant réduite par le pourcentage de set_speed
+        - rotation sur place avant chaque goto/goto-back/face, même profil en angulaire
+        - go_to_chain : pas d'arrêt en fin de segment, ni de rotation sur place au segment suivant
+        - un temps fixe de stabilisation à chaque arrêt
+
+    L'estimateur est à état : il suit le pourcentage de vitesse courant, la vitesse en sortie
+    de go_to_chain et le temps écoulé depuis le début du match (elapsed).
+
+    Configuration (clé "trajectoryEstimator" du config.json robot, générée par calibrate()) :
+        maxSpeed : vitesse max en ligne droite à 100% (mm/s), défaut 600
+        acceleration : accélération linéaire (mm/s²), défaut 800
+        rotationSpeed : vitesse max de rotation sur place à 100% (rad/s), défaut 3
+        rotationAcceleration : accélération angulaire (rad/s²), défaut 6
+        stopOverhead : temps de stabilisation à chaque arrêt (s), défaut 0.05
+        defaultActionDuration : durée d'une action jamais mesurée (s), défaut 1
+        actionDurations : durées connues par id d'action (s)
+    """
+
+    def __init__(
+        self,
+        max_speed: float = 600.0,
+        acceleration: float = 800.0,
+        rotation_speed: float = 3.0,
+        rotation_acceleration: float = 6.0,
+        stop_overhead: float = 0.05,
+        default_action_duration: float = 1.0,
+        action_durations: Optional[Dict[str, float]] = None,
+    ) -> None:
+        self.max_speed = max_speed
+        self.acceleration = acceleration
+        self.rotation_speed = rotation_speed
+        self.rotation_acceleration = rotation_acceleration
+        self.stop_overhead = stop_overhead
+        self.default_action_duration = default_action_duration
+        self.action_durations: Dict[str, float] = dict(action_durations or {})
+
+        self.speed_pct: float = 100.0
+        self.current_speed: float = 0.0
+        self.elapsed: float = 0.0
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict]) -> 'TrajectoryEstimator':
+        config = config or {}
+        return cls(
+            max_speed=config.get("maxSpeed", 600.0),
+            acceleration=config.get("acceleration", 800.0),
+            rotation_speed=config.get("rotationSpeed", 3.0),
+            rotation_acceleration=config.get("rotationAcceleration", 6.0),
+            stop_overhead=config.get("stopOverhead", 0.05),
+            default_action_duration=config.get("defaultActionDuration", 1.0),
+            action_durations=config.get("actionDurations"),
+        )
+
+    def to_config(self) -> Dict:
+        return {
+            "maxSpeed": round(self.max_speed, 1),
+            "acceleration": round(self.acceleration, 1),
+            "rotationSpeed": round(self.rotation_speed, 2),
+            "rotationAcceleration": round(self.rotation_acceleration, 2),
+            "stopOverhead": round(self.stop_overhead, 3),
+            "defaultActionDuration": self.default_action_duration,
+            "actionDurations": self.action_durations,
+        }
+
+    def fork(self) -> 'TrajectoryEstimator':
+        """Nouvel estimateur avec les mêmes paramètres et un état remis à zéro."""
+        return TrajectoryEstimator(
+            self.max_speed, self.acceleration, self.rotation_speed, self.rotation_acceleration,
+            self.stop_overhead, self.default_action_duration, self.action_durations
+        )
+
+    # ──────────────────────────────────────────────────────────────────
+    # Profils
+    # ──────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _profile(distance: float, v_max: float, accel: float, v_start: float = 0.0, v_end: float = 0.0) -> Tuple[float, float]:
+        """
+        Durée d'un profil trapézoïdal sur une distance, avec vitesses d'entrée et de sortie.
+
+        Returns
+        -------
+        (durée, vitesse réellement atteinte en sortie)
+        """
+        if distance <= 0 or v_max <= 0 or accel <= 0:
+            return 0.0, v_start
+        v_start = min(v_start, v_max)
+        v_end = min(v_end, v_max)
+
+        # Vitesse de sortie inatteignable : accélération (ou freinage) sur toute la distance
+        reachable = math.sqrt(v_start ** 2 + 2 * accel * distance)
+        if v_end > reachable:
+            return (reachable - v_start) / accel, reachable
+        v_end = min(v_end, reachable)
+
+        accel_distance = (v_max ** 2 - v_start ** 2) / (2 * accel)
+        decel_distance = (v_max ** 2 - v_end ** 2) / (2 * accel)
+        if accel_distance + decel_distance <= distance:
+            cruise = (distance - accel_distance - decel_distance) / v_max
+            return (v_max - v_start) / accel + cruise + (v_max - v_end) / accel, v_end
+
+        # Profil triangulaire : la vitesse max n'est jamais atteinte
+        v_peak = math.sqrt((2 * accel * distance + v_start ** 2 + v_end ** 2) / 2)
+        if v_peak < max(v_start, v_end):
+            # Freinage impossible sur la distance : décélération continue
+            return 2 * distance / (v_start + v_end), v_end
+        return (v_peak - v_start) / accel + (v_peak - v_end) / accel, v_end
+
+    def _speed(self) -> float:
+        return self.max_speed * self.speed_pct / 100
+
+    def set_speed(self, pct: float) -> None:
+        self.speed_pct = max(1.0, min(100.0, float(pct)))
+
+    def turn_time(self, angle: float) -> float:
+        """Durée d'une rotation sur place (rad), arrêt compris."""
+        angle = abs(math.atan2(math.sin(angle), math.cos(angle)))
+        if angle < 0.01:
+            return 0.0
+        duration, _ = self._profile(angle, self.rotation_speed * self.speed_pct / 100, self.rotation_acceleration)
+        self.current_speed = 0.0
+        return duration + self.stop_overhead
+
+    def straight_time(self, distance: float, chain: bool = False) -> float:
+        """
+        Durée d'une ligne droite. En chain, le robot ne s'arrête pas en fin de segment :
+        il sort à la vitesse max et le segment suivant démarre à cette vitesse.
+        """
+        v_max = self._speed()
+        duration, self.current_speed = self._profile(
+            abs(distance), v_max, self.acceleration, self.current_speed, v_max if chain else 0.0
+        )
+        if not chain:
+            self.current_speed = 0.0
+            duration += self.stop_overhead
+        return duration
+
+    # ──────────────────────────────────────────────────────────────────
+    # Commandes
+    # ──────────────────────────────────────────────────────────────────
+
+    def goto(self, start: Position, x: float, y: float, backward: bool = False, chain: bool = False) -> Tuple[float, Position]:
+        """
+        Durée d'un goto (ou goto-back, goto-chain) depuis start.
+        La rotation sur place n'a lieu que si le robot est à l'arrêt.
+
+        Returns
+        -------
+        (durée, pose d'arrivée)
+        """
+        distance = math.hypot(x - start.x, y - start.y)
+        if distance == 0:
+            return 0.0, Position(x, y, start.theta)
+        heading = math.atan2(y - start.y, x - start.x)
+        if backward:
+            heading = math.atan2(start.y - y, start.x - x)
+        duration = 0.0
+        if self.current_speed == 0:
+            duration += self.turn_time(heading - start.theta)
+        duration += self.straight_time(distance, chain)
+        return duration, Position(x, y, heading)
+
+    def path(self, start: Position, waypoints: List[Tuple[float, float]]) -> Tuple[float, Position]:
+        """Trajet du pathfinding : go_to_chain sur les points intermédiaires, goto précis sur le dernier."""
+        duration = 0.0
+        position = start
+        for index, (x, y) in enumerate(waypoints):
+            segment, position = self.goto(position, x, y, chain=index < len(waypoints) - 1)
+            duration += segment
+        return duration, position
+
+    def face(self, start: Position, x: float, y: float) -> float:
+        return self.turn_time(math.atan2(y - start.y, x - start.x) - start.theta)
+
+    def action_time(self, action_id: str) -> float:
+        return self.action_durations.get(action_id, self.default_action_duration)
+
+    def advance(self, duration: float) -> float:
+        """Fait avancer le temps de match estimé et le retourne."""
+        self.elapsed += duration
+        return self.elapsed
+
+    # ──────────────────────────────────────────────────────────────────
+    # Calibration
+    # ──────────────────────────────────────────────────────────────────
+
+    @classmethod
+    def calibrate(cls, lines: Iterable[str], percentile: float = 0.95, **kwargs) -> 'TrajectoryEstimator':
+        """
+        Calibre le modèle depuis des logs de match (lignes "Position : {...}" de l'asserv
+        et "setSpeed N%"). Les vitesses sont ramenées à 100% avec le pourcentage en vigueur.
+        Les valeurs retenues sont des percentiles hauts pour ignorer le bruit d'odométrie.
+        """
+        samples: List[Tuple[float, float, float, float, float]] = []
+        speed_pct = 100.0
+        for line in lines:
+            match = LOG_LINE.match(line.strip())
+            if match is None:
+                continue
+            timestamp, _, _, message = match.groups()
+            speed_match = SET_SPEED.match(message)
+            if speed_match is not None:
+                speed_pct = max(1.0, float(speed_match.group(1)))
+                continue
+            if not message.startswith("Position :"):
+                continue
+            try:
+                payload = ast.literal_eval(message[len("Position :"):].strip())
+                t = datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S,%f").timestamp()
+                samples.append((t, float(payload["x"]), float(payload["y"]), float(payload["theta"]), speed_pct))
+            except (ValueError, KeyError, SyntaxError):
+                continue
+
+        samples.sort()
+        linear: List[Tuple[float, float, float]] = []
+        angular: List[Tuple[float, float, float]] = []
+        for (t0, x0, y0, th0, _), (t1, x1, y1, th1, pct) in zip(samples, samples[1:]):
+            dt = t1 - t0
+            if dt <= 0 or dt > 0.5:
+                continue
+            scale = 100 / pct
+            v = math.hypot(x1 - x0, y1 - y0) / dt * scale
+            w = abs(math.atan2(math.sin(th1 - th0), math.cos(th1 - th0))) / dt * scale
+            linear.append((t1, v, scale))
+            if v < 20:
+                angular.append((t1, w, scale))
+
+        estimator = cls(**kwargs)
+        speeds = [v for _, v, _ in linear if v > 5]
+        if speeds:
+            estimator.max_speed = _percentile(speeds, percentile)
+        rotations = [w for _, w, _ in angular if w > 0.05]
+        if rotations:
+            estimator.rotation_speed = _percentile(rotations, percentile)
+        accelerations = _accelerations(linear, estimator.max_speed)
+        if accelerations:
+            estimator.acceleration = _percentile(accelerations, percentile)
+        rotation_accelerations = _accelerations(angular, estimator.rotation_speed)
+        if rotation_accelerations:
+            estimator.rotation_acceleration = _percentile(rotation_accelerations, percentile)
+        return estimator
+
+
+def _percentile(values: List[float], percentile: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(percentile * len(values)))]
+
+
+def _accelerations(samples: List[Tuple[float, float, float]], v_max: float) -> List[float]:
+    """Accélérations (ramenées à 100%) mesurées pendant les phases de montée en vitesse."""
+    result = []
+    for (t0, v0, _), (t1, v1, scale) in zip(samples, samples[1:]):
+        dt = t1 - t0
+        if 0 < dt <= 0.5 and v1 > v0 and v1 < 0.8 * v_max:
+            # L'accélération n'est pas réduite par set_speed
+            result.append((v1 - v0) / dt / scale)
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Calibre le TrajectoryEstimator depuis des logs de match")
+    parser.add_argument("logs", nargs="+", help="Fichiers de log (logs/log.log, logs/log.log.1...)")
+    args = parser.parse_args()
+
+    log_lines = []
+    for log_path in args.logs:
+        with open(log_path, encoding="utf-8", errors="replace") as log_file:
+            log_lines.extend(log_file.readlines())
+    print(json.dumps({"trajectoryEstimator": TrajectoryEstimator.calibrate(log_lines).to_config()}, indent=2))
@@ -12,15 +12,22 @@ from ia.api.color_selector import ColorSelector
 from ia.api.detection.lidar.lidar_rpa2 import LidarRpA2
 from ia.api.detection.ultrasound.srf_factory import SrfFactory
 from ia.api.log_socket import LogSocket
+from ia.api.metrics_server import MetricsServer
 from ia.api.nextion_nx32224t024 import NextionNX32224T024
 from ia.api.pull_cord import PullCord
+from ia.api.telemetry import TelemetrySender
 from ia.asservissement.asserv import Asserv
+from ia.asservissement.trajectory_estimator import TrajectoryEstimator
 from ia.manager.action_manager import ActionManager
 from ia.manager.detection_manager import DetectionManager
 from ia.manager.movement_manager import MovementManager
+from ia.manager.safety_monitor import SafetyMonitor
 from ia.manager.strategy_manager import StrategyManager
 from ia.master_loop import MasterLoop
+from ia.utils.clock import Clock
 from ia.utils.config_loader import load_config
+from ia.utils.log_pipeline import LogPipeline
+from ia.utils.metrics import METRICS
 from ia.utils.robot import Robot
 from ia.utils.robot_filter import RobotFilter
 
@@ -47,9 +54,9 @@ if __name__ == "__main__":
     formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     file_handler.setFormatter(formatter)
     stdout_handler.setFormatter(formatter)
-    # add the handlers to the logger
-    logging.getLogger().addHandler(file_handler)
-    logging.getLogger().addHandler(stdout_handler)
+    # add the handlers to the logger, through a queue so that logging never blocks the caller
+    log_pipeline = LogPipeline([file_handler, stdout_handler])
+    log_pipeline.start()
 
     logger = logging.getLogger(__name__)
     logger.info("Init logger")
@@ -65,22 +72,39 @@ if __name__ == "__main__":
             host=config_data['loggerSocket']['host']
         ).get()
         socket_handler.addFilter(RobotFilter(config_data['loggerSocket']['who']))
-        logging.getLogger().addHandler(socket_handler)
+        log_pipeline.add_handler(socket_handler)
+
+    # Init binary telemetry (poses, detections, steps)
+    telemetry = None
+    if config_data.get('telemetry', {}).get('active'):
+        telemetry = TelemetrySender(
+            host=config_data['telemetry']['host'],
+            port=config_data['telemetry']['port'],
+            who=config_data['loggerSocket']['who']
+        )
+
+    # Init live metrics endpoint (latency histograms, counters)
+    if config_data.get('metrics', {}).get('active'):
+        MetricsServer.from_config(METRICS, config_data['metrics']).start()
 
     # Init divers
+    clock = Clock()
     comm_config=config_data["comSocket"]
+    comm_config.setdefault("who", config_data['loggerSocket']['who'])
     table_config=config_data["table"]
     logger.info("Init asservissement")
     asserv = Asserv(
         serial_port=config_data["asserv"]["serialPort"],
         baud_rate=config_data["asserv"]["baudRate"],
         gostart_config=config_data["asserv"]["goStart"],
+        telemetry=telemetry,
+        clock=clock,
     )
     logger.info("Init asservissement OK")
 
     # Init chrono
     logger.info("Init chrono")
-    chrono = Chrono(config_data['matchDuration'])
+    chrono = Chrono(config_data['matchDuration'], clock)
     logger.info("Init chrono OK")
 
     # Init action manager
@@ -109,11 +133,13 @@ if __name__ == "__main__":
         serial_ports=serial_ports,
         camera=camera,
         chrono=chrono,
+        clock=clock,
     )
     action_manager = ActionManager(
         action_repository=action_repository,
         actions_config=config_data["actions"],
         stop_hooks=stop_hooks,
+        clock=clock,
     )
     logger.info("Init action manager OK")
 
@@ -127,7 +153,8 @@ if __name__ == "__main__":
             quality=config_data["detection"]["lidar"]["quality"],
             distance=config_data["detection"]["lidar"]["distance"],
             period=config_data["detection"]["lidar"]["period"],
-            asserv=asserv
+            asserv=asserv,
+            telemetry=telemetry
         )
     ultrasound_config = config_data["detection"]["ultrasound"]
     srf = []
@@ -141,17 +168,28 @@ if __name__ == "__main__":
         lidar=lidar,
         asserv=asserv,
         table_config=table_config,
+        telemetry=telemetry,
     )
     logger.info("Init detection manager OK")
 
+    # Init safety monitor (emergency stop outside of the master loop)
+    safety_monitor = SafetyMonitor.from_config(config_data["detection"].get("safety"), detection_manager, asserv, clock)
+
     # Init movement manager
     logger.info("Init movement manager")
-    movement_manager = MovementManager(asserv=asserv)
+    movement_manager = MovementManager(asserv=asserv, clock=clock)
     logger.info("Init movement manager OK")
 
     # Init strategy manager
     logger.info("Init strategy manager")
-    strategy_manager = StrategyManager(year=args.year, robot=robot)
+    strategy_manager = StrategyManager(
+        year=args.year,
+        robot=robot,
+        scheduler_config=config_data.get("strategyScheduler"),
+        estimator=TrajectoryEstimator.from_config(config_data.get("trajectoryEstimator"))
+    )
+    # Both colors are loaded now, the strategy is ready as soon as the color is selected
+    strategy_manager.preload()
     logger.info("Init strategy manager OK")
 
     # Init pull cord
@@ -188,7 +226,11 @@ if __name__ == "__main__":
         pull_cord=pull_cord,
         nextion_display=nextion_display,
         color_selector=color_selector,
-        step_by_step=args.step_by_step
+        step_by_step=args.step_by_step,
+        telemetry=telemetry,
+        clock=clock,
+        safety_monitor=safety_monitor,
+        lookahead_config=config_data.get("lookahead")
     )
 
     # Start execution
@@ -205,4 +247,5 @@ if __name__ == "__main__":
 
     # wait a little more, just in case
     time.sleep(5)
-    logger.info("End of the MasterLoop")
\ No newline at end of file
+    logger.info("End of the MasterLoop")
+    log_pipeline.stop()
\ No newline at end of file
@@ -1,9 +1,10 @@
 import logging
-import time
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 from ia.actions.abstract_action import AbstractAction
 from ia.actions.action_repository import ActionRepository
+from ia.utils.clock import Clock, SYSTEM_CLOCK
+from ia.utils.metrics import METRICS, MetricsRegistry
 
 
 class ActionManager:
@@ -12,13 +13,23 @@ class ActionManager:
         self,
         action_repository: ActionRepository,
         actions_config: Dict,
-        stop_hooks: Optional[List[Callable]] = None
+        stop_hooks: Optional[List[Callable]] = None,
+        clock: Optional[Clock] = None,
+        metrics: Optional[MetricsRegistry] = None
     ) -> None:
         self.action_flags: Optional[list[str]] = None
         self.current_action: Optional[AbstractAction] = None
         self.actions_config = actions_config
         self.action_repository = action_repository
         self.stop_hooks = stop_hooks or []
+        self.clock = clock if clock is not None else SYSTEM_CLOCK
+        self.metrics = metrics if metrics is not None else METRICS
+        # Dernière durée mesurée (s) de chaque action, utilisée pour estimer les objectifs
+        self.action_durations: Dict[str, float] = {}
+        self._current_action_id: Optional[str] = None
+        self._execution_start: Optional[float] = None
+        # Actions détachées (instant_return) qui tournent en parallèle des steps suivantes : (id, action, début)
+        self.overlapped_actions: List[Tuple[str, AbstractAction, float]] = []
         self.logger = logging.getLogger(__name__)
 
     def get_action(self, action_id: str) -> AbstractAction:
@@ -29,12 +40,41 @@ class ActionManager:
         self.action_flags = None
         self.current_action = self.action_repository.get_action(action_id)
         if self.current_action is not None:
+            self._current_action_id = action_id
+            self._execution_start = self.clock.now()
             self.current_action.reset()
             self.current_action.execute()
 
+    def detach_current_action(self) -> None:
+        """
+        Laisse la dernière action continuer en parallèle des steps suivantes : elle est suivie à part
+        (poll_overlapped_actions) et la prochaine commande ne la remplace pas.
+        """
+        if self.current_action is not None and not self.current_action.finished():
+            self.overlapped_actions.append((self._current_action_id, self.current_action, self._execution_start))
+        self.current_action = None
+        self._current_action_id = None
+        self._execution_start = None
+
+    def poll_overlapped_actions(self) -> List[Tuple[str, float, List[str]]]:
+        """Actions détachées terminées depuis le dernier appel : (id, durée en s, flags levés)."""
+        finished = []
+        for overlapped in list(self.overlapped_actions):
+            action_id, action, start = overlapped
+            if action.finished():
+                self.overlapped_actions.remove(overlapped)
+                duration = self.clock.now() - start
+                self.action_durations[action_id] = duration
+                self.metrics.histogram(f"actions.{action_id}").record(duration)
+                self.logger.info(f"Overlapped action {action_id} finished in {duration:.3f}s")
+                finished.append((action_id, duration, action.get_flags() or []))
+        return finished
+
     def stop_actions(self) -> None:
         if self.current_action is not None:
             self.current_action.stop()
+        for _, action, _ in self.overlapped_actions:
+            action.stop()
         for hook in self.stop_hooks:
             try:
                 hook()
@@ -46,7 +86,12 @@ class ActionManager:
             return True
         if self.current_action.finished():
             self.action_flags = self.current_action.get_flags()
-            self.logger.info("Action finished")
+            if self._execution_start is not None:
+                duration = self.clock.now() - self._execution_start
+                self.action_durations[self._current_action_id] = duration
+                self.metrics.histogram(f"actions.{self._current_action_id}").record(duration)
+                self._execution_start = None
+                self.logger.info(f"Action finished in {duration:.3f}s")
             return True
         return False
 
@@ -57,6 +102,6 @@ class ActionManager:
             self.execute_command(action_id)
             while not self.is_last_execution_finished():
                 try:
-                    time.sleep(0.005)
+                    self.clock.sleep(0.005)
                 except InterruptedError as e:
                     self.logger.error(e)
\ No newline at end of file
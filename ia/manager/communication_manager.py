@@ -1,9 +1,12 @@
 import logging
-from typing import Dict
+import math
+from typing import Dict, List, Optional, Tuple
 
 from ia.api.communication_socket import CommunicationSocket
 from ia.manager.action_manager import ActionManager
 from ia.pathfinding.visibility_graph import VisibilityGraph
+from ia.utils.clock import Clock, SYSTEM_CLOCK
+from ia.utils.position import Position
 
 
 class CommunicationManager:
@@ -12,9 +15,17 @@ class CommunicationManager:
 
     This class is responsible for sending and receiving data to and from the server,
     managing pathfinding operations, and executing actions based on the received data.
+
+    It also shares the robot state with its teammates: the pose and the planned path are
+    broadcast at most every "period" seconds, and only when they changed (pose moved by more
+    than "poseDelta" mm or "angleDelta" rad, new path). A full pose is sent every "keyframe"
+    seconds, along with the current path: a lost path message only leaves a stale corridor until
+    the next keyframe. Pose changes in between are sent as deltas. Teammates not heard of for
+    "timeout" seconds are forgotten. Parameters are read from the "worldState" key of comSocket.
     """
 
-    def __init__(self, pathfinding: VisibilityGraph, action_manager: ActionManager, comm_config: Dict) -> None:
+    def __init__(self, pathfinding: VisibilityGraph, action_manager: ActionManager, comm_config: Dict,
+                 clock: Optional[Clock] = None) -> None:
         """
         Initializes the CommunicationManager with pathfinding, action manager, and communication configuration.
 
@@ -25,13 +36,35 @@ class CommunicationManager:
         action_manager : action_manager
             An instance of the ActionManager class used for managing actions.
         comm_config : Dict
-            A dictionary containing the communication configuration with keys "host" and "port".
+            A dictionary containing the communication configuration with keys "host", "port",
+            and optionally "who" (robot id) and "worldState".
+        clock : Clock, optional
+            Clock service used to pace the state broadcast and expire teammates, real time by default.
         """
         self.pathfinding = pathfinding
         self.action_manager = action_manager
-        self.communication_socket = CommunicationSocket(host=comm_config["host"], port=comm_config["port"])
+        self.communication_socket = CommunicationSocket(
+            host=comm_config["host"], port=comm_config["port"], who=comm_config.get("who")
+        )
+        self.who = self.communication_socket.who
+        self.clock = clock if clock is not None else SYSTEM_CLOCK
         self.logger = logging.getLogger(__name__)
 
+        world_config = comm_config.get("worldState", {})
+        self.state_period: float = world_config.get("period", 0.2)
+        self.keyframe_period: float = world_config.get("keyframe", 1.0)
+        self.pose_delta: float = world_config.get("poseDelta", 20)
+        self.angle_delta: float = world_config.get("angleDelta", 0.05)
+        self.teammate_timeout: float = world_config.get("timeout", 2.0)
+
+        self.last_state_time = -math.inf
+        self.last_keyframe_time = -math.inf
+        # Dernière pose envoyée (x, y, theta en mrad) et dernier chemin envoyé
+        self.sent_pose: Optional[Tuple[int, int, int]] = None
+        self.sent_path: Optional[Tuple[Tuple[int, int], ...]] = None
+        # Coéquipiers : id → {"x", "y", "theta", "path", "updated"}
+        self.teammates: Dict[str, dict] = {}
+
     def send_delete_zone(self, zone_id: str) -> None:
         """
         Sends a delete zone command to the hotspot socket.
@@ -85,14 +118,113 @@ class CommunicationManager:
 
     def read_from_server(self) -> None:
         """
-        Reads data from the server and processes it.
+        Processes every message received from the server since the last call, each one exactly once.
         """
-        data = self.communication_socket.last_message
-        if data:
+        for data in self.communication_socket.pop_messages():
             data_split = data.split("#")
-            if data_split[0] == "delete-zone":
+            if data_split[0] in ("pose", "dpose", "path"):
+                self.update_teammate(data_split)
+            elif data_split[0] == "delete-zone":
                 self.pathfinding.update_dynamic_zone(data_split[1], False)
             elif data_split[0] == "add-zone":
                 self.pathfinding.update_dynamic_zone(data_split[1], True)
             elif data_split[0] == "action-data":
-                self.action_manager.execute_command(data_split[1])
\ No newline at end of file
+                self.action_manager.execute_command(data_split[1])
+
+    def publish_state(self, position: Position, path: List[Position]) -> None:
+        """
+        Broadcasts the robot pose and remaining planned path to the teammates, rate-limited and delta-encoded.
+
+        Parameters
+        ----------
+        position : Position
+            The current position of the robot.
+        path : list[Position]
+            The remaining waypoints of the current movement.
+        """
+        now = self.clock.now()
+        if now - self.last_state_time < self.state_period:
+            return
+        self.last_state_time = now
+
+        pose = (int(position.x), int(position.y), int(position.theta * 1000))
+        keyframe = self.sent_pose is None or now - self.last_keyframe_time >= self.keyframe_period
+        if keyframe:
+            self.communication_socket.send_message(f"pose#{self.who}#{pose[0]}#{pose[1]}#{pose[2]}")
+            self.sent_pose = pose
+            self.last_keyframe_time = now
+        else:
+            dx, dy, dtheta = (pose[i] - self.sent_pose[i] for i in range(3))
+            if math.hypot(dx, dy) > self.pose_delta or abs(dtheta) > self.angle_delta * 1000:
+                self.communication_socket.send_message(f"dpose#{self.who}#{dx}#{dy}#{dtheta}")
+                self.sent_pose = pose
+
+        waypoints = tuple((int(p.x), int(p.y)) for p in path)
+        # Chemin renvoyé avec chaque pose complète, même inchangé, au cas où un envoi aurait été perdu
+        if keyframe or waypoints != self.sent_path:
+            encoded = ";".join(f"{x},{y}" for x, y in waypoints)
+            self.communication_socket.send_message(f"path#{self.who}#{encoded}")
+            self.sent_path = waypoints
+
+    def update_teammate(self, data_split: List[str]) -> None:
+        """
+        Updates the state of a teammate from a pose, dpose or path message.
+
+        Parameters
+        ----------
+        data_split : list[str]
+            The message split on "#": [type, robot id, values...].
+        """
+        try:
+            kind, who = data_split[0], data_split[1]
+            teammate = self.teammates.get(who)
+            if kind == "pose":
+                x, y, theta = (int(value) for value in data_split[2:5])
+                if teammate is None:
+                    teammate = self.teammates[who] = {"path": []}
+                teammate.update(x=x, y=y, theta=theta / 1000)
+            elif kind == "dpose":
+                if teammate is None or "x" not in teammate:
+                    # Delta sans pose de référence : on attend la prochaine pose complète
+                    return
+                dx, dy, dtheta = (int(value) for value in data_split[2:5])
+                teammate.update(x=teammate["x"] + dx, y=teammate["y"] + dy, theta=teammate["theta"] + dtheta / 1000)
+            elif kind == "path":
+                if teammate is None:
+                    teammate = self.teammates[who] = {"path": []}
+                teammate["path"] = [
+                    (int(x), int(y)) for x, y in (point.split(",") for point in data_split[2].split(";") if point)
+                ]
+            teammate["updated"] = self.clock.now()
+        except (IndexError, ValueError) as e:
+            self.logger.error(f"Invalid teammate state message {'#'.join(data_split)}: {e}")
+
+    def get_teammate_obstacles(self) -> List[Dict]:
+        """
+        Returns the teammates as obstacles for VisibilityGraph.compute_path.
+
+        Returns
+        -------
+        list[dict]
+            {"x", "y", "path"} for every teammate heard of recently, "path" being the corridor
+            from its current pose through its remaining waypoints.
+        """
+        now = self.clock.now()
+        obstacles = []
+        for who, teammate in list(self.teammates.items()):
+            if now - teammate.get("updated", 0) > self.teammate_timeout:
+                self.logger.info(f"Teammate {who} lost")
+                del self.teammates[who]
+                continue
+            if "x" not in teammate:
+                continue
+            path = teammate["path"]
+            if path:
+                # Les points déjà dépassés ne font plus partie du couloir
+                nearest = min(
+                    range(len(path)),
+                    key=lambda i: math.hypot(path[i][0] - teammate["x"], path[i][1] - teammate["y"])
+                )
+                path = path[nearest:]
+            obstacles.append({"x": teammate["x"], "y": teammate["y"], "path": [(teammate["x"], teammate["y"])] + path})
+        return obstacles
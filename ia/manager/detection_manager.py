@@ -1,5 +1,6 @@
 import logging
 import math
+import time
 from typing import Dict, List, Optional
 
 import numpy as np
@@ -7,13 +8,16 @@ from shapely.geometry import Polygon
 
 from ia.api.detection.lidar.lidar_rpa2 import LidarRpA2
 from ia.api.detection.ultrasound.srf import Srf
+from ia.api.telemetry import DetectionSource, TelemetrySender
 from ia.asservissement.asserv import Asserv
 from ia.asservissement.movement_direction import MovementDirection
+from ia.utils.metrics import METRICS, MetricsRegistry
 from ia.utils.position import Position
 
 
 class DetectionManager:
-    def __init__(self, sensors: list[Srf], lidar: Optional[LidarRpA2], asserv: Asserv, table_config: Dict) -> None:
+    def __init__(self, sensors: list[Srf], lidar: Optional[LidarRpA2], asserv: Asserv, table_config: Dict,
+                 telemetry: Optional[TelemetrySender] = None, metrics: Optional[MetricsRegistry] = None) -> None:
         """
         Initializes the DetectionManager with a list of SRF sensors, a Lidar, an Asserv and a Pathfinding.
 
@@ -23,6 +27,8 @@ class DetectionManager:
             lidar (lidar_rpa2): An instance of the Lidar class.
             asserv (asserv): An instance of the Asserv class.
             table_config (Dict): The configuration of the table.
+            telemetry (TelemetrySender, optional): Binary telemetry stream receiving ultrasound detections.
+            metrics (MetricsRegistry, optional): Receives the trajectory check times and lidar blockings.
         """
 
         self.logger = logging.getLogger(__name__)
@@ -30,6 +36,8 @@ class DetectionManager:
         self.lidar = lidar
         self.asserv = asserv
         self.table_config = table_config
+        self.telemetry = telemetry
+        self.metrics = metrics if metrics is not None else METRICS
         self.ignore_detection_grid = np.zeros(
             shape=(self.table_config.get("sizeX"), self.table_config.get("sizeY")),
             dtype=np.uint8
@@ -107,6 +115,8 @@ class DetectionManager:
         )
 
         self.logger.debug(f"Sensor {sensor.desc} detected an obstacle at position ({x_obstacle_relative_to_table},{y_obstacle_relative_to_table})")
+        if self.telemetry is not None:
+            self.telemetry.detection(DetectionSource.ULTRASOUND, x_obstacle_relative_to_table, y_obstacle_relative_to_table)
 
         return Position(x_obstacle_relative_to_table, y_obstacle_relative_to_table)
 
@@ -188,18 +198,22 @@ class DetectionManager:
         if self.lidar is None:
             return False
 
+        check_start = time.perf_counter()
         current_position = self.asserv.position
-        if goto_queue:
-            goto_queue.insert(0, Position(current_position.x, current_position.y))
-
-        for i in range(len(goto_queue) - 1):
-            start = goto_queue[i]
-            end = goto_queue[i + 1]
-            for center in self.lidar.detected_points:
-                if self.is_segment_intersecting_circle(start, end, center, 200):
-                    self.logger.info(f"Trajectory blocked by {center}")
-                    return True
-        return False
+        goto_queue = [Position(current_position.x, current_position.y)] + list(goto_queue)
+
+        try:
+            for i in range(len(goto_queue) - 1):
+                start = goto_queue[i]
+                end = goto_queue[i + 1]
+                for center in self.lidar.detected_points:
+                    if self.is_segment_intersecting_circle(start, end, center, 200):
+                        self.logger.info(f"Trajectory blocked by {center}")
+                        self.metrics.counter("detection.trajectory_blocked").inc()
+                        return True
+            return False
+        finally:
+            self.metrics.histogram("detection.trajectory_check").record(time.perf_counter() - check_start)
 
     def is_segment_intersecting_circle(self, start: Position, end: Position, center: Position, radius: int) -> bool:
         """
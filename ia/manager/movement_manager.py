@@ -1,14 +1,16 @@
 import logging
+from typing import Optional
 
 from ia.asservissement.asserv import Asserv
 from ia.asservissement.asserv_status import AsservStatus
 from ia.strategy.step import Step
 from ia.strategy.step_sub_type import StepSubType
+from ia.utils.clock import Clock, SYSTEM_CLOCK
 from ia.utils.position import Position
 
 
 class MovementManager:
-    def __init__(self, asserv: Asserv) -> None:
+    def __init__(self, asserv: Asserv, clock: Optional[Clock] = None) -> None:
         """
         Initializes the MovementManager with an Asserv object
 
@@ -16,8 +18,11 @@ class MovementManager:
         ----------
         asserv : asserv
         An instance of the Asserv class used for movement control.
+        clock : Clock, optional
+        The clock service, real time by default.
         """
         self.asserv = asserv
+        self.clock = clock if clock is not None else SYSTEM_CLOCK
         self.logger = logging.getLogger(__name__)
         self.goto_queue = []
         self.is_match_started = False
@@ -48,13 +53,12 @@ class MovementManager:
         self.goto_queue.clear()
         if len(trajectory) > 2:
             # Remove the first point which is the starting point and the last to finish on a precise goto
-            for point in trajectory[1:len(trajectory) - 2]:
+            for point in trajectory[1:-1]:
                 self.goto_queue.append(point)
                 if self.is_match_started:
                     self.asserv.go_to_chain(Position(point.x, point.y))
                     try:
-                        import time
-                        time.sleep(0.01)
+                        self.clock.sleep(0.01)
                     except InterruptedError as e:
                         self.logger.error(e)
         if len(trajectory) > 0:
@@ -136,8 +140,7 @@ class MovementManager:
             self.execute_movement(list(self.goto_queue))
             # Wait a bit to ensure that the asservissement has received at least one new command and is up to date
             try:
-                import time
-                time.sleep(0.2)
+                self.clock.sleep(0.2)
             except InterruptedError as e:
                 self.logger.error(e)
             return True
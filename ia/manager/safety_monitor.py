@@ -0,0 +1,109 @@
+import logging
+import threading
+import time
+from typing import Dict, Optional
+
+from ia.asservissement.asserv import Asserv
+from ia.asservissement.movement_direction import MovementDirection
+from ia.manager.detection_manager import DetectionManager
+from ia.utils.clock import Clock, SYSTEM_CLOCK
+from ia.utils.metrics import METRICS, MetricsRegistry
+
+# Période (s) de surveillance des SRF par défaut
+DEFAULT_PERIOD = 0.005
+
+
+class SafetyMonitor:
+    """
+    Arrêt d'urgence à latence bornée, indépendant de la boucle principale.
+
+    Un thread dédié surveille toutes les period secondes les SRF du sens de déplacement (seuils et
+    zones ignorées du DetectionManager) et envoie lui-même la trame d'arrêt d'urgence pré-encodée de
+    l'asserv. Un calcul de trajectoire ou une attente dans la boucle principale ne retarde donc plus
+    l'arrêt : la latence détection → commande est bornée par period plus une lecture des capteurs.
+
+    La boucle principale prend ensuite acte de l'arrêt (acknowledge) pour sa propre gestion :
+    recalage de la file de points, reprise quand la voie est libre. Tant que l'arrêt n'est pas
+    acquitté, le moniteur ne se redéclenche pas.
+    """
+
+    def __init__(self, detection_manager: DetectionManager, asserv: Asserv, period: float = DEFAULT_PERIOD,
+                 clock: Optional[Clock] = None, metrics: Optional[MetricsRegistry] = None) -> None:
+        """
+        Args:
+            detection_manager (DetectionManager): Lecture des SRF et filtrage des zones ignorées.
+            asserv (Asserv): Reçoit l'arrêt d'urgence.
+            period (float): Période (s) de surveillance.
+            clock (Clock, optional): Service d'horloge, temps réel par défaut.
+            metrics (MetricsRegistry, optional): Reçoit la latence détection → arrêt et la durée des vérifications.
+        """
+        self.logger = logging.getLogger(__name__)
+        self.detection_manager = detection_manager
+        self.asserv = asserv
+        self.period = period
+        self.clock = clock if clock is not None else SYSTEM_CLOCK
+        self.metrics = metrics if metrics is not None else METRICS
+        self.running = False
+        self.thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        # Sens du déplacement interrompu, en attente d'acquittement par la boucle principale
+        self._triggered: Optional[MovementDirection] = None
+
+    @classmethod
+    def from_config(cls, safety_config: Optional[Dict], detection_manager: DetectionManager, asserv: Asserv,
+                    clock: Optional[Clock] = None,
+                    metrics: Optional[MetricsRegistry] = None) -> Optional['SafetyMonitor']:
+        """Moniteur décrit par la clé detection.safety de la config, None s'il n'est pas actif."""
+        safety_config = safety_config or {}
+        if not safety_config.get("active"):
+            return None
+        return cls(detection_manager, asserv, period=safety_config.get("period", DEFAULT_PERIOD),
+                   clock=clock, metrics=metrics)
+
+    def start(self) -> None:
+        self.logger.info(f"Surveillance des SRF toutes les {self.period * 1000:.1f} ms")
+        self.running = True
+        self.thread = self.clock.start_thread(self._run)
+
+    def stop(self) -> None:
+        self.running = False
+
+    def _run(self) -> None:
+        while self.running:
+            self.check()
+            self.clock.sleep(self.period)
+
+    def check(self) -> Optional[MovementDirection]:
+        """
+        Une vérification : arrête l'asserv si un obstacle est dans le sens du déplacement.
+
+        Returns:
+            MovementDirection: Sens du déplacement interrompu, None si rien n'a été détecté.
+        """
+        if self._triggered is not None:
+            return None
+        direction = self.asserv.direction
+        if direction not in (MovementDirection.FORWARD, MovementDirection.BACKWARD):
+            return None
+
+        start = time.perf_counter()
+        if direction == MovementDirection.FORWARD:
+            detected = self.detection_manager.is_emergency_detection_front(True)
+        else:
+            detected = self.detection_manager.is_emergency_detection_back(True)
+        if not detected:
+            self.metrics.histogram("safety.check").record(time.perf_counter() - start)
+            return None
+
+        self.asserv.emergency_stop()
+        self.metrics.histogram("detection.halt_latency").record(time.perf_counter() - start)
+        with self._lock:
+            self._triggered = direction
+        self.logger.info(f"Arrêt d'urgence ({direction.name})")
+        return direction
+
+    def acknowledge(self) -> Optional[MovementDirection]:
+        """Sens du déplacement interrompu depuis le dernier appel (None si aucun) ; réarme le moniteur."""
+        with self._lock:
+            direction, self._triggered = self._triggered, None
+        return direction
@@ -1,7 +1,14 @@
 import json
-from typing import Optional
+import logging
+import os
+from typing import Dict, List, Optional
 
+from ia.asservissement.trajectory_estimator import TrajectoryEstimator
+from ia.strategy.compiled_strategy import load_compiled_strategy
+from ia.strategy.flag_registry import FLAG_REGISTRY, FlagRegistry
 from ia.strategy.objective import Objective
+from ia.strategy.objective_scheduler import ObjectiveScheduler
+from ia.utils.position import Position
 from ia.utils.robot import Robot
 
 
@@ -14,23 +21,62 @@ class StrategyManager:
         year (int): The year of the strategy configuration.
         robot (Robot): The robot type.
         objectives (list): A list of objectives to be performed.
-        action_flags (list): A list of action flags.
+        action_flags (FlagSet): The active action flags, as a bitmask on the flag registry.
         action_finished (dict): A dictionary to track the completion status of actions.
+        scheduler (ObjectiveScheduler): Optional scheduler choosing objectives by points per second.
     """
 
-    def __init__(self, year: int, robot: Robot) -> None:
+    def __init__(
+        self,
+        year: int,
+        robot: Robot,
+        scheduler_config: Optional[Dict] = None,
+        estimator: Optional[TrajectoryEstimator] = None,
+        flag_registry: Optional[FlagRegistry] = None,
+    ) -> None:
         """
         Initialize the StrategyManager.
 
         Args:
             year (int): The year of the strategy configuration.
+            scheduler_config (dict, optional): The "strategyScheduler" configuration. When absent or
+                inactive, objectives are performed in file order.
+            estimator (TrajectoryEstimator, optional): Travel time model used by the scheduler.
+            flag_registry (FlagRegistry, optional): Interns flag names and compiles needed_flag
+                conditions, the shared registry by default.
         """
         self.current_index = 0
         self.year = year
         self.robot = robot
         self.objectives = []
-        self.action_flags = []
+        self.objectives_done = []
+        self.flag_registry = flag_registry if flag_registry is not None else FLAG_REGISTRY
+        self.action_flags = self.flag_registry.flag_set()
         self.action_finished = {}
+        self.scheduler = None
+        if scheduler_config is not None and scheduler_config.get('active', False):
+            self.scheduler = ObjectiveScheduler(estimator)
+        self._chain_index: Optional[int] = None
+        # Objectifs des deux couleurs, chargés avant le choix de la couleur (preload)
+        self._color_objectives: Optional[Dict[str, List[Objective]]] = None
+        self.logger = logging.getLogger(__name__)
+
+    def preload(self) -> None:
+        """
+        Load the objectives of both colors, from the compiled strategy (strategy.cbor) when it is
+        up to date, from strategy.json otherwise. Meant to be called at boot, before the color is
+        known, so that prepare_objectives is instant.
+        """
+        folder = os.path.join('config', str(self.year), self.robot.value)
+        self._color_objectives = load_compiled_strategy(folder, self.flag_registry)
+        if self._color_objectives is None:
+            self.logger.info("No up to date compiled strategy, loading strategy.json")
+            with open(os.path.join(folder, 'strategy.json')) as strategy_file:
+                strategy = json.load(strategy_file)
+            self._color_objectives = {
+                color: [Objective(objective_config, self.flag_registry) for objective_config in strategy.get(color, [])]
+                for color in ('color0', 'color3000')
+            }
 
     def prepare_objectives(self, is_color0: bool) -> None:
         """
@@ -39,12 +85,12 @@ class StrategyManager:
         Args:
             is_color0 (bool): Determines which color strategy to load.
         """
-        with open(f'config/{self.year}/{self.robot.value}/strategy.json') as strategy_file:
-            strategy = json.load(strategy_file).get('color0' if is_color0 else 'color3000')
-            strategy_file.close()
-            for objective_config in strategy:
-                self.objectives.append(Objective(objective_config))
-                self.action_finished[objective_config.get('id')] = False
+        if self._color_objectives is None:
+            self.preload()
+        for objective in self._color_objectives['color0' if is_color0 else 'color3000']:
+            self.objectives.append(objective)
+            self.objectives_done.append(False)
+            self.action_finished[objective.id] = False
 
     def __str__(self) -> str:
         return (f"StrategyManager(year={self.year}, current_index={self.current_index}, objectives={self.objectives}, "
@@ -52,38 +98,95 @@ class StrategyManager:
 
     def add_action_flag(self, flag: str) -> None:
         """
-        Add an action flag to the action_flags list.
+        Add an action flag to the active flags.
 
         Args:
             flag (str): The action flag to be added.
         """
-        if flag not in self.action_flags:
-            self.action_flags.append(flag)
+        self.action_flags.add(flag)
 
     def remove_action_flag(self, flag: str) -> None:
         """
-        Remove an action flag from the action_flags list if present.
+        Remove an action flag from the active flags if present.
 
         Args:
             flag (str): The action flag to be removed.
         """
-        if flag in self.action_flags:
-            self.action_flags.remove(flag)
+        self.action_flags.discard(flag)
 
-    def get_next_objective(self) -> Optional[Objective]:
+    def peek_next_objective(self) -> Optional[Objective]:
+        """
+        The objective get_next_objective would return with the current flags, without consuming it.
+        Only known in advance without scheduler (file order), None otherwise.
         """
-        Get the next objective to perform, skipping those whose needed_flag is missing.
+        if self.scheduler is not None:
+            return None
+        for objective in self.objectives[self.current_index:]:
+            if self.action_flags.satisfies(objective.condition):
+                return objective
+        return None
+
+    def get_next_objective(
+        self,
+        position: Optional[Position] = None,
+        pathfinding=None,
+        elapsed_time: float = 0,
+        remaining_time: Optional[float] = None,
+        action_durations: Optional[Dict[str, float]] = None,
+    ) -> Optional[Objective]:
+        """
+        Get the next objective to perform, skipping those whose needed_flag condition is not met.
+
+        Without scheduler (or without position), objectives are walked in file order. With the
+        scheduler, the objective with the best points per estimated second is chosen among those
+        fitting in the remaining match time.
+
+        Args:
+            position (Position, optional): The current position of the robot.
+            pathfinding (VisibilityGraph, optional): Used to estimate the first travel of each objective.
+            elapsed_time (float): Time elapsed since the beginning of the match in seconds.
+            remaining_time (float, optional): Remaining match time in seconds, used as a hard budget.
+            action_durations (dict, optional): Measured action durations in seconds by action id.
 
         Returns:
             objective | None: The next objective to perform or None if all objectives are finished.
         """
-        # TODO: Devenir intelligent avec gestion des priorités, etc.
-
-        while self.current_index < len(self.objectives):
-            next_objective = self.objectives[self.current_index]
-            self.current_index += 1
-            if next_objective.needed_flag is not None and next_objective.needed_flag not in self.action_flags:
-                continue
-            return next_objective
-
-        return None
\ No newline at end of file
+        if self.scheduler is None or position is None:
+            while self.current_index < len(self.objectives):
+                next_objective = self.objectives[self.current_index]
+                self.objectives_done[self.current_index] = True
+                self.current_index += 1
+                if not self.action_flags.satisfies(next_objective.condition):
+                    continue
+                return next_objective
+            return None
+
+        # Une chaîne entamée (objectif à 0 point) se poursuit dans l'ordre du fichier
+        index = self._chain_index
+        if index is not None:
+            objective = self.objectives[index]
+            if not self.action_flags.satisfies(objective.condition):
+                index = None
+        if index is None:
+            index = self.scheduler.select(
+                objectives=self.objectives,
+                done=self.objectives_done,
+                flags=self.action_flags,
+                position=position,
+                pathfinding=pathfinding,
+                elapsed_time=elapsed_time,
+                remaining_time=remaining_time,
+                action_durations=action_durations,
+            )
+        if index is None:
+            return None
+
+        self.objectives_done[index] = True
+        objective = self.objectives[index]
+        self._chain_index = None
+        if not objective.points:
+            self._chain_index = next(
+                (i for i in range(index + 1, len(self.objectives)) if not self.objectives_done[i]), None
+            )
+        self.logger.info(f"Scheduler selected objective {objective.description}")
+        return objective
\ No newline at end of file
@@ -1,25 +1,35 @@
 import logging
 import logging.handlers
+import math
+import threading
 import time
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Tuple
 
 from ia.api.chrono import Chrono
 from ia.api.color_selector import ColorSelector
 from ia.api.nextion_nx32224t024 import NextionNX32224T024
 from ia.api.pull_cord import PullCord
+from ia.api.telemetry import TelemetrySender
 from ia.asservissement.asserv_status import AsservStatus
+from ia.asservissement.movement_direction import MovementDirection
 from ia.manager.action_manager import ActionManager
 from ia.manager.communication_manager import CommunicationManager
 from ia.manager.detection_manager import DetectionManager
 from ia.manager.movement_manager import MovementManager
+from ia.manager.safety_monitor import SafetyMonitor
 from ia.manager.strategy_manager import StrategyManager
 from ia.pathfinding.visibility_graph import VisibilityGraph
 from ia.strategy.objective import Objective
 from ia.strategy.step import Step
 from ia.strategy.step_sub_type import StepSubType
 from ia.strategy.step_type import StepType
+from ia.utils.clock import Clock, SYSTEM_CLOCK
+from ia.utils.metrics import METRICS, MetricsRegistry
 from ia.utils.position import Position
 
+# Écart (mm) toléré entre le départ d'une trajectoire pré-calculée et la position réelle du robot
+DEFAULT_LOOKAHEAD_TOLERANCE = 50
+
 
 class MasterLoop:
 
@@ -38,7 +48,12 @@ class MasterLoop:
         pull_cord: PullCord,
         nextion_display: Optional[NextionNX32224T024],
         color_selector: Optional[ColorSelector],
-        step_by_step: bool = False
+        step_by_step: bool = False,
+        telemetry: Optional[TelemetrySender] = None,
+        clock: Optional[Clock] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        safety_monitor: Optional[SafetyMonitor] = None,
+        lookahead_config: Optional[Dict] = None
     ) -> None:
         self.comm_config = comm_config
         self.communication_manager = None
@@ -58,7 +73,33 @@ class MasterLoop:
         self.logger = logging.getLogger(__name__)
 
         self.step_by_step = step_by_step
+        self.telemetry = telemetry
+        self.clock = clock if clock is not None else SYSTEM_CLOCK
+        self.metrics = metrics if metrics is not None else METRICS
+        self._last_iteration: Optional[float] = None
+        # Arrêt d'urgence sur les SRF hors de la boucle principale (sinon vérifié à chaque itération)
+        self.safety_monitor = safety_monitor
+        # Échéance (horloge de l'IA, s) de la step WAIT en cours
+        self.wait_deadline: Optional[float] = None
         self.something_detected = False
+        # Compteurs du match (arrêts d'urgence SRF, recalculs de trajectoire)
+        self.emergency_stops = 0
+        self.replans = 0
+        # Lookahead : trajectoire du prochain GOTO_ASTAR calculée pendant la step courante, actions
+        # instant_return suivies en parallèle des steps suivantes
+        lookahead_config = lookahead_config or {}
+        self.lookahead = bool(lookahead_config.get("active", False))
+        self.lookahead_tolerance = lookahead_config.get("pathTolerance", DEFAULT_LOOKAHEAD_TOLERANCE)
+        # Calcul lancé par la lookahead : (but, départ, version des zones, zones libérées d'ici là)
+        self._prefetch_request: Optional[Tuple[Position, Position, int, Tuple[str, ...]]] = None
+        # Résultat du calcul, écrit par le thread de la lookahead : (requête, chemin, durée du calcul en s)
+        self._prefetched_path: Optional[Tuple[tuple, List[Position], float]] = None
+        self._prefetch_lock = threading.Lock()
+        self._prefetch_step: Optional[Step] = None
+        # Temps gagné (s) par la lookahead sur l'objectif en cours
+        self._objective_saved = 0.0
+        # Objectifs terminés : (description, instant chrono en s, points, temps gagné par la lookahead en s)
+        self.completed_objectives: List[Tuple[str, float, int, float]] = []
         self.moving_forward = False
         self.is_color0 = True
 
@@ -99,7 +140,8 @@ class MasterLoop:
 
         self.pathfinding = VisibilityGraph(
             table_config=self.table_config,
-            active_color=color
+            active_color=color,
+            metrics=self.metrics
         )
         self.logger.info("Initialisation du pathfinding OK")
 
@@ -110,7 +152,8 @@ class MasterLoop:
             self.communication_manager = CommunicationManager(
                 action_manager=self.action_manager,
                 pathfinding=self.pathfinding,
-                comm_config=self.comm_config
+                comm_config=self.comm_config,
+                clock=self.clock
             )
             self.logger.info("Initialisation du communication manager OK")
 
@@ -123,10 +166,11 @@ class MasterLoop:
         self.logger.info(f"Stratégie chargée : {len(self.strategy_manager.objectives)} objectifs")
 
         # Prepare first objective and strategy
-        self.current_objective = self.strategy_manager.get_next_objective()
+        self.current_objective = self.next_objective()
         self.current_step = self.current_objective.get_next_step(self.strategy_manager.action_flags)
         self.logger.info(f"Premier Objectif : {self.current_objective}")
         self.logger.info(f"Première Step : {self.current_step}")
+        self._send_step_telemetry()
 
         self.logger.info("Prêt pour départ")
         if self.nextion_display is not None:
@@ -140,6 +184,8 @@ class MasterLoop:
         and action supervisor, updates the score with any funny actions, and sets the interrupted flag.
         """
         self.logger.info("Fin du match")
+        if self.safety_monitor is not None:
+            self.safety_monitor.stop()
         # Stop the asservissement here
         self.logger.info("Arrêt asservissement")
         self.movement_manager.halt_asserv(False)
@@ -151,6 +197,10 @@ class MasterLoop:
         self.interrupted = True
         self.update_score()
 
+        self.logger.info("Métriques du match :")
+        for line in self.metrics.summary():
+            self.logger.info(f"  {line}")
+
     def update_score(self) -> None:
         """
         Update the score displayed on the Nextion display.
@@ -158,17 +208,180 @@ class MasterLoop:
         if self.nextion_display is not None:
             self.nextion_display.display_score(self.score)
 
+    def next_objective(self) -> Optional[Objective]:
+        """
+        Ask the strategy manager for the next objective, giving it what it needs to schedule them.
+        """
+        started = self.chrono.timestamp_start is not None
+        return self.strategy_manager.get_next_objective(
+            position=self.movement_manager.current_position(),
+            pathfinding=self.pathfinding,
+            elapsed_time=self.chrono.get_time_since_beginning() if started else 0,
+            remaining_time=self.chrono.get_remaining_time(),
+            action_durations=self.action_manager.action_durations
+        )
+
+    def _send_step_telemetry(self) -> None:
+        """
+        Envoie la step courante sur le flux de télémétrie (codes = rang dans l'enum + 1, 0 si absent).
+        """
+        if self.telemetry is None or self.current_objective is None or self.current_step is None:
+            return
+        step_type = list(StepType).index(self.current_step.action_type) + 1 if self.current_step.action_type else 0
+        sub_type = list(StepSubType).index(self.current_step.sub_type) + 1 if self.current_step.sub_type else 0
+        self.telemetry.step(
+            self.current_objective.id,
+            self.current_objective.step_index,
+            step_type,
+            sub_type,
+            self.score
+        )
+
+    def _adversaries(self) -> list:
+        adversaries = list(self.detection_manager.get_lidar_detected_points())
+        if self.communication_manager is not None:
+            adversaries += self.communication_manager.get_teammate_obstacles()
+        return adversaries
+
     def compute_astar(self, goal: Position) -> None:
         """
         Compute the pathfinding path (synchronous) and execute the resulting movement.
+        The path computed in advance by the lookahead is used instead when it is still valid.
         """
-        self.pathfinding.compute_path(
-            start=self.movement_manager.current_position(),
-            goal=goal,
-            adversaries=self.detection_manager.get_lidar_detected_points()
-        )
+        path = self._take_prefetched_path(goal)
+        if path is None:
+            self.pathfinding.compute_path(
+                start=self.movement_manager.current_position(),
+                goal=goal,
+                adversaries=self._adversaries()
+            )
+            path = self.pathfinding.path
         self.logger.info("Pathfinding terminé")
-        self.movement_manager.execute_movement(self.pathfinding.path)
+        self.movement_manager.execute_movement(path)
+
+    # Steps qui ne déplacent pas le robot (ni ne bloquent de chemin) entre la step courante et le GOTO_ASTAR visé
+    _STATIC_SUB_TYPES = (StepSubType.FACE, StepSubType.SET_SPEED, StepSubType.WAIT, StepSubType.WAIT_CHRONO,
+                         StepSubType.RESET_FLAG, StepSubType.DELETE_ZONE, StepSubType.NONE, None)
+
+    @staticmethod
+    def _step_end_position(step: Step, current_position: Position) -> Optional[Position]:
+        """Position du robot à la fin de step, None si elle n'est pas connue à l'avance (recalage, GO_TIMED...)."""
+        if step.action_type == StepType.MANIPULATION or step.sub_type in MasterLoop._STATIC_SUB_TYPES:
+            return Position(current_position.x, current_position.y)
+        if step.sub_type in (StepSubType.GOTO, StepSubType.GOTO_BACK, StepSubType.GOTO_CHAIN, StepSubType.GOTO_ASTAR):
+            return Position(step.position.x, step.position.y)
+        if step.sub_type == StepSubType.GO:
+            # Appelé juste après le lancement du GO : la pose courante est encore celle du départ
+            return Position(int(current_position.x + step.distance * math.cos(current_position.theta)),
+                            int(current_position.y + step.distance * math.sin(current_position.theta)))
+        return None
+
+    def _next_astar_step(self) -> Tuple[Optional[Step], List[str]]:
+        """
+        Prochain GOTO_ASTAR, dans l'objectif courant ou au début du prochain objectif (s'il est connu à
+        l'avance), si seules des steps qui ne déplacent pas le robot l'en séparent (None sinon), et les
+        zones libérées (DELETE_ZONE) d'ici là.
+        """
+        released_zones = []
+        flags = self.strategy_manager.action_flags
+        upcoming = self.current_objective.step_list[self.current_objective.step_index + 1:]
+        next_objective = self.strategy_manager.peek_next_objective()
+        if next_objective is not None:
+            upcoming = upcoming + next_objective.step_list
+        for step in upcoming:
+            if not flags.satisfies(step.condition):
+                continue
+            if step.action_type == StepType.MOVEMENT and step.sub_type == StepSubType.GOTO_ASTAR:
+                return step, released_zones
+            if step.action_type != StepType.MANIPULATION and step.sub_type not in self._STATIC_SUB_TYPES:
+                return None, []
+            if step.sub_type == StepSubType.DELETE_ZONE:
+                released_zones.append(step.item_id)
+        return None, []
+
+    def _prefetch_next_path(self) -> None:
+        """
+        Lookahead : une fois par step, lance dans un thread le calcul de la trajectoire du prochain
+        GOTO_ASTAR depuis la position de fin de la step courante, pendant que celle-ci s'exécute. Un
+        calcul déjà lancé vers le même but depuis le même départ est gardé.
+
+        Le calcul se fait sur une copie du graphe, où les zones libérées d'ici là par des DELETE_ZONE
+        sont déjà désactivées : le pathfinding du robot n'est pas modifié (la zone est encore occupée),
+        la trajectoire n'est utilisée que si ces zones ont réellement été libérées entre-temps.
+        """
+        if self._prefetch_step is self.current_step:
+            return
+        self._prefetch_step = self.current_step
+        next_step, released_zones = self._next_astar_step()
+        start = self._step_end_position(self.current_step, self.movement_manager.current_position())
+        if next_step is None or start is None:
+            with self._prefetch_lock:
+                self._prefetch_request = self._prefetched_path = None
+            return
+        request = self._prefetch_request
+        if request is not None:
+            goal, prefetched_start, zones_version, _ = request
+            if (goal == next_step.position and zones_version == self.pathfinding.zones_version
+                    and math.hypot(start.x - prefetched_start.x, start.y - prefetched_start.y) <= self.lookahead_tolerance):
+                return
+        graph = self.pathfinding.copy()
+        request = (next_step.position, start, self.pathfinding.zones_version, tuple(released_zones))
+        adversaries = self._adversaries()
+        with self._prefetch_lock:
+            self._prefetch_request = request
+            self._prefetched_path = None
+        self.clock.start_thread(lambda: self._compute_prefetched_path(graph, request, adversaries))
+
+    def _compute_prefetched_path(self, graph: VisibilityGraph, request: tuple, adversaries: list) -> None:
+        """Thread de la lookahead : calcule la trajectoire de request sur graph (copie du pathfinding)."""
+        goal, start, _, released_zones = request
+        compute_start = time.perf_counter()
+        for zone_id in released_zones:
+            graph.update_dynamic_zone(zone_id, False)
+        graph.compute_path(start=start, goal=goal, adversaries=adversaries)
+        duration = time.perf_counter() - compute_start
+        with self._prefetch_lock:
+            # Résultat ignoré si un autre calcul a été demandé entre-temps
+            if self._prefetch_request is request and graph.path:
+                self._prefetched_path = (request, list(graph.path), duration)
+
+    def _take_prefetched_path(self, goal: Position) -> Optional[List[Position]]:
+        """
+        Trajectoire pré-calculée vers goal si elle est prête et encore valable : même but, zones
+        inchangées, zones supposées libérées effectivement désactivées, robot près du départ prévu
+        et trajectoire libre d'après le lidar.
+        """
+        with self._prefetch_lock:
+            request, prefetched = self._prefetch_request, self._prefetched_path
+            self._prefetch_request = self._prefetched_path = None
+        if request is None:
+            return None
+        if prefetched is None:
+            # Calcul pas encore terminé (ou sans chemin) : le chemin est calculé normalement
+            self.metrics.counter("lookahead.path_misses").inc()
+            return None
+        (prefetched_goal, start, zones_version, released_zones), path, duration = prefetched
+        position = self.movement_manager.current_position()
+        if (prefetched_goal != goal or zones_version != self.pathfinding.zones_version
+                or any(self.pathfinding.is_zone_active(zone_id) for zone_id in released_zones)
+                or math.hypot(position.x - start.x, position.y - start.y) > self.lookahead_tolerance
+                or self.detection_manager.is_trajectory_blocked(path[1:])):
+            self.metrics.counter("lookahead.path_misses").inc()
+            return None
+        self.logger.info("Trajectoire pré-calculée par la lookahead")
+        self.metrics.counter("lookahead.path_hits").inc()
+        self.metrics.histogram("lookahead.path_prefetch").record(duration)
+        self._objective_saved += duration
+        return path
+
+    def _collect_overlapped_actions(self) -> None:
+        """Flags et durée des actions instant_return terminées en parallèle des steps suivantes."""
+        for action_id, duration, flags in self.action_manager.poll_overlapped_actions():
+            for flag in flags:
+                self.strategy_manager.add_action_flag(flag)
+            # Durée qui aurait été attendue sans recouvrement, comptée sur l'objectif en cours
+            self.metrics.histogram("lookahead.overlap").record(duration)
+            self._objective_saved += duration
 
     def execute_current_step(self) -> None:
         """
@@ -186,10 +399,15 @@ class MasterLoop:
         elif self.current_step.action_type == StepType.MANIPULATION:
             self.logger.info(f"Manipulation id : {self.current_step.id_action}")
             self.action_manager.execute_command(self.current_step.id_action)
+            if self.lookahead and self.current_step.instant_return:
+                self.action_manager.detach_current_action()
         elif self.current_step.action_type == StepType.MOVEMENT:
             self.logger.info(f"Déplacement {self.current_step.sub_type}")
             if self.current_step.sub_type == StepSubType.GOTO_ASTAR:
                 self.compute_astar(self.current_step.position)
+            elif self.current_step.sub_type == StepSubType.WAIT:
+                # Attente non bloquante : la boucle continue de surveiller capteurs et communications
+                self.wait_deadline = self.clock.now() + self.current_step.timeout / 1000
             elif self.current_step.sub_type == StepSubType.GOTO_CHAIN:
                 self.logger.info("Goto chain")
                 path: list[Position] = []
@@ -232,13 +450,9 @@ class MasterLoop:
         """
         step_type: StepType = self.current_step.action_type
         if step_type == StepType.MOVEMENT and self.current_step.sub_type == StepSubType.WAIT_CHRONO:
-            return (self.current_step.timeout * 1000) <= self.chrono.get_time_since_beginning()
+            return self.current_step.timeout <= self.chrono.get_time_since_beginning()
         elif step_type == StepType.MOVEMENT and self.current_step.sub_type == StepSubType.WAIT:
-            try:
-                time.sleep(self.current_step.timeout // 1000)
-            except InterruptedError as e:
-                self.logger.error(e)
-            return True
+            return self.wait_deadline is None or self.wait_deadline <= self.clock.now()
         elif step_type == StepType.MOVEMENT and self.movement_manager.is_last_ordered_movement_ended():
             return True
         elif step_type == StepType.MANIPULATION:
@@ -254,21 +468,44 @@ class MasterLoop:
         return False
 
     def must_stop_from_emergency_detection(self) -> bool:
+        if self.safety_monitor is not None:
+            # L'arrêt a déjà été envoyé par le moniteur de sécurité, on en prend acte
+            direction = self.safety_monitor.acknowledge()
+            if direction is None:
+                return False
+            self.logger.info("Détection avant" if direction == MovementDirection.FORWARD else "Détection arrière")
+            self.emergency_stops += 1
+            self.metrics.counter("detection.emergency_stops").inc()
+            self.movement_manager.halt_asserv(True)
+            self.moving_forward = direction == MovementDirection.FORWARD
+            self.something_detected = True
+            return True
+
         # On vérifie la détection courte portée des SRF
+        start = time.perf_counter()
         if self.detection_manager.is_emergency_detection_front():
             self.logger.info("Détection avant")
+            self.emergency_stops += 1
             self.movement_manager.halt_asserv(True)
+            self._record_halt(start)
             self.moving_forward = True
             self.something_detected = True
             return True
         elif self.detection_manager.is_emergency_detection_back():
             self.logger.info("Détection arrière")
+            self.emergency_stops += 1
             self.movement_manager.halt_asserv(True)
+            self._record_halt(start)
             self.moving_forward = False
             self.something_detected = True
             return True
         return False
 
+    def _record_halt(self, detection_start: float) -> None:
+        """Latence entre la lecture des capteurs et l'envoi de l'arrêt d'urgence à l'asserv."""
+        self.metrics.histogram("detection.halt_latency").record(time.perf_counter() - detection_start)
+        self.metrics.counter("detection.emergency_stops").inc()
+
     def _wait_for_keypress(self) -> None:
         self.logger.info("[STEP-BY-STEP] Appuyez sur une touche pour continuer...")
         input()
@@ -286,6 +523,14 @@ class MasterLoop:
             self.logger.info(
                 f"Objectif terminé : {self.current_objective.description} - {self.current_objective.points}")
             self.score += self.current_objective.points
+            self.completed_objectives.append((self.current_objective.description,
+                                              self.chrono.get_time_since_beginning(),
+                                              self.current_objective.points,
+                                              self._objective_saved))
+            if self.lookahead:
+                self.logger.info(f"Temps gagné par la lookahead : {self._objective_saved * 1000:.1f} ms")
+                self.metrics.histogram("lookahead.saved_per_objective").record(self._objective_saved)
+            self._objective_saved = 0.0
             self.update_score()
 
             if self.current_objective is not None and self.current_objective.action_flag is not None:
@@ -297,7 +542,7 @@ class MasterLoop:
                     self.logger.info(f"Retrait de l'action flag : {flag}")
                     self.strategy_manager.remove_action_flag(flag)
 
-            self.current_objective = self.strategy_manager.get_next_objective()
+            self.current_objective = self.next_objective()
             if self.current_objective is None:
                 self.logger.info("Plus d'objectif, fin du match")
                 self.interrupted = True
@@ -305,6 +550,7 @@ class MasterLoop:
                 self.logger.info(f"Prochain Objectif : {self.current_objective.description}")
                 self.current_step = self.current_objective.get_next_step(self.strategy_manager.action_flags)
                 self.logger.info(f"Première Step : {self.current_step.description}")
+        self._send_step_telemetry()
         self.execute_current_step()
 
     def check_detection_status(self) -> None:
@@ -323,51 +569,83 @@ class MasterLoop:
         # Attente lancement du match en retirant la tirette
         self.logger.info("Attente lancement match")
         self.pull_cord.wait_for_state(False)
+        self.start_match()
+
+        # Boucle principale
+        while not self.interrupted:
+            self.loop_iteration()
+            # On laisse souffler le CPU mais pas trop
+            self.clock.sleep(0.001)
+
+        self.logger.info("Fin de la boucle principale")
+        self.logger.info(f"Score final : {self.score}")
+        self.logger.info(f"Temps restant : {self.chrono}")
 
-        # Lancement du match
+    def start_match(self) -> None:
+        """
+        Start the chrono and the first step, once the pull cord has been removed.
+        """
         self.logger.info("Match lancé")
         self.chrono.start_match(self.match_end)
         if self.nextion_display is not None:
             self.nextion_display.goto_page("score")
         self.movement_manager.is_match_started = True
+        if self.safety_monitor is not None:
+            self.safety_monitor.start()
         self.execute_current_step()
         self.update_score()
 
-        # Boucle principale
-        while not self.interrupted:
-
-            # Si pas d'obstacle détecté par les SRF
-            if not self.something_detected:
-
-                # On vérifie la détection courte portée des SRF
-                if self.must_stop_from_emergency_detection():
-                    continue
-
-                if self.current_step_ended():
-                    # On passe à la strategy ou l'objectif suivant
-                    self.update_step()
-                else:
-                    if (self.movement_manager.asserv.asserv_status == AsservStatus.STATUS_BLOCKED
-                            and (self.current_step.sub_type != StepSubType.GO or self.current_step.timeout == 0)):
-                        self.logger.info("Asserv bloquée")
-                    elif (self.current_step.sub_type == StepSubType.GOTO_ASTAR
-                          and self.detection_manager.is_trajectory_blocked(self.movement_manager.goto_queue)):
-                        self.logger.info("Trajectoire bloquée, lancement nouveau calcul de trajectoire")
-                        self.movement_manager.halt_asserv(False)
-                        self.movement_manager.resume_asserv()
-                        self.execute_current_step()
-
-            # Si obstacle détecté par les SRF
+    def loop_iteration(self) -> None:
+        """
+        One iteration of the main loop: detection, step transitions and communications.
+        """
+        # Période de la boucle (horloge de l'IA) et durée de l'itération (temps réel)
+        now = self.clock.now()
+        if self._last_iteration is not None:
+            self.metrics.histogram("master_loop.period").record(now - self._last_iteration)
+        self._last_iteration = now
+        with self.metrics.timer("master_loop.iteration"):
+            self._loop_iteration()
+
+    def _loop_iteration(self) -> None:
+        if self.lookahead:
+            self._collect_overlapped_actions()
+
+        # Si pas d'obstacle détecté par les SRF
+        if not self.something_detected:
+
+            # On vérifie la détection courte portée des SRF
+            if self.must_stop_from_emergency_detection():
+                return
+
+            if self.current_step_ended():
+                # On passe à la strategy ou l'objectif suivant
+                self.update_step()
             else:
-                self.check_detection_status()
+                if (self.movement_manager.asserv.asserv_status == AsservStatus.STATUS_BLOCKED
+                        and (self.current_step.sub_type != StepSubType.GO or self.current_step.timeout == 0)):
+                    self.logger.info("Asserv bloquée")
+                elif (self.current_step.sub_type == StepSubType.GOTO_ASTAR
+                      and self.detection_manager.is_trajectory_blocked(self.movement_manager.goto_queue)):
+                    self.logger.info("Trajectoire bloquée, lancement nouveau calcul de trajectoire")
+                    self.replans += 1
+                    self.metrics.counter("pathfinding.replans").inc()
+                    self.movement_manager.halt_asserv(False)
+                    self.movement_manager.resume_asserv()
+                    self.execute_current_step()
+                elif self.lookahead:
+                    self._prefetch_next_path()
+
+        # Si obstacle détecté par les SRF
+        else:
+            self.check_detection_status()
 
-            if self.communication_manager is not None:
+        if self.communication_manager is not None:
+            with self.metrics.timer("comm.cycle"):
                 # On check les communications serveurs
                 self.communication_manager.read_from_server()
-
-            # On laisse souffler le CPU mais pas trop
-            time.sleep(0.001)
-
-        self.logger.info("Fin de la boucle principale")
-        self.logger.info(f"Score final : {self.score}")
-        self.logger.info(f"Temps restant : {self.chrono}")
\ No newline at end of file
+                # On partage notre position et notre trajectoire avec les coéquipiers
+                self.communication_manager.publish_state(
+                    self.movement_manager.current_position(),
+                    self.movement_manager.goto_queue
+                )
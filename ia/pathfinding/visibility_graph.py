@@ -7,6 +7,7 @@ from typing import Dict, List, Optional, Set, Tuple
 from shapely.geometry import LineString, Point, Polygon
 from shapely.ops import unary_union
 
+from ia.utils.metrics import METRICS, MetricsRegistry
 from ia.utils.position import Position
 
 # Type aliases
@@ -49,21 +50,35 @@ class VisibilityGraph:
         Les adversaires optionnels filtrent les edges bloqués et ajoutent
         leurs propres sommets, sans modifier le cache.
 
+    Optimisation en temps (paramètres "pathfinding" de la config robot)
+        turnCost           : pénalité en mm par radian de changement de cap à chaque
+                             waypoint. > 0 → Dijkstra sur les arcs (sommet, précédent)
+                             pour préférer les trajets avec moins de virages.
+        collinearTolerance : écart max (mm) d'un waypoint à la droite de ses voisins
+                             pour le fusionner, si le raccourci reste visible.
+
     Interface publique
         compute_path(start, goal, adversaries=None)
         update_dynamic_zone(zone_id, active)
+        is_zone_active(zone_id)
         path  (List[Position])
     """
 
     ADVERSARY_RADIUS = 200  # mm
 
-    def __init__(self, table_config: Dict, active_color: str) -> None:
+    def __init__(self, table_config: Dict, active_color: str, metrics: Optional[MetricsRegistry] = None) -> None:
         self.config = table_config
+        self.metrics = metrics if metrics is not None else METRICS
         self.size_x: int = table_config["sizeX"]
         self.size_y: int = table_config["sizeY"]
         self.marge: int = table_config["marge"]
+        self.turn_cost: float = table_config.get("turnCost", 0.0)
+        self.collinear_tolerance: float = table_config.get("collinearTolerance", 0.0)
         self.active_color = table_config.get(active_color, active_color)  # e.g. 'jaune'
         self.path: List[Position] = []
+        # Incrémenté à chaque activation de zone dynamique : un chemin calculé avant peut la traverser
+        # (une désactivation ne fait que libérer de la place)
+        self.zones_version = 0
         self.logger = logging.getLogger(__name__)
 
         self._table_poly = Polygon([
@@ -94,6 +109,30 @@ class VisibilityGraph:
         self._full_rebuild()
         self.logger.info(f"[VG] Init in {(time.time_ns() - t0) / 1e6:.2f} ms")
 
+    def copy(self) -> 'VisibilityGraph':
+        """
+        Graphe indépendant dans le même état, sans refaire le calcul de visibilité : les géométries
+        (immuables) sont partagées, le graphe courant et l'état des zones dynamiques sont dupliqués.
+        """
+        graph = VisibilityGraph.__new__(VisibilityGraph)
+        graph.__dict__.update(self.__dict__)
+        graph.path = []
+        graph._current_vertices = list(self._current_vertices)
+        graph._cached_graph = {u: dict(nbrs) for u, nbrs in self._cached_graph.items()}
+        graph._dynamic_zones = {zone_id: dict(zdata) for zone_id, zdata in self._dynamic_zones.items()}
+        return graph
+
+    def __getstate__(self) -> Dict:
+        # Transmissible à un autre process (graphe précalculé partagé par la génération des stratégies)
+        state = self.__dict__.copy()
+        del state["logger"], state["metrics"]
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self.logger = logging.getLogger(__name__)
+        self.metrics = METRICS
+
     # ──────────────────────────────────────────────────────────────────
     # Géométrie
     # ──────────────────────────────────────────────────────────────────
@@ -226,6 +265,7 @@ class VisibilityGraph:
         n_v = len(self._current_vertices)
         n_e = len(cached_edges)
         n_r = len(self._restorable_edges)
+        self.metrics.histogram("pathfinding.rebuild").record((time.time_ns() - t0) / 1e9)
         self.logger.info(
             f"[VG] Full rebuild in {(time.time_ns() - t0) / 1e6:.2f} ms — "
             f"{n_v} vertices, {n_e} edges cached, {n_r} restorable"
@@ -282,6 +322,7 @@ class VisibilityGraph:
             existing.append(nv)  # les nouveaux sommets peuvent aussi se voir entre eux
 
         zdata["active"] = False
+        self.metrics.histogram("pathfinding.deactivate").record((time.time_ns() - t0) / 1e9)
         self.logger.info(
             f"[VG] Deactivate '{zone_id}' in {(time.time_ns() - t0) / 1e6:.2f} ms — "
             f"{restored} edges restored, +{len(new_verts)} vertices"
@@ -297,6 +338,7 @@ class VisibilityGraph:
         if zdata is None or zdata["active"] == active:
             return
         if active:
+            self.zones_version += 1
             # Activation (rare) — coût de rebuild accepté
             self.logger.info(f"[VG] Activate '{zone_id}' — full rebuild")
             zdata["active"] = True
@@ -304,6 +346,11 @@ class VisibilityGraph:
         else:
             self._deactivate_zone(zone_id)
 
+    def is_zone_active(self, zone_id: str) -> bool:
+        """True si la zone dynamique existe et bloque encore le passage."""
+        zdata = self._dynamic_zones.get(zone_id)
+        return zdata is not None and zdata["active"]
+
     def compute_path(
         self,
         start: Position,
@@ -316,8 +363,10 @@ class VisibilityGraph:
         Parameters
         ----------
         start, goal : Position (coordonnées en mm)
-        adversaries : list of {"x": int, "y": int}, optionnel
+        adversaries : list of Position ou {"x": int, "y": int, "path": [(x, y)]}, optionnel
             Obstacles circulaires temporaires de rayon ADVERSARY_RADIUS + marge.
+            Avec "path" (coéquipier), le couloir de même largeur le long du chemin prévu est
+            aussi évité, sauf s'il contient le départ ou l'arrivée.
             N'affectent pas le cache.
         """
         self.path = []
@@ -337,12 +386,18 @@ class VisibilityGraph:
                 # ce qui reste une marge de sécurité acceptable.
                 # Les sommets de l'octogone ne sont PAS ajoutés au graphe (évite O(N_adv²)
                 # checks Shapely) ; l'adversaire se contente de filtrer les edges bloqués.
-                adv_polys = [
-                    Point(a["x"], a["y"]).buffer(
-                        self.ADVERSARY_RADIUS + self.marge, resolution=2
-                    )
-                    for a in adversaries
-                ]
+                radius = self.ADVERSARY_RADIUS + self.marge
+                adv_polys = []
+                for a in adversaries:
+                    if isinstance(a, Position):
+                        a = {"x": a.x, "y": a.y}
+                    adv_polys.append(Point(a["x"], a["y"]).buffer(radius, resolution=2))
+                    if len(a.get("path", [])) > 1:
+                        corridor = LineString(a["path"]).buffer(radius, resolution=2)
+                        if corridor.contains(Point(start_pt)) or corridor.contains(Point(goal_pt)):
+                            self.logger.info(f"[VG] Teammate corridor at ({a['x']}, {a['y']}) ignored: contains start or goal")
+                        else:
+                            adv_polys.append(corridor)
                 adv_union = unary_union(adv_polys)
             else:
                 adv_union = None
@@ -412,7 +467,12 @@ class VisibilityGraph:
             self.logger.info(f"[VG] Temp graph in {(time.time_ns() - t0) / 1e6:.2f} ms")
 
             # ── Dijkstra ──────────────────────────────────────────────
-            raw = self._dijkstra(temp, start_pt, goal_pt)
+            if self.turn_cost > 0:
+                raw = self._dijkstra_turns(temp, start_pt, goal_pt, self.turn_cost)
+            else:
+                raw = self._dijkstra(temp, start_pt, goal_pt)
+            if raw and self.collinear_tolerance > 0:
+                raw = self._merge_collinear(raw, adv_union)
             if raw:
                 self.path = [Position(int(round(x)), int(round(y))) for x, y in raw]
                 self.logger.info(f"[VG] Path: {len(self.path)} waypoints")
@@ -422,6 +482,7 @@ class VisibilityGraph:
         except Exception as exc:
             self.logger.error(f"[VG] Error: {exc}", exc_info=True)
         finally:
+            self.metrics.histogram("pathfinding.compute_path").record((time.time_ns() - t0) / 1e9)
             self.logger.info(f"[VG] Total in {(time.time_ns() - t0) / 1e6:.2f} ms")
 
     # ──────────────────────────────────────────────────────────────────
@@ -454,4 +515,70 @@ class VisibilityGraph:
                     prev[neighbor] = node
                     heapq.heappush(heap, (nc, neighbor))
 
-        return None
\ No newline at end of file
+        return None
+
+    @staticmethod
+    def _turn_angle(a: Vertex, b: Vertex, c: Vertex) -> float:
+        """Changement de cap (rad, dans [0, π]) au passage par b sur le trajet a → b → c."""
+        h1 = math.atan2(b[1] - a[1], b[0] - a[0])
+        h2 = math.atan2(c[1] - b[1], c[0] - b[0])
+        return abs(math.atan2(math.sin(h2 - h1), math.cos(h2 - h1)))
+
+    @classmethod
+    def _dijkstra_turns(cls, graph: Graph, start: Vertex, goal: Vertex, turn_cost: float) -> Optional[List[Vertex]]:
+        """
+        Dijkstra sur les états (sommet, sommet précédent) : le coût d'un arc est sa longueur
+        plus turn_cost × angle de virage au sommet de départ.
+        """
+        origin = (start, None)
+        dist: Dict[tuple, float] = {origin: 0.0}
+        prev: Dict[tuple, Optional[tuple]] = {origin: None}
+        # Le compteur départage les égalités sans comparer les états (None non ordonnable)
+        counter = 0
+        heap = [(0.0, counter, origin)]
+        visited: Set[tuple] = set()
+
+        while heap:
+            cost, _, state = heapq.heappop(heap)
+            if state in visited:
+                continue
+            visited.add(state)
+            node, previous = state
+            if node == goal:
+                path: List[Vertex] = []
+                cur: Optional[tuple] = state
+                while cur is not None:
+                    path.append(cur[0])
+                    cur = prev[cur]
+                return list(reversed(path))
+            for neighbor, weight in graph.get(node, {}).items():
+                if neighbor == previous:
+                    continue
+                nc = cost + weight
+                if previous is not None:
+                    nc += turn_cost * cls._turn_angle(previous, node, neighbor)
+                next_state = (neighbor, node)
+                if next_state not in dist or nc < dist[next_state]:
+                    dist[next_state] = nc
+                    prev[next_state] = state
+                    counter += 1
+                    heapq.heappush(heap, (nc, counter, next_state))
+
+        return None
+
+    def _merge_collinear(self, path: List[Vertex], adv_union) -> List[Vertex]:
+        """Supprime les waypoints quasi alignés avec leurs voisins quand le raccourci est libre."""
+        result = [path[0]]
+        for i in range(1, len(path) - 1):
+            a, b, c = result[-1], path[i], path[i + 1]
+            length = math.hypot(c[0] - a[0], c[1] - a[1])
+            if length == 0:
+                continue
+            deviation = abs((c[0] - a[0]) * (a[1] - b[1]) - (a[0] - b[0]) * (c[1] - a[1])) / length
+            if (deviation <= self.collinear_tolerance
+                    and self._is_visible(a, c, self._current_obstacle_union)
+                    and (adv_union is None or self._is_visible(a, c, adv_union))):
+                continue
+            result.append(b)
+        result.append(path[-1])
+        return result
\ No newline at end of file
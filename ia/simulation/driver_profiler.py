@@ -0,0 +1,177 @@
+import argparse
+import json
+import logging
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List
+
+from ia.actions.serial_port import SerialPort
+from ia.api.ax12.ax12_link_serial import AX12LinkSerial
+from ia.api.ax12.ax12_servo import AX12Servo
+from ia.api.ax12.enums.ax12_register import AX12Register
+from ia.api.color_selector import ColorSelector
+from ia.api.detection.lidar.lidar_rpa2 import LidarRpA2
+from ia.api.detection.ultrasound.srf04 import Srf04
+from ia.api.detection.ultrasound.srf08 import Srf08
+from ia.api.nextion_nx32224t024 import NextionNX32224T024
+from ia.api.pull_cord import PullCord
+from ia.asservissement.asserv import Asserv
+from ia.simulation.emulators import (AsservEmulator, AX12BusEmulator, EmulatedBackend, I2CBusEmulator,
+                                     LidarEmulator, LoopbackSerial, ResponderSerial, Srf08Emulator)
+from ia.utils.position import Position
+
+logger = logging.getLogger(__name__)
+
+# Broches et adresses des périphériques émulés
+SRF04_TRIGGER, SRF04_ECHO = 23, 24
+PULL_CORD_PIN, COLOR_SELECTOR_PIN = 17, 27
+SRF08_ADDRESS = 0xE0
+SRF_DISTANCE = 600
+
+
+class DriverProfiler:
+    """
+    Profil des drivers du robot sur un poste de développement : chaque driver tourne tel quel
+    (threads de lecture compris) sur un EmulatedBackend, et on mesure son débit et sa latence.
+        - asserv : trames de position reçues par seconde, latence commande → prise en compte par la carte
+        - AX12 : latence d'une écriture et d'une lecture de registre (timeout de lecture du lien compris)
+        - lidar : trames reçues par seconde et temps d'analyse d'une trame
+        - SRF08 (I2C) et SRF04 (GPIO) : mesures par seconde et distance mesurée
+        - actionneur série, Nextion, tirette et sélecteur de couleur : latence d'un échange
+    """
+
+    def __init__(self, duration: float = 1.0, requests: int = 20) -> None:
+        """
+        Args:
+            duration (float): Durée (s) des mesures de débit.
+            requests (int): Nombre d'échanges des mesures de latence.
+        """
+        self.duration = duration
+        self.requests = requests
+        self.asserv_emulator = AsservEmulator()
+        self.lidar_emulator = LidarEmulator()
+        self.srf08_emulator = Srf08Emulator(SRF_DISTANCE)
+        self.actuator = ResponderSerial()
+        self.backend = EmulatedBackend(
+            serial_devices={
+                "asserv": self.asserv_emulator,
+                "ax12": AX12BusEmulator(),
+                "lidar": self.lidar_emulator,
+                "actuator": self.actuator,
+                "nextion": LoopbackSerial(),
+            },
+            i2c_buses={Srf08.I2C_BUS: I2CBusEmulator({SRF08_ADDRESS >> 1: self.srf08_emulator})},
+        )
+        self.backend.add_srf04(SRF04_TRIGGER, SRF04_ECHO, SRF_DISTANCE)
+        self.asserv = Asserv("asserv", 115200, gostart_config={}, backend=self.backend)
+
+    def run(self) -> Dict:
+        return {
+            "asserv": self.profile_asserv(),
+            "ax12": self.profile_ax12(),
+            "lidar": self.profile_lidar(),
+            "srf08": self.profile_srf08(),
+            "srf04": self.profile_srf04(),
+            "actuator": self.profile_actuator(),
+            "nextion": self.profile_nextion(),
+            "gpio": self.profile_gpio(),
+        }
+
+    def profile_asserv(self) -> Dict:
+        frames = self.asserv_emulator.frames_sent
+        time.sleep(self.duration)
+        frame_rate = (self.asserv_emulator.frames_sent - frames) / self.duration
+
+        def go_to() -> None:
+            self.asserv.go_to(Position(1200, 1600))
+            command_id = self.asserv.last_sent_command_id
+            while self.asserv.last_received_command_id < command_id:
+                time.sleep(0.0001)
+            self.asserv.emergency_stop()
+            self.asserv.emergency_reset()
+
+        return {"frames_per_second": round(frame_rate, 1), "command_latency_ms": self._latency(go_to)}
+
+    def profile_ax12(self) -> Dict:
+        servo = AX12Servo(1, AX12LinkSerial("ax12", 115200, backend=self.backend))
+        return {
+            "write_latency_ms": self._latency(lambda: servo.set_servo_position(512)),
+            "read_latency_ms": self._latency(lambda: servo.read(AX12Register.AX12_RAM_PRESENT_POSITION)),
+        }
+
+    def profile_lidar(self) -> Dict:
+        lidar = LidarRpA2("lidar", 115200, quality=10, distance=2000, period=20, asserv=self.asserv,
+                          backend=self.backend)
+        time.sleep(0.1)
+        bytes_read = lidar.lidar_serial.bytes_read
+        lines = self.lidar_emulator.lines_sent
+        time.sleep(self.duration)
+        line = self.lidar_emulator.line().decode("ascii").strip()
+        return {
+            "lines_per_second": round((self.lidar_emulator.lines_sent - lines) / self.duration, 1),
+            "bytes_per_second": round((lidar.lidar_serial.bytes_read - bytes_read) / self.duration),
+            "parse_latency_ms": self._latency(lambda: LidarRpA2.parse_measures(line, self.asserv.position)),
+        }
+
+    def profile_srf08(self) -> Dict:
+        srf = Srf08("srf08", SRF08_ADDRESS, 0, 0, 0, 300, 3, backend=self.backend)
+        measures = self.srf08_emulator.measures
+        time.sleep(self.duration)
+        return {
+            "measures_per_second": round((self.srf08_emulator.measures - measures) / self.duration, 1),
+            "distance": srf.get_distance(),
+            "expected": SRF_DISTANCE,
+        }
+
+    def profile_srf04(self) -> Dict:
+        srf = Srf04("srf04", SRF04_TRIGGER, SRF04_ECHO, 0, 0, 0, 300, 3, backend=self.backend)
+        time.sleep(self.duration)
+        distance = srf.get_distance()
+        srf.sensor.close()
+        return {"distance": distance, "expected": SRF_DISTANCE}
+
+    def profile_actuator(self) -> Dict:
+        port = SerialPort("actuator", 115200, backend=self.backend)
+        return {"command_latency_ms": self._latency(lambda: port.send("ping", wait_response=True))}
+
+    def profile_nextion(self) -> Dict:
+        nextion = NextionNX32224T024("nextion", 9600, color0="jaune", backend=self.backend)
+        return {"instruction_latency_ms": self._latency(lambda: nextion.display_score(42))}
+
+    def profile_gpio(self) -> Dict:
+        pull_cord = PullCord(PULL_CORD_PIN, backend=self.backend)
+        color_selector = ColorSelector(COLOR_SELECTOR_PIN, backend=self.backend)
+        self.backend.set_button(PULL_CORD_PIN, True)
+        inserted = pull_cord.get_state()
+        self.backend.set_button(PULL_CORD_PIN, False)
+        return {
+            "pull_cord": {"inserted": inserted, "removed": not pull_cord.get_state()},
+            "color_selector": {"is_color0": color_selector.is_color_0()},
+            "read_latency_ms": self._latency(pull_cord.get_state),
+        }
+
+    def _latency(self, exchange: Callable[[], object]) -> Dict:
+        """Latence (ms) moyenne, médiane et max de requests échanges."""
+        latencies: List[float] = []
+        for _ in range(self.requests):
+            start = time.perf_counter()
+            exchange()
+            latencies.append((time.perf_counter() - start) * 1000)
+        return {
+            "mean": round(statistics.fmean(latencies), 3),
+            "median": round(statistics.median(latencies), 3),
+            "max": round(max(latencies), 3),
+        }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Profile les drivers du robot sur des périphériques émulés.")
+    parser.add_argument("--duration", type=float, default=1.0, help="Durée (s) des mesures de débit")
+    parser.add_argument("--requests", type=int, default=20, help="Nombre d'échanges des mesures de latence")
+    parser.add_argument("--log-level", type=str, default="WARNING", help="Niveau de log des drivers")
+    args = parser.parse_args()
+
+    logging.basicConfig(stream=sys.stderr, level=logging.getLevelNamesMapping()[args.log_level.upper()],
+                        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    print(json.dumps(DriverProfiler(duration=args.duration, requests=args.requests).run(), indent=2))
@@ -0,0 +1,325 @@
+import logging
+import math
+import random
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import serial
+from gpiozero.pins.mock import MockFactory, MockTriggerPin
+
+from ia.api.device_backend import DeviceBackend
+from ia.simulation.fake_devices import SimulatedAX12Link
+from ia.simulation.kinematic_asserv import AsservModel
+
+logger = logging.getLogger(__name__)
+
+# Vitesse du son (mm/µs), pour les temps de vol des capteurs ultrason
+SOUND_SPEED = 0.343
+
+
+class LoopbackSerial:
+    """
+    Port série en mémoire, avec l'interface de serial.Serial utilisée par les drivers (read, readline,
+    write, flush, open, close, dtr, rts, in_waiting) et la même sémantique de timeout.
+
+    Les octets écrits par le driver sont passés à handle (réaction du périphérique émulé), les
+    réponses du périphérique sont ajoutées au tampon de lecture avec feed.
+    """
+
+    def __init__(self) -> None:
+        self.timeout: Optional[float] = None
+        self.is_open = True
+        self.dtr = False
+        self.rts = False
+        self.bytes_written = 0
+        self.bytes_read = 0
+        self._rx = bytearray()
+        self._condition = threading.Condition()
+
+    def configure(self, baud_rate: int, **settings) -> 'LoopbackSerial':
+        """Applique les paramètres d'ouverture du driver (seul timeout a un effet)."""
+        self.timeout = settings.get("timeout")
+        return self
+
+    # Interface serial.Serial
+
+    def open(self) -> None:
+        if self.is_open:
+            raise serial.SerialException("Port is already open.")
+        self.is_open = True
+
+    def close(self) -> None:
+        with self._condition:
+            self.is_open = False
+            self._condition.notify_all()
+
+    @property
+    def in_waiting(self) -> int:
+        return len(self._rx)
+
+    def write(self, data: bytes) -> int:
+        self.bytes_written += len(data)
+        self.handle(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def read(self, size: int = 1) -> bytes:
+        """Jusqu'à size octets : attend qu'ils soient tous arrivés ou le timeout, comme pyserial."""
+        return self._read_until(lambda: len(self._rx) >= size, size)
+
+    def readline(self) -> bytes:
+        """Une ligne, fin de ligne comprise (ce qui est arrivé si le timeout expire avant)."""
+        def complete() -> bool:
+            return b"\n" in self._rx
+
+        def length() -> int:
+            end = self._rx.find(b"\n")
+            return end + 1 if end >= 0 else len(self._rx)
+
+        return self._read_until(complete, None, length)
+
+    def _read_until(self, complete: Callable[[], bool], size: Optional[int],
+                    length: Optional[Callable[[], int]] = None) -> bytes:
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        with self._condition:
+            while not complete() and self.is_open:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            count = length() if length is not None else min(size, len(self._rx))
+            data = bytes(self._rx[:count])
+            del self._rx[:count]
+        self.bytes_read += len(data)
+        return data
+
+    # Périphérique émulé
+
+    def feed(self, data: bytes) -> None:
+        """Données envoyées par le périphérique au driver."""
+        with self._condition:
+            self._rx.extend(data)
+            self._condition.notify_all()
+
+    def handle(self, data: bytes) -> None:
+        """Réaction du périphérique aux octets écrits par le driver (rien par défaut)."""
+
+
+class ResponderSerial(LoopbackSerial):
+    """Actionneur série (SerialPort) : répond response à chaque commande terminée par un retour à la ligne."""
+
+    def __init__(self, response: bytes = b"ok\n") -> None:
+        super().__init__()
+        self.response = response
+        self.commands: List[bytes] = []
+        self._pending = bytearray()
+
+    def handle(self, data: bytes) -> None:
+        self._pending.extend(data)
+        while b"\n" in self._pending:
+            command, _, rest = bytes(self._pending).partition(b"\n")
+            self._pending = bytearray(rest)
+            self.commands.append(command)
+            self.feed(self.response)
+
+
+class AsservEmulator(LoopbackSerial):
+    """
+    Carte d'asservissement émulée : les trames CBOR+CRC écrites par Asserv sont exécutées par un
+    AsservModel, qui renvoie une trame de position toutes les period secondes (temps réel), comme la carte.
+    """
+
+    def __init__(self, model: Optional[AsservModel] = None, period: float = 0.01) -> None:
+        super().__init__()
+        self.model = model if model is not None else AsservModel()
+        self.period = period
+        self.frames_sent = 0
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def handle(self, data: bytes) -> None:
+        with self._lock:
+            self.model.write(data)
+
+    def _run(self) -> None:
+        next_frame = time.monotonic()
+        while self.is_open:
+            with self._lock:
+                self.model.step(self.period)
+                frame = self.model.encode_position()
+            self.feed(frame)
+            self.frames_sent += 1
+            next_frame += self.period
+            time.sleep(max(next_frame - time.monotonic(), 0))
+
+
+class AX12BusEmulator(LoopbackSerial):
+    """
+    Bus AX12 émulé : chaque paquet d'instruction reçoit le paquet de statut d'un SimulatedAX12Link
+    (registres en mémoire, servos qui atteignent leur consigne instantanément).
+    """
+
+    def __init__(self, bus: Optional[SimulatedAX12Link] = None) -> None:
+        super().__init__()
+        self.bus = bus if bus is not None else SimulatedAX12Link()
+
+    def handle(self, data: bytes) -> None:
+        self.feed(bytes(self.bus.send_command(data)))
+
+
+class LidarEmulator(LoopbackSerial):
+    """
+    Lidar émulé (protocole de la carte du RPLidar A2) : une fois le scan lancé ('s'), envoie une ligne
+    "angle;distance#angle;distance..." (mode CLUSTERING_ONE_LINE, coordonnées polaires en radians et mm)
+    toutes les period ms (commande 'p'), jusqu'à l'arrêt ('h').
+
+    scene donne les points vus à chaque trame ; par défaut, clusters tirés au hasard (graine seed)
+    à moins de distance mm (commande 'd').
+    """
+
+    def __init__(self, scene: Optional[Callable[[], List[Tuple[float, float]]]] = None, clusters: int = 10,
+                 seed: int = 0) -> None:
+        super().__init__()
+        self.random = random.Random(seed)
+        self.scene = scene if scene is not None else self._random_scene
+        self.clusters = clusters
+        self.period_ms = 100
+        self.distance = 2000
+        self.lines_sent = 0
+        self.commands: List[str] = []
+        self._scanning = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def handle(self, data: bytes) -> None:
+        command = data.decode("ascii", errors="replace")
+        self.commands.append(command)
+        if command == "s":
+            self._scanning.set()
+        elif command in ("h", "e"):
+            self._scanning.clear()
+        elif command[:1] == "p" and command[1:].isdigit():
+            self.period_ms = int(command[1:])
+        elif command[:1] == "d" and command[1:].isdigit():
+            self.distance = int(command[1:])
+
+    def _random_scene(self) -> List[Tuple[float, float]]:
+        return [
+            (self.random.uniform(-math.pi, math.pi), self.random.uniform(100, self.distance))
+            for _ in range(self.clusters)
+        ]
+
+    def line(self) -> bytes:
+        """Ligne de la trame courante."""
+        points = [(angle, distance) for angle, distance in self.scene() if distance <= self.distance]
+        return ("#".join(f"{angle:.4f};{distance:.0f}" for angle, distance in points) + "\n").encode("ascii")
+
+    def _run(self) -> None:
+        while self.is_open:
+            self._scanning.wait()
+            self.feed(self.line())
+            self.lines_sent += 1
+            time.sleep(self.period_ms / 1000)
+
+
+class Srf08Emulator:
+    """
+    Capteur SRF08 émulé sur un I2CBusEmulator : registres de gain et de portée, mesure lancée par la
+    commande 0x52 (résultat en µs) qui dure ranging_time secondes pendant lesquelles le capteur ne
+    répond pas (OSError, comme le NAK du vrai capteur), puis temps de vol du premier écho.
+    """
+
+    SOFTWARE_VERSION = 11
+    RANGING_US_COMMAND = 0x52
+
+    def __init__(self, distance: Union[int, Callable[[], int]] = 1000, ranging_time: float = 0.065) -> None:
+        self.distance = distance if callable(distance) else (lambda: distance)
+        self.ranging_time = ranging_time
+        self.registers = bytearray(36)
+        self.registers[0] = self.SOFTWARE_VERSION
+        self.measures = 0
+        self._ranging_until = 0.0
+
+    def write(self, register: int, value: int) -> None:
+        if register == 0 and value == self.RANGING_US_COMMAND:
+            tof_us = min(int(2 * self.distance() / SOUND_SPEED), 0xFFFF)
+            self.registers[2:4] = tof_us.to_bytes(2, "big")
+            self._ranging_until = time.monotonic() + self.ranging_time
+            self.measures += 1
+        elif register in (1, 2):
+            # Gain et portée : registres en écriture seule, sans effet sur l'émulation
+            pass
+
+    def read(self, register: int) -> int:
+        if time.monotonic() < self._ranging_until:
+            raise OSError("SRF08 en cours de mesure")
+        return self.registers[register]
+
+
+class I2CBusEmulator:
+    """Bus I2C émulé, interface smbus2.SMBus utilisée par les drivers (adresses 7 bits)."""
+
+    def __init__(self, devices: Optional[Dict[int, Srf08Emulator]] = None) -> None:
+        self.devices = devices if devices is not None else {}
+
+    def __enter__(self) -> 'I2CBusEmulator':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def _device(self, address: int) -> Srf08Emulator:
+        if address not in self.devices:
+            raise OSError(f"[Errno 121] Remote I/O error : pas de périphérique à l'adresse 0x{address:02X}")
+        return self.devices[address]
+
+    def write_byte_data(self, address: int, register: int, value: int, force: Optional[bool] = None) -> None:
+        self._device(address).write(register, value)
+
+    def read_byte_data(self, address: int, register: int, force: Optional[bool] = None) -> int:
+        return self._device(address).read(register)
+
+
+class EmulatedBackend(DeviceBackend):
+    """
+    Backend des drivers branché sur des émulateurs en mémoire :
+        - serial_devices : port série (nom du port de la config) → LoopbackSerial
+        - i2c_buses : numéro de bus → I2CBusEmulator
+        - broches GPIO : MockFactory de gpiozero (pin_factory), avec add_srf04 pour brancher un SRF04 émulé
+    """
+
+    def __init__(self, serial_devices: Optional[Dict[str, LoopbackSerial]] = None,
+                 i2c_buses: Optional[Dict[int, I2CBusEmulator]] = None) -> None:
+        self.serial_devices = serial_devices if serial_devices is not None else {}
+        self.i2c_buses = i2c_buses if i2c_buses is not None else {}
+        self.pin_factory = MockFactory()
+
+    def open_serial(self, port: str, baud_rate: int, **settings) -> LoopbackSerial:
+        if port not in self.serial_devices:
+            raise serial.SerialException(f"[Errno 2] could not open port {port}: pas d'émulateur")
+        return self.serial_devices[port].configure(baud_rate, **settings)
+
+    def open_i2c(self, bus: int) -> I2CBusEmulator:
+        if bus not in self.i2c_buses:
+            raise FileNotFoundError(f"[Errno 2] No such file or directory: '/dev/i2c-{bus}'")
+        return self.i2c_buses[bus]
+
+    def add_srf04(self, trigger: int, echo: int, distance: int) -> None:
+        """Branche un SRF04 émulé : chaque impulsion sur trigger renvoie l'écho d'un obstacle à distance mm."""
+        echo_pin = self.pin_factory.pin(echo)
+        self.pin_factory.pin(trigger, pin_class=MockTriggerPin, echo_pin=echo_pin,
+                             echo_time=2 * distance / SOUND_SPEED / 1e6)
+
+    def set_button(self, pin: int, pressed: bool) -> None:
+        """Appuie (ou relâche) un bouton (tirette, sélecteur de couleur) : broche tirée à la masse."""
+        if pressed:
+            self.pin_factory.pin(pin).drive_low()
+        else:
+            self.pin_factory.pin(pin).drive_high()
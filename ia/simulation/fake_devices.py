@@ -0,0 +1,224 @@
+import logging
+import math
+import random
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from ia.api.detection.ultrasound.srf import Srf
+from ia.simulation.opponent import Opponent
+from ia.utils.position import Position
+
+logger = logging.getLogger(__name__)
+
+# Distance renvoyée par un SRF qui ne voit rien (mm)
+SRF_NO_ECHO = 2000
+
+
+class SimulatedLidar:
+    """
+    Lidar simulé : expose detected_points (repère table) comme LidarRpA2, calculés à partir
+    des adversaires à portée, avec un bruit gaussien reproductible (graine).
+    """
+
+    def __init__(self, asserv, opponents: List[Opponent], distance: int = 2000, noise: float = 10.0,
+                 seed: int = 0, telemetry=None) -> None:
+        self.asserv = asserv
+        self.opponents = opponents
+        self.distance = distance
+        self.noise = noise
+        self.random = random.Random(seed)
+        self.telemetry = telemetry
+        self.detected_points: List[Position] = []
+
+    def scan(self) -> None:
+        """Nouvelle trame : un point par adversaire à portée, sur son bord le plus proche du robot."""
+        robot = self.asserv.position
+        points = []
+        for opponent in self.opponents:
+            dx = opponent.position.x - robot.x
+            dy = opponent.position.y - robot.y
+            center_distance = math.hypot(dx, dy)
+            if center_distance - opponent.radius > self.distance:
+                continue
+            ratio = max(center_distance - opponent.radius, 0) / max(center_distance, 1)
+            points.append(Position(
+                int(robot.x + dx * ratio + self.random.gauss(0, self.noise)),
+                int(robot.y + dy * ratio + self.random.gauss(0, self.noise))
+            ))
+        self.detected_points = points
+        if self.telemetry is not None:
+            self.telemetry.lidar_frame([(p.x, p.y) for p in points])
+
+
+class SimulatedSrf(Srf):
+    """
+    Capteur ultrason simulé : distance au bord du premier adversaire dans le cône du capteur.
+    """
+
+    def __init__(self, desc: str, x: int, y: int, angle: int, threshold: int, window_size: int, asserv,
+                 opponents: List[Opponent], cone: float = math.radians(15), noise: float = 5.0,
+                 seed: int = 0) -> None:
+        super().__init__(desc, x, y, angle, threshold, window_size)
+        self.asserv = asserv
+        self.opponents = opponents
+        self.cone = cone
+        self.noise = noise
+        self.random = random.Random(seed)
+
+    @classmethod
+    def from_config(cls, srf_config: Dict, window_size: int, asserv, opponents: List[Opponent],
+                    seed: int = 0) -> 'SimulatedSrf':
+        return cls(
+            desc=srf_config['desc'],
+            x=srf_config['x'],
+            y=srf_config['y'],
+            angle=srf_config['angle'],
+            threshold=srf_config['threshold'],
+            window_size=window_size,
+            asserv=asserv,
+            opponents=opponents,
+            seed=seed,
+        )
+
+    def get_distance(self) -> int:
+        robot = self.asserv.position
+        # Position et orientation du capteur dans le repère table
+        sensor_x = robot.x + self.x * math.cos(robot.theta) - self.y * math.sin(robot.theta)
+        sensor_y = robot.y + self.x * math.sin(robot.theta) + self.y * math.cos(robot.theta)
+        sensor_theta = robot.theta + math.radians(self.angle)
+
+        distance = SRF_NO_ECHO
+        for opponent in self.opponents:
+            dx = opponent.position.x - sensor_x
+            dy = opponent.position.y - sensor_y
+            bearing = math.atan2(dy, dx) - sensor_theta
+            bearing = math.atan2(math.sin(bearing), math.cos(bearing))
+            center_distance = math.hypot(dx, dy)
+            # Cône du capteur élargi par la taille apparente de l'adversaire
+            apparent = math.asin(min(1.0, opponent.radius / max(center_distance, 1)))
+            if abs(bearing) <= self.cone + apparent:
+                distance = min(distance, max(0, int(center_distance - opponent.radius)))
+        if distance < SRF_NO_ECHO:
+            distance = max(0, int(distance + self.random.gauss(0, self.noise)))
+        return distance
+
+
+class SimulatedPullCord:
+    """Tirette simulée : l'état attendu est atteint immédiatement."""
+
+    def __init__(self) -> None:
+        self.state = False
+
+    def get_state(self) -> bool:
+        return self.state
+
+    def wait_for_state(self, expected_state: bool) -> None:
+        self.state = expected_state
+
+
+class SimulatedColorSelector:
+    """Sélecteur de couleur simulé."""
+
+    def __init__(self, is_color0: bool) -> None:
+        self.color0 = is_color0
+
+    def is_color_0(self) -> bool:
+        return self.color0
+
+
+class SimulatedAX12Link:
+    """
+    Bus AX12 simulé, compatible AX12LinkSerial.send_command : répond aux lectures et écritures
+    de registres avec des paquets de statut valides. Les servos atteignent leur consigne
+    instantanément (registre "en mouvement" toujours à 0, position présente = position visée).
+    """
+
+    BROADCAST = 0xFE
+    READ_DATA = 0x02
+    WRITE_DATA = 0x03
+    GOAL_POSITION = 0x1E
+    PRESENT_POSITION = 0x24
+
+    def __init__(self) -> None:
+        self.dtr_enabled = False
+        self.rts_enabled = False
+        self.memory: Dict[int, bytearray] = {}
+        self.commands = 0
+
+    def _registers(self, address: int) -> bytearray:
+        if address not in self.memory:
+            self.memory[address] = bytearray(0x32)
+        return self.memory[address]
+
+    def send_command(self, cmd: bytes) -> bytearray:
+        self.commands += 1
+        address, instruction, params = cmd[2], cmd[4], bytes(cmd[5:-1])
+        addresses = list(self.memory) if address == self.BROADCAST else [address]
+        response_params = b""
+        if instruction == self.WRITE_DATA:
+            register, values = params[0], params[1:]
+            for target in addresses:
+                registers = self._registers(target)
+                registers[register:register + len(values)] = values
+                if register == self.GOAL_POSITION:
+                    registers[self.PRESENT_POSITION:self.PRESENT_POSITION + 2] = values[:2]
+        elif instruction == self.READ_DATA:
+            register, size = params[0], params[1]
+            response_params = bytes(self._registers(address)[register:register + size])
+        if address == self.BROADCAST:
+            # Pas de réponse sur l'adresse de diffusion
+            return bytearray()
+        packet = bytearray([0xFF, 0xFF, address, len(response_params) + 2, 0]) + response_params
+        packet.append(~sum(packet[2:]) & 0xFF)
+        return packet
+
+    def enable_dtr(self, enable: bool) -> None:
+        self.dtr_enabled = enable
+
+    def enable_rts(self, enable: bool) -> None:
+        self.rts_enabled = enable
+
+    def is_dtr_enabled(self) -> bool:
+        return self.dtr_enabled
+
+    def is_rts_enabled(self) -> bool:
+        return self.rts_enabled
+
+    def shutdown(self) -> None:
+        pass
+
+
+class SimulatedSerialPort:
+    """Port série d'actionneur simulé : acquitte toutes les commandes."""
+
+    def __init__(self, response: str = "ok") -> None:
+        self.response = response
+        self.sent: List[str] = []
+
+    def send(self, command: str, wait_response: bool = False, timeout: float = None) -> str:
+        self.sent.append(command)
+        return self.response if wait_response else ""
+
+
+class SimulatedCamera:
+    """Caméra simulée : images noires de la taille demandée."""
+
+    def __init__(self, width: int = 640, height: int = 480, image_factory: Callable[[], np.ndarray] = None) -> None:
+        self.is_initialized = False
+        self.width = width
+        self.height = height
+        self.image_factory = image_factory
+
+    def initialize(self) -> None:
+        self.is_initialized = True
+
+    def capture_image(self) -> np.ndarray:
+        if not self.is_initialized:
+            raise Exception("Camera is not initialized. Call initialize() before capturing images.")
+        if self.image_factory is not None:
+            return self.image_factory()
+        return np.zeros((self.height, self.width, 3), dtype=np.uint8)
+
+    def release(self) -> None:
+        self.is_initialized = False
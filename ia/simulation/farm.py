@@ -0,0 +1,219 @@
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import random
+import statistics
+import sys
+import time
+import traceback
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+from ia.simulation.match_simulator import MatchSimulator
+from ia.simulation.opponent import Opponent
+from ia.utils.config_loader import load_config
+
+logger = logging.getLogger(__name__)
+
+# Largeur des classes des histogrammes : points et secondes
+SCORE_BIN = 10
+TIME_BIN = 10
+
+
+class SimulationFarm:
+    """
+    Ferme de simulation : joue N matchs en parallèle (un MatchSimulator par match, un processus par cœur)
+    en faisant varier les trajectoires des adversaires, la couleur de départ et la graine du bruit capteurs,
+    puis agrège les résultats en un rapport (distribution des scores, temps d'atteinte des objectifs,
+    recalculs de trajectoire et arrêts d'urgence).
+
+    Les scénarios sont tirés à partir de seed : deux fermes de mêmes paramètres jouent les mêmes matchs,
+    et chaque match simulé est lui-même reproductible.
+    """
+
+    def __init__(
+        self,
+        year: int,
+        robot: str,
+        matches: int,
+        seed: int = 0,
+        opponents: int = 1,
+        opponent_speed: tuple = (250.0, 600.0),
+        waypoints: int = 3,
+        colors: tuple = (True, False),
+        root: str = ".",
+    ) -> None:
+        """
+        Args:
+            year (int): Année de la config.
+            robot (str): Robot (valeur de l'enum Robot).
+            matches (int): Nombre de matchs à jouer.
+            seed (int): Graine du tirage des scénarios.
+            opponents (int): Nombre d'adversaires par match.
+            opponent_speed (tuple): Vitesse (mm/s) min et max des adversaires.
+            waypoints (int): Nombre de points de passage de chaque adversaire.
+            colors (tuple): Couleurs jouées à tour de rôle (True : color0).
+            root (str): Racine du dépôt (les simulations lisent config/ depuis ce dossier).
+        """
+        self.year = year
+        self.robot = robot
+        self.matches = matches
+        self.seed = seed
+        self.opponents = opponents
+        self.opponent_speed = opponent_speed
+        self.waypoints = waypoints
+        self.colors = colors
+        self.root = os.path.abspath(root)
+        table_config = load_config(year, robot, config_base_path=os.path.join(self.root, "config"))["table"]
+        self.size_x = table_config["sizeX"]
+        self.size_y = table_config["sizeY"]
+
+    def scenarios(self) -> List[Dict]:
+        """Scénarios des matchs : couleur, graine du bruit et adversaires (format Opponent.from_config)."""
+        rng = random.Random(self.seed)
+        margin = 200
+        scenarios = []
+        for index in range(self.matches):
+            scenarios.append({
+                "index": index,
+                "is_color0": self.colors[index % len(self.colors)],
+                "seed": rng.randrange(2 ** 31),
+                "opponents": [
+                    {
+                        "path": [
+                            [rng.uniform(margin, self.size_x - margin), rng.uniform(margin, self.size_y - margin)]
+                            for _ in range(self.waypoints)
+                        ],
+                        "speed": rng.uniform(*self.opponent_speed),
+                    }
+                    for _ in range(self.opponents)
+                ],
+            })
+        return scenarios
+
+    def run(self, workers: Optional[int] = None, log_level: int = logging.CRITICAL) -> Dict:
+        """
+        Joue tous les matchs sur un pool de processus (workers : nombre de cœurs par défaut).
+
+        Returns
+        -------
+        dict : rapport agrégé (voir aggregate) avec en plus le détail de chaque match (matches)
+        """
+        scenarios = self.scenarios()
+        start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(self.root, log_level)) as pool:
+            results = list(pool.map(_run_match, [(self.year, self.robot, scenario) for scenario in scenarios]))
+        report = self.aggregate(results)
+        report["real_time"] = round(time.perf_counter() - start, 3)
+        report["matches"] = results
+        return report
+
+    @staticmethod
+    def aggregate(results: List[Dict]) -> Dict:
+        """Distributions des scores, des temps d'atteinte des objectifs, des recalculs et des arrêts d'urgence."""
+        played = [result for result in results if "error" not in result]
+        report = {
+            "matches": len(results),
+            "failures": [{"index": result["index"], "error": result["error"]}
+                         for result in results if "error" in result],
+        }
+        if not played:
+            return report
+
+        report["score"] = _distribution([result["score"] for result in played])
+        report["score"]["histogram"] = _histogram([result["score"] for result in played], SCORE_BIN)
+        for color, is_color0 in (("color0", True), ("color3000", False)):
+            scores = [result["score"] for result in played if result["is_color0"] == is_color0]
+            if scores:
+                report["score"][color] = _distribution(scores)
+        report["replans"] = _distribution([result["replans"] for result in played])
+        report["emergency_stops"] = _distribution([result["emergency_stops"] for result in played])
+        report["speedup"] = _distribution([result["speedup"] for result in played if result["speedup"]])
+
+        # Temps d'atteinte de chaque objectif, dans l'ordre où ils sont atteints la première fois
+        times: Dict[str, List[float]] = {}
+        for result in played:
+            for objective in result["objectives"]:
+                times.setdefault(objective["desc"], []).append(objective["time"])
+        report["objectives"] = {
+            desc: {
+                "reached": len(values),
+                "rate": round(len(values) / len(played), 3),
+                **_distribution(values),
+                "histogram": _histogram(values, TIME_BIN),
+            }
+            for desc, values in times.items()
+        }
+        return report
+
+
+def _distribution(values: List[float]) -> Dict:
+    values = sorted(values)
+    return {
+        "min": values[0],
+        "p10": values[round(0.1 * (len(values) - 1))],
+        "median": statistics.median(values),
+        "mean": round(statistics.fmean(values), 3),
+        "p90": values[round(0.9 * (len(values) - 1))],
+        "max": values[-1],
+    }
+
+
+def _histogram(values: List[float], width: float) -> Dict[str, int]:
+    """Effectifs par classe [début, début + width[, classes triées."""
+    counts = Counter(int(value // width) * width for value in values)
+    return {f"{start:g}-{start + width:g}": counts[start] for start in sorted(counts)}
+
+
+def _init_worker(root: str, log_level: int) -> None:
+    os.chdir(root)
+    logging.getLogger().setLevel(log_level)
+
+
+def _run_match(job: tuple) -> Dict:
+    """Joue un scénario dans un processus du pool. Une exception est rapportée sans arrêter la ferme."""
+    year, robot, scenario = job
+    summary = {"index": scenario["index"], "is_color0": scenario["is_color0"], "seed": scenario["seed"]}
+    try:
+        # Le pathfinding écrit sur la sortie standard
+        with contextlib.redirect_stdout(io.StringIO()):
+            simulator = MatchSimulator(
+                year, robot,
+                is_color0=scenario["is_color0"],
+                seed=scenario["seed"],
+                opponents=[Opponent.from_config(opponent) for opponent in scenario["opponents"]],
+            )
+            result = simulator.run()
+    except Exception as e:
+        return {**summary, "error": f"{e!r}\n{traceback.format_exc()}"}
+    return {**summary, "opponents": scenario["opponents"], **result}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Joue des matchs simulés en parallèle et agrège les résultats.")
+    parser.add_argument("year", type=int, help="Year in integer format")
+    parser.add_argument("robot", type=str, help="Robot type from Robot enum")
+    parser.add_argument("--matches", type=int, default=os.cpu_count() or 1, help="Nombre de matchs")
+    parser.add_argument("--workers", type=int, default=None, help="Processus en parallèle (nombre de cœurs par défaut)")
+    parser.add_argument("--seed", type=int, default=0, help="Graine du tirage des scénarios")
+    parser.add_argument("--opponents", type=int, default=1, help="Adversaires par match")
+    parser.add_argument("--color", type=int, choices=[0, 3000], default=None, help="Une seule couleur (les deux par défaut)")
+    parser.add_argument("--output", type=str, default=None, help="Fichier JSON du rapport complet (détail des matchs compris)")
+    parser.add_argument("--log-level", type=str, default="CRITICAL", help="Niveau de log de l'IA dans les simulations")
+    args = parser.parse_args()
+
+    logging.basicConfig(stream=sys.stderr, level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    farm = SimulationFarm(
+        args.year, args.robot, args.matches, seed=args.seed, opponents=args.opponents,
+        colors=(True, False) if args.color is None else (args.color == 0,),
+    )
+    farm_report = farm.run(workers=args.workers, log_level=logging.getLevelNamesMapping()[args.log_level.upper()])
+    if args.output is not None:
+        with open(args.output, "w") as report_file:
+            json.dump(farm_report, report_file, indent=2)
+    print(json.dumps({key: value for key, value in farm_report.items() if key != "matches"}, indent=2))
@@ -0,0 +1,234 @@
+import logging
+import math
+import zlib
+from collections import deque
+from typing import Dict, Optional
+
+import cbor2
+
+from ia.asservissement.asser_message import AsservMessage
+from ia.asservissement.asserv import Asserv
+from ia.asservissement.asserv_status import AsservStatus
+from ia.asservissement.movement_direction import MovementDirection
+from ia.utils.clock import Clock
+from ia.utils.metrics import MetricsRegistry
+from ia.utils.position import Position
+
+logger = logging.getLogger(__name__)
+
+SYNCWORD = 0xDEADBEEF
+HEADER_SIZE = 12
+# Vitesse en mode lent (slow_speed_acc_mode), en fraction de la vitesse nominale
+LOW_SPEED_FACTOR = 0.5
+
+
+class AsservModel:
+    """
+    Modèle cinématique de la carte d'asservissement, branché à la place du port série.
+
+    Il décode les trames CBOR envoyées par Asserv.formatMsg (mêmes commandes que le firmware),
+    exécute les déplacements à vitesse constante (rotation sur place puis ligne droite) et
+    renvoie des trames de position au même format que la carte : [x, y, theta, cmd_id, status,
+    pending, motor_left, motor_right]. Un déplacement qui s'enfonce dans la marge des bordures
+    (wall_margin) bloque le robot (status 3), comme lors d'un calage.
+    """
+
+    def __init__(self, max_speed: float = 600.0, rotation_speed: float = 3.0, size_x: int = 2000,
+                 size_y: int = 3000, wall_margin: int = 60, start: Optional[Position] = None) -> None:
+        self.max_speed = max_speed
+        self.rotation_speed = rotation_speed
+        self.size_x = size_x
+        self.size_y = size_y
+        self.wall_margin = wall_margin
+        start = start if start is not None else Position(size_x // 2, size_y // 2)
+        self.x = float(start.x)
+        self.y = float(start.y)
+        self.theta = float(start.theta)
+
+        self.speed_factor = 1.0
+        self.low_speed = False
+        self.halted = False
+        self.blocked = False
+        self.commands = deque()
+        self.current = None
+        self.current_id = 0
+        self.motor_left = 0
+        self.motor_right = 0
+
+    # Interface "port série" utilisée par Asserv
+
+    def write(self, frame: bytes) -> int:
+        if len(frame) < HEADER_SIZE or int.from_bytes(frame[0:4], 'little') != SYNCWORD:
+            logger.warning(f"Trame asserv invalide : {frame!r}")
+            return len(frame)
+        size = int.from_bytes(frame[8:12], 'little')
+        payload = frame[HEADER_SIZE:HEADER_SIZE + size]
+        # zlib.crc32 calcule le même CRC-32 que crc.Crc32.CRC32 (utilisé par Asserv), beaucoup plus vite
+        if zlib.crc32(payload) != int.from_bytes(frame[4:8], 'little'):
+            logger.warning("Trame asserv : CRC invalide")
+            return len(frame)
+        self.handle_command(cbor2.loads(payload))
+        return len(frame)
+
+    def read(self, size: int = 1) -> bytes:
+        return b""
+
+    # Commandes
+
+    def handle_command(self, message: Dict) -> None:
+        cmd = message["cmd"]
+        if cmd == AsservMessage.emergency_stop.value:
+            self.halted = True
+            self.commands.clear()
+            self.current = None
+        elif cmd == AsservMessage.emergency_stop_reset.value:
+            self.halted = False
+            self.blocked = False
+        elif cmd == AsservMessage.normal_speed_acc_mode.value:
+            self.low_speed = False
+        elif cmd == AsservMessage.slow_speed_acc_mode.value:
+            self.low_speed = True
+        elif cmd == AsservMessage.max_motor_speed.value:
+            self.speed_factor = max(message["P"], 1.0) / 100
+        elif cmd == AsservMessage.set_position.value:
+            self.x, self.y, self.theta = message["X"], message["Y"], message["T"]
+        elif not self.halted:
+            # Commande de déplacement, mise en file comme sur la carte
+            self.commands.append(message)
+
+    def _start_next_command(self) -> None:
+        message = self.commands.popleft()
+        self.current_id = message.get("ID", self.current_id)
+        self.blocked = False
+        cmd = message["cmd"]
+        if cmd == AsservMessage.turn.value:
+            self.current = [("rotate", self.theta + math.radians(message["A"]))]
+        elif cmd == AsservMessage.orbital_turn.value:
+            # Approximé par une rotation sur place
+            angle = math.radians(message["A"]) * (-1 if message["R"] else 1)
+            self.current = [("rotate", self.theta + angle)]
+        elif cmd == AsservMessage.straight.value:
+            self.current = [("straight", message["D"])]
+        elif cmd == AsservMessage.face.value:
+            self.current = [("rotate", math.atan2(message["Y"] - self.y, message["X"] - self.x))]
+        elif cmd in (AsservMessage.goto_front.value, AsservMessage.goto_nostop.value):
+            self.current = [("face_point", message["X"], message["Y"], False), ("reach", message["X"], message["Y"], False)]
+        elif cmd == AsservMessage.goto_back.value:
+            self.current = [("face_point", message["X"], message["Y"], True), ("reach", message["X"], message["Y"], True)]
+        else:
+            logger.warning(f"Commande asserv non simulée : {message}")
+            self.current = []
+
+    # Simulation
+
+    def step(self, dt: float) -> None:
+        """Fait avancer le robot de dt secondes."""
+        self.motor_left = self.motor_right = 0
+        remaining = dt
+        while remaining > 1e-9 and not self.halted and not self.blocked:
+            if not self.current:
+                if not self.commands:
+                    break
+                self._start_next_command()
+                continue
+            remaining = self._advance(remaining)
+
+    def _advance(self, dt: float) -> float:
+        """Avance la sous-commande courante, retourne le temps non consommé."""
+        speed = self.max_speed * self.speed_factor * (LOW_SPEED_FACTOR if self.low_speed else 1)
+        rotation_speed = self.rotation_speed * self.speed_factor * (LOW_SPEED_FACTOR if self.low_speed else 1)
+        motion = self.current[0]
+
+        if motion[0] in ("rotate", "face_point"):
+            if motion[0] == "rotate":
+                target = motion[1]
+            else:
+                _, x, y, backward = motion
+                target = math.atan2(y - self.y, x - self.x) + (math.pi if backward else 0)
+            if motion[0] == "face_point" and math.hypot(motion[1] - self.x, motion[2] - self.y) < 1:
+                target = self.theta
+            delta = math.atan2(math.sin(target - self.theta), math.cos(target - self.theta))
+            needed = abs(delta) / rotation_speed
+            used = min(dt, needed)
+            self.theta += math.copysign(rotation_speed * used, delta)
+            self.motor_left, self.motor_right = (-1, 1) if delta > 0 else (1, -1)
+            if used >= needed:
+                self.theta = math.atan2(math.sin(target), math.cos(target))
+                self.current.pop(0)
+            return dt - used
+
+        if motion[0] == "straight":
+            distance = motion[1]
+            direction = 1 if distance >= 0 else -1
+            dx, dy = math.cos(self.theta) * direction, math.sin(self.theta) * direction
+        else:
+            _, x, y, backward = motion
+            distance = math.hypot(x - self.x, y - self.y)
+            direction = -1 if backward else 1
+            dx, dy = (x - self.x) / max(distance, 1e-9), (y - self.y) / max(distance, 1e-9)
+        needed = abs(distance) / speed
+        used = min(dt, needed)
+        step = speed * used
+        new_x, new_y = self.x + dx * step, self.y + dy * step
+        if self._wall_overlap(new_x, new_y) > self._wall_overlap(self.x, self.y):
+            # Le robot pousse contre une bordure : il reste où il est
+            self.blocked = True
+            self.current = None
+            self.commands.clear()
+            return 0
+        self.x, self.y = new_x, new_y
+        self.motor_left = self.motor_right = direction
+        if motion[0] == "straight":
+            self.current[0] = ("straight", distance - direction * step)
+        if used >= needed:
+            self.current.pop(0)
+        return dt - used
+
+    def _wall_overlap(self, x: float, y: float) -> float:
+        """Enfoncement (mm) dans la marge des bordures, 0 si le robot est dans la zone libre."""
+        return (max(self.wall_margin - x, 0, x - (self.size_x - self.wall_margin))
+                + max(self.wall_margin - y, 0, y - (self.size_y - self.wall_margin)))
+
+    def status(self) -> int:
+        if self.halted:
+            return AsservStatus.STATUS_HALTED.value
+        if self.blocked:
+            return AsservStatus.STATUS_BLOCKED.value
+        if self.current or self.commands:
+            return AsservStatus.STATUS_RUNNING.value
+        return AsservStatus.STATUS_IDLE.value
+
+    def encode_position(self) -> bytes:
+        """Trame de position, au format envoyé par la carte d'asservissement."""
+        payload = cbor2.dumps([
+            self.x, self.y, self.theta, self.current_id, self.status(),
+            len(self.commands), self.motor_left, self.motor_right
+        ])
+        return (SYNCWORD.to_bytes(4, 'little')
+                + zlib.crc32(payload).to_bytes(4, 'little')
+                + len(payload).to_bytes(4, 'little')
+                + payload)
+
+
+class SimulatedAsserv(Asserv):
+    """
+    Asserv branché sur un AsservModel : les commandes passent par le même encodage CBOR et les
+    positions par le même AsservResponseListener que sur le robot, sans port série ni thread.
+    Les attentes (wait_for_asserv, go_start...) passent par l'horloge simulée.
+    """
+
+    def __init__(self, model: AsservModel, gostart_config: dict, clock: Clock,
+                 metrics: Optional[MetricsRegistry] = None) -> None:
+        self.serial_port = None
+        self.baud_rate = None
+        self._init_state(gostart_config, None, clock, metrics)
+        self.serial = model
+        self.model = model
+        self.direction = MovementDirection.NONE
+
+    def receive(self, dt: float) -> None:
+        """Avance le modèle de dt secondes et traite la trame de position qu'il renvoie."""
+        self.model.step(dt)
+        for byte in self.model.encode_position():
+            self.response_listener.push_byte(byte)
+        self.update_position()
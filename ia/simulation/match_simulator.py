@@ -0,0 +1,225 @@
+import argparse
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+from typing import Dict, List, Optional
+
+from ia.actions.action_repository_factory import ActionRepositoryFactory
+from ia.api.chrono import Chrono
+from ia.asservissement.trajectory_estimator import TrajectoryEstimator
+from ia.manager.action_manager import ActionManager
+from ia.manager.detection_manager import DetectionManager
+from ia.manager.movement_manager import MovementManager
+from ia.manager.safety_monitor import SafetyMonitor
+from ia.manager.strategy_manager import StrategyManager
+from ia.master_loop import MasterLoop
+from ia.simulation.fake_devices import (SimulatedAX12Link, SimulatedCamera, SimulatedColorSelector, SimulatedLidar,
+                                        SimulatedPullCord, SimulatedSerialPort, SimulatedSrf)
+from ia.simulation.kinematic_asserv import AsservModel, SimulatedAsserv
+from ia.simulation.opponent import Opponent
+from ia.utils.clock import SteppedClock
+from ia.utils.config_loader import load_config
+from ia.utils.metrics import MetricsRegistry
+from ia.utils.position import Position
+from ia.utils.robot import Robot
+
+logger = logging.getLogger(__name__)
+
+
+class MatchSimulator:
+    """
+    Simulation sans matériel d'un match complet avec la vraie pile de l'IA (MasterLoop, managers,
+    stratégie, pathfinding, actions) branchée sur des périphériques simulés :
+        - asserv : modèle cinématique qui consomme les trames CBOR (AsservModel)
+        - lidar, SRF : calculés à partir d'adversaires scriptés (Opponent), bruit reproductible (seed)
+        - tirette, sélecteur de couleur, bus AX12, ports série et caméra simulés
+        - toute l'IA (chrono, attentes, threads d'actions) sur une SteppedClock
+
+    Chaque tour : une itération de MasterLoop.loop_iteration (chronométrée en temps réel pour
+    mesurer la latence de décision), puis dt secondes de simulation. Les attentes faites par la
+    boucle elle-même (calage, WAIT...) font aussi avancer la simulation.
+
+    À lancer depuis la racine du dépôt (config/<year>/<robot>/...).
+    """
+
+    def __init__(
+        self,
+        year: int,
+        robot: str,
+        is_color0: bool = True,
+        seed: int = 0,
+        opponents: Optional[List[Opponent]] = None,
+        dt: float = 0.01,
+        lookahead: Optional[bool] = None,
+    ) -> None:
+        self.dt = dt
+        self.clock = SteppedClock(tick=dt)
+        self.opponents = opponents if opponents is not None else []
+        self.iterations = 0
+        self.latencies: List[float] = []
+
+        robot = Robot(robot)
+        config_data = load_config(year, robot.value)
+        table_config = config_data["table"]
+        color = table_config['color0'] if is_color0 else table_config['color3000']
+        gostart_config = config_data["asserv"]["goStart"]
+        estimator_config = config_data.get("trajectoryEstimator") or {}
+
+        self.model = AsservModel(
+            max_speed=estimator_config.get("maxSpeed", 600.0),
+            rotation_speed=estimator_config.get("rotationSpeed", 3.0),
+            size_x=table_config["sizeX"],
+            size_y=table_config["sizeY"],
+            start=self._start_position(gostart_config.get(color, []), table_config),
+        )
+        # Registre propre à la simulation, pour ne pas mélanger les matchs d'une ferme de simulation
+        self.metrics = MetricsRegistry()
+        self.asserv = SimulatedAsserv(self.model, gostart_config, self.clock, self.metrics)
+        self.chrono = Chrono(config_data['matchDuration'], self.clock)
+
+        actions_config = config_data["actions"]
+        action_repository = ActionRepositoryFactory.from_json_files(
+            folder=os.path.join("config", str(year), robot.value, "actions"),
+            ax12_link_serial=SimulatedAX12Link() if actions_config.get('ax12') is not None else None,
+            serial_ports={
+                actuator_config.get('id', str(index)): SimulatedSerialPort()
+                for index, actuator_config in enumerate(actions_config.get('actuators') or [])
+                if actuator_config['type'] == 'serial'
+            },
+            camera=SimulatedCamera() if actions_config.get('camera') is not None else None,
+            chrono=self.chrono,
+            clock=self.clock,
+        )
+        action_manager = ActionManager(action_repository=action_repository, actions_config=actions_config,
+                                       clock=self.clock, metrics=self.metrics)
+
+        self.lidar = SimulatedLidar(self.asserv, self.opponents, seed=seed)
+        ultrasound_config = config_data["detection"]["ultrasound"]
+        sensors = [
+            SimulatedSrf.from_config(srf_config, ultrasound_config["windowSize"], self.asserv, self.opponents,
+                                     seed=seed + index + 1)
+            for index, srf_config in enumerate(ultrasound_config['gpioList'])
+        ]
+        detection_manager = DetectionManager(
+            sensors=sensors,
+            lidar=self.lidar,
+            asserv=self.asserv,
+            table_config=table_config,
+            metrics=self.metrics,
+        )
+        lookahead_config = dict(config_data.get("lookahead") or {})
+        if lookahead is not None:
+            lookahead_config["active"] = lookahead
+        self.safety_monitor = SafetyMonitor.from_config(config_data["detection"].get("safety"), detection_manager,
+                                                        self.asserv, self.clock, self.metrics)
+
+        self.master_loop = MasterLoop(
+            action_manager=action_manager,
+            comm_config={"active": False},
+            detection_manager=detection_manager,
+            movement_manager=MovementManager(asserv=self.asserv, clock=self.clock),
+            strategy_manager=StrategyManager(
+                year=year,
+                robot=robot,
+                scheduler_config=config_data.get("strategyScheduler"),
+                estimator=TrajectoryEstimator.from_config(config_data.get("trajectoryEstimator"))
+            ),
+            table_config=table_config,
+            chrono=self.chrono,
+            pull_cord=SimulatedPullCord(),
+            nextion_display=None,
+            color_selector=SimulatedColorSelector(is_color0),
+            clock=self.clock,
+            metrics=self.metrics,
+            safety_monitor=self.safety_monitor,
+            lookahead_config=lookahead_config,
+        )
+        self.clock.add_listener(self.step)
+
+    @staticmethod
+    def _start_position(gostart: List[Dict], table_config: Dict) -> Position:
+        """Pose de départ : celle du premier recalage (set_pos) de la séquence goStart."""
+        for instruction in gostart:
+            if instruction["type"] == "set_pos":
+                return Position(instruction["x"], instruction["y"], instruction["theta"])
+        return Position(table_config["sizeX"] // 2, table_config["sizeY"] // 2)
+
+    def step(self, now: float, dt: float) -> None:
+        """Fait avancer le monde simulé (adversaires, asserv, lidar) de dt secondes."""
+        for opponent in self.opponents:
+            opponent.update(now)
+        self.asserv.receive(dt)
+        self.lidar.scan()
+
+    def run(self) -> Dict:
+        """
+        Joue le match complet.
+
+        Returns
+        -------
+        dict : score, emergency_stops, replans, match_time, virtual_time (calage compris) et real_time (s), speedup,
+        latence de décision (ms) moyenne, p95 et max, iterations, objectives (objectifs terminés : desc, time, points, saved_ms gagnés par la lookahead), metrics (instantané du MetricsRegistry)
+        """
+        real_start = time.perf_counter()
+        self.master_loop.init()
+        self.master_loop.start_match()
+        while not self.master_loop.interrupted:
+            start = time.perf_counter()
+            self.master_loop.loop_iteration()
+            self.latencies.append(time.perf_counter() - start)
+            self.iterations += 1
+            self.clock.advance(self.dt)
+        if self.safety_monitor is not None:
+            # Le match peut finir avant le chrono (plus d'objectif) : on laisse le moniteur se terminer
+            self.safety_monitor.stop()
+            self.clock.join(self.safety_monitor.thread)
+        real_time = time.perf_counter() - real_start
+
+        latencies = sorted(self.latencies) or [0.0]
+        return {
+            "score": self.master_loop.score,
+            "emergency_stops": self.master_loop.emergency_stops,
+            "replans": self.master_loop.replans,
+            "match_time": round(self.chrono.get_time_since_beginning(), 3),
+            "virtual_time": round(self.clock.now(), 3),
+            "real_time": round(real_time, 3),
+            "speedup": round(self.clock.now() / real_time, 1) if real_time else None,
+            "latency_mean_ms": round(statistics.fmean(latencies) * 1000, 3),
+            "latency_p95_ms": round(latencies[int(0.95 * (len(latencies) - 1))] * 1000, 3),
+            "latency_max_ms": round(latencies[-1] * 1000, 3),
+            "iterations": self.iterations,
+            "objectives": [
+                {"desc": desc, "time": round(match_time, 3), "points": points, "saved_ms": round(saved * 1000, 3)}
+                for desc, match_time, points, saved in self.master_loop.completed_objectives
+            ],
+            "metrics": self.metrics.snapshot(),
+        }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulation sans matériel d'un match complet.")
+    parser.add_argument("year", type=int, help="Year in integer format")
+    parser.add_argument("robot", type=str, help="Robot type from Robot enum")
+    parser.add_argument("--color", type=int, choices=[0, 3000], default=0, help="Couleur de départ")
+    parser.add_argument("--seed", type=int, default=0, help="Graine du bruit des capteurs")
+    parser.add_argument("--opponent", action="append", default=[],
+                        help="Adversaire scripté, points x,y séparés par ';' (ex : 1000,500;1000,2500)")
+    parser.add_argument("--opponent-speed", type=float, default=400, help="Vitesse des adversaires (mm/s)")
+    parser.add_argument("--lookahead", choices=["on", "off"], default=None,
+                        help="Force la lookahead (pré-calcul des trajectoires, actions en parallèle), sinon config")
+    parser.add_argument("--log-level", type=str, default="WARNING", help="Niveau de log de l'IA")
+    args = parser.parse_args()
+
+    logging.basicConfig(stream=sys.stderr, level=logging.getLevelNamesMapping()[args.log_level.upper()],
+                        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    simulated_opponents = [
+        Opponent([tuple(map(float, point.split(","))) for point in opponent.split(";")], speed=args.opponent_speed)
+        for opponent in args.opponent
+    ]
+    simulator = MatchSimulator(args.year, args.robot, is_color0=args.color == 0, seed=args.seed,
+                               opponents=simulated_opponents,
+                               lookahead=None if args.lookahead is None else args.lookahead == "on")
+    print(json.dumps(simulator.run(), indent=2))
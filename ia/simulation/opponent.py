@@ -0,0 +1,45 @@
+import math
+from typing import List, Tuple
+
+from ia.utils.position import Position
+
+
+class Opponent:
+    """
+    Robot adverse scripté : parcourt une ligne brisée en aller-retour à vitesse constante.
+    """
+
+    def __init__(self, path: List[Tuple[float, float]], speed: float = 400, radius: float = 150) -> None:
+        """
+        Args:
+            path (list): Points (x, y) en mm parcourus en aller-retour, un seul point pour un robot immobile.
+            speed (float): Vitesse en mm/s.
+            radius (float): Rayon de l'adversaire en mm.
+        """
+        self.path = [(float(x), float(y)) for x, y in path]
+        self.speed = speed
+        self.radius = radius
+        self.position = Position(self.path[0][0], self.path[0][1])
+        self._segment_lengths = [
+            math.dist(self.path[i], self.path[i + 1]) for i in range(len(self.path) - 1)
+        ]
+        self._length = sum(self._segment_lengths)
+
+    @classmethod
+    def from_config(cls, config: dict) -> 'Opponent':
+        return cls(config["path"], config.get("speed", 400), config.get("radius", 150))
+
+    def update(self, t: float) -> None:
+        """Place l'adversaire à l'instant t (s) depuis le début du match."""
+        if self._length == 0:
+            return
+        distance = (t * self.speed) % (2 * self._length)
+        if distance > self._length:
+            distance = 2 * self._length - distance
+        for (x0, y0), (x1, y1), length in zip(self.path, self.path[1:], self._segment_lengths):
+            if distance <= length:
+                ratio = distance / length if length else 0
+                self.position = Position(x0 + (x1 - x0) * ratio, y0 + (y1 - y0) * ratio)
+                return
+            distance -= length
+        self.position = Position(*self.path[-1])
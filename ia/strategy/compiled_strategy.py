@@ -0,0 +1,196 @@
+import argparse
+import glob
+import hashlib
+import json
+import logging
+import os
+import sys
+from typing import Dict, List, Optional
+
+import cbor2
+
+from ia.strategy.flag_registry import FlagRegistry
+from ia.strategy.objective import Objective
+from ia.strategy.step import STEP_SUB_TYPES, STEP_TYPES, Step
+from ia.strategy.step_sub_type import StepSubType
+from ia.strategy.step_type import StepType
+from ia.utils.files import write_atomic
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+SOURCE_FILE = "strategy.json"
+COMPILED_FILE = "strategy.cbor"
+COLORS = ("color0", "color3000")
+
+
+def source_hash(source: bytes) -> str:
+    """Empreinte du strategy.json compilé, pour détecter un fichier compilé périmé."""
+    return hashlib.sha256(source).hexdigest()
+
+
+class _Strings:
+    """Table des chaînes internées : chaque chaîne (description, flag, action, zone) n'est stockée qu'une fois."""
+
+    def __init__(self) -> None:
+        self.table: List[str] = []
+        self._index: Dict[str, int] = {}
+
+    def intern(self, value: Optional[str]) -> Optional[int]:
+        if value is None:
+            return None
+        if value not in self._index:
+            self._index[value] = len(self.table)
+            self.table.append(value)
+        return self._index[value]
+
+
+def _validate_step(step: Step) -> None:
+    """Vérifications faites à la compilation plutôt qu'au démarrage du robot."""
+    if step.action_type == StepType.MANIPULATION and not step.id_action:
+        raise ValueError("manipulation sans action_id")
+    if step.sub_type in (StepSubType.ADD_ZONE, StepSubType.DELETE_ZONE) and not step.item_id:
+        raise ValueError(f"{step.sub_type.value} sans item_id")
+    if step.sub_type == StepSubType.RESET_FLAG and not step.reset_flags:
+        raise ValueError("RESET_FLAG sans reset_flags")
+    if step.action_type == StepType.MOVEMENT and step.sub_type is None:
+        raise ValueError("déplacement sans subtype")
+
+
+def _compile_step(step: Step, strings: _Strings) -> List:
+    return [
+        strings.intern(step.description),
+        strings.intern(step.id_action),
+        STEP_TYPES.index(step.action_type),
+        None if step.sub_type is None else STEP_SUB_TYPES.index(step.sub_type),
+        step.distance,
+        step.timeout,
+        step.position.x,
+        step.position.y,
+        strings.intern(step.item_id),
+        None if step.reset_flags is None else [strings.intern(flag) for flag in step.reset_flags],
+        step.forward,
+        step.on_right_wheel,
+        step.instant_return,
+        strings.intern(step.needed_flag),
+    ]
+
+
+def compile_strategy(strategy: Dict, source: bytes) -> bytes:
+    """
+    Compile une stratégie (contenu de strategy.json) : objectifs et steps validés, enums remplacés
+    par leur rang, chaînes internées, les deux couleurs résolues. Lève ValueError en indiquant
+    l'objectif et la step fautifs.
+    """
+    strings = _Strings()
+    # Registre jetable : la compilation valide les conditions de flags sans les interner dans FLAG_REGISTRY
+    flag_registry = FlagRegistry()
+    colors = {}
+    for color in COLORS:
+        if color not in strategy:
+            raise ValueError(f"couleur {color} absente")
+        objectives = []
+        for objective_config in strategy[color]:
+            description = objective_config.get('desc', objective_config.get('description'))
+            try:
+                flag_registry.condition(objective_config.get('needed_flag'))
+            except ValueError as e:
+                raise ValueError(f"{color}, objectif '{description}' : {e}") from e
+            steps = []
+            for index, step_config in enumerate(objective_config.get('tasks') or []):
+                try:
+                    step = Step(step_config, flag_registry)
+                    _validate_step(step)
+                except (KeyError, ValueError) as e:
+                    raise ValueError(f"{color}, objectif '{description}', step {index} "
+                                     f"'{step_config.get('desc')}' : {e}") from e
+                steps.append(_compile_step(step, strings))
+            if not steps:
+                raise ValueError(f"{color}, objectif '{description}' : aucune step")
+            objectives.append([
+                strings.intern(description),
+                objective_config.get('id'),
+                objective_config.get('points'),
+                objective_config.get('priority'),
+                strings.intern(objective_config.get('needed_flag')),
+                strings.intern(objective_config.get('action_flag')),
+                None if objective_config.get('clear_flags') is None
+                else [strings.intern(flag) for flag in objective_config['clear_flags']],
+                steps,
+            ])
+        colors[color] = objectives
+    return cbor2.dumps({
+        "version": FORMAT_VERSION,
+        "source": source_hash(source),
+        "strings": strings.table,
+        "colors": colors,
+    })
+
+
+def compile_strategy_file(folder: str) -> str:
+    """Compile folder/strategy.json en folder/strategy.cbor et retourne le chemin du fichier compilé."""
+    with open(os.path.join(folder, SOURCE_FILE), "rb") as source_file:
+        source = source_file.read()
+    try:
+        compiled = compile_strategy(json.loads(source), source)
+    except ValueError as e:
+        raise ValueError(f"{os.path.join(folder, SOURCE_FILE)} : {e}") from e
+    path = os.path.join(folder, COMPILED_FILE)
+    write_atomic(path, compiled)
+    logger.info(f"Stratégie compilée : {path} ({len(source)} → {len(compiled)} octets)")
+    return path
+
+
+def load_compiled_strategy(folder: str,
+                           flag_registry: Optional[FlagRegistry] = None) -> Optional[Dict[str, List[Objective]]]:
+    """
+    Objectifs des deux couleurs lus depuis folder/strategy.cbor, sans validation ni conversion ; seules
+    les conditions de flags sont compilées sur flag_registry (le registre partagé par défaut). None si
+    le fichier compilé est absent, illisible, d'une autre version du format ou plus à jour de strategy.json.
+    """
+    path = os.path.join(folder, COMPILED_FILE)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "rb") as compiled_file:
+            compiled = cbor2.loads(compiled_file.read())
+        if not isinstance(compiled, dict):
+            raise TypeError(f"{type(compiled).__name__} au lieu d'un dictionnaire")
+        if compiled.get("version") != FORMAT_VERSION:
+            logger.warning(f"{path} : version {compiled.get('version')} du format, {FORMAT_VERSION} attendue")
+            return None
+        source_path = os.path.join(folder, SOURCE_FILE)
+        if os.path.exists(source_path):
+            with open(source_path, "rb") as source_file:
+                if source_hash(source_file.read()) != compiled["source"]:
+                    logger.warning(f"{path} périmé : {SOURCE_FILE} modifié depuis la compilation")
+                    return None
+        strings = compiled["strings"]
+        colors = compiled["colors"].items()
+    except (cbor2.CBORDecodeError, KeyError, TypeError, ValueError, AttributeError) as e:
+        # Fichier tronqué ou corrompu : strategy.json est chargé à la place
+        logger.warning(f"{path} illisible, ignoré : {e!r}")
+        return None
+    return {
+        color: [Objective.from_compiled(objective, strings, flag_registry) for objective in objectives]
+        for color, objectives in colors
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compile les strategy.json d'une année en strategy.cbor.")
+    parser.add_argument("year", type=int, help="Year in integer format")
+    parser.add_argument("robots", type=str, nargs="*", help="Robots à compiler (tous par défaut)")
+    args = parser.parse_args()
+
+    logging.basicConfig(stream=sys.stderr, level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    folders = [os.path.join("config", str(args.year), robot) for robot in args.robots] or sorted(
+        os.path.dirname(path) for path in glob.glob(os.path.join("config", str(args.year), "*", SOURCE_FILE))
+    )
+    failed = False
+    for strategy_folder in folders:
+        try:
+            compile_strategy_file(strategy_folder)
+        except ValueError as e:
+            logger.error(e)
+            failed = True
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,220 @@
+import re
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Jetons d'une condition : opérateurs et parenthèses, ou nom de flag
+_TOKEN = re.compile(r"\s*(?:([&|!()])|([^\s&|!()]+))")
+
+# Terme d'une condition en forme normale disjonctive : (flags requis, flags interdits)
+Term = Tuple[int, int]
+
+
+class FlagCondition:
+    """
+    Condition sur les flags actifs (needed_flag d'un objectif ou d'une step), compilée une fois pour
+    toutes en forme normale disjonctive sur les bits du FlagRegistry : la condition est vraie si l'un
+    des termes a tous ses flags requis actifs et aucun de ses flags interdits. L'évaluation ne fait
+    que des opérations sur des entiers, quel que soit le nombre de flags actifs.
+    """
+
+    __slots__ = ("expression", "terms")
+
+    def __init__(self, expression: str, terms: List[Term]) -> None:
+        self.expression = expression
+        self.terms = tuple(terms)
+
+    def matches(self, mask: int) -> bool:
+        for required, forbidden in self.terms:
+            if mask & required == required and not mask & forbidden:
+                return True
+        return False
+
+    def __str__(self) -> str:
+        return self.expression
+
+
+class FlagSet:
+    """
+    Flags d'action actifs, sous forme de masque de bits du FlagRegistry. Se parcourt et se teste
+    comme la liste de noms qu'il remplace (in, for, len).
+    """
+
+    __slots__ = ("registry", "mask")
+
+    def __init__(self, registry: 'FlagRegistry', mask: int = 0) -> None:
+        self.registry = registry
+        self.mask = mask
+
+    def add(self, flag: str) -> None:
+        self.mask |= self.registry.bit(flag)
+
+    def discard(self, flag: str) -> None:
+        self.mask &= ~self.registry.bit(flag)
+
+    def clear(self) -> None:
+        self.mask = 0
+
+    def satisfies(self, condition: Optional[FlagCondition]) -> bool:
+        """True si la condition (None : pas de condition) est vérifiée par les flags actifs."""
+        return condition is None or condition.matches(self.mask)
+
+    def __contains__(self, flag: str) -> bool:
+        return bool(self.mask & self.registry.bit(flag))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.registry.names(self.mask))
+
+    def __len__(self) -> int:
+        return bin(self.mask).count("1")
+
+    def __repr__(self) -> str:
+        return repr(self.registry.names(self.mask))
+
+
+class FlagRegistry:
+    """
+    Interne les noms de flags en positions de bits. Les flags des stratégies sont internés au
+    chargement (needed_flag, action_flag, clear_flags, reset_flags), ceux levés à l'exécution par les
+    actions (flags de la caméra ArUco construits depuis flag_template...) à leur première levée.
+
+    Syntaxe des conditions (needed_flag) : un nom de flag, combinable avec ! (non), & (et), | (ou)
+    et des parenthèses, par priorité décroissante. Exemple : "caisses_4 & !(rotateNut1 | rotateNut2)".
+    Un needed_flag réduit à un nom garde son sens historique : le flag doit être actif.
+    """
+
+    def __init__(self) -> None:
+        self._bits: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._conditions: Dict[str, FlagCondition] = {}
+        self._lock = threading.Lock()
+
+    def bit(self, flag: str) -> int:
+        """Masque du flag, interné au premier appel."""
+        bit = self._bits.get(flag)
+        if bit is None:
+            with self._lock:
+                bit = self._bits.get(flag)
+                if bit is None:
+                    bit = 1 << len(self._names)
+                    self._names.append(flag)
+                    self._bits[flag] = bit
+        return bit
+
+    def mask(self, flags: Optional[Iterable[str]]) -> int:
+        mask = 0
+        for flag in flags or ():
+            mask |= self.bit(flag)
+        return mask
+
+    def names(self, mask: int) -> List[str]:
+        """Noms des flags du masque, dans l'ordre d'internement."""
+        return [name for index, name in enumerate(self._names) if mask >> index & 1]
+
+    def flag_set(self, flags: Optional[Iterable[str]] = None) -> FlagSet:
+        return FlagSet(self, self.mask(flags))
+
+    def condition(self, expression: Optional[str]) -> Optional[FlagCondition]:
+        """
+        Condition compilée de l'expression (None si pas d'expression). Lève ValueError si
+        l'expression est mal formée.
+        """
+        if expression is None:
+            return None
+        condition = self._conditions.get(expression)
+        if condition is None:
+            parser = _ConditionParser(self, expression)
+            condition = FlagCondition(expression, parser.parse())
+            self._conditions[expression] = condition
+        return condition
+
+
+class _ConditionParser:
+    """
+    Descente récursive sur la grammaire des conditions ; chaque sous-expression est directement
+    mise en forme normale disjonctive (les négations sont propagées jusqu'aux flags).
+    """
+
+    def __init__(self, registry: FlagRegistry, expression: str) -> None:
+        self.registry = registry
+        self.expression = expression
+        self.tokens: List[str] = []
+        position = 0
+        stripped = expression.rstrip()
+        while position < len(stripped):
+            match = _TOKEN.match(stripped, position)
+            self.tokens.append(match.group(1) or match.group(2))
+            position = match.end()
+        self.index = 0
+
+    def parse(self) -> List[Term]:
+        if not self.tokens:
+            raise ValueError(f"condition de flags vide : '{self.expression}'")
+        terms = self._or()
+        if self.index < len(self.tokens):
+            self._error(f"'{self.tokens[self.index]}' inattendu")
+        return terms
+
+    def _error(self, message: str) -> None:
+        raise ValueError(f"condition de flags '{self.expression}' : {message}")
+
+    def _peek(self) -> Optional[str]:
+        return self.tokens[self.index] if self.index < len(self.tokens) else None
+
+    def _or(self) -> List[Term]:
+        terms = self._and()
+        while self._peek() == "|":
+            self.index += 1
+            terms = _union(terms, self._and())
+        return terms
+
+    def _and(self) -> List[Term]:
+        terms = self._not()
+        while self._peek() == "&":
+            self.index += 1
+            terms = _product(terms, self._not())
+        return terms
+
+    def _not(self) -> List[Term]:
+        token = self._peek()
+        if token == "!":
+            self.index += 1
+            return _negate(self._not())
+        if token == "(":
+            self.index += 1
+            terms = self._or()
+            if self._peek() != ")":
+                self._error("')' manquante")
+            self.index += 1
+            return terms
+        if token is None or token in "&|)":
+            self._error("nom de flag attendu" if token is None else f"'{token}' inattendu")
+        self.index += 1
+        return [(self.registry.bit(token), 0)]
+
+
+def _union(left: List[Term], right: List[Term]) -> List[Term]:
+    return left + [term for term in right if term not in left]
+
+
+def _product(left: List[Term], right: List[Term]) -> List[Term]:
+    terms = []
+    for left_required, left_forbidden in left:
+        for right_required, right_forbidden in right:
+            required, forbidden = left_required | right_required, left_forbidden | right_forbidden
+            # Un terme qui requiert et interdit le même flag n'est jamais vrai
+            if not required & forbidden and (required, forbidden) not in terms:
+                terms.append((required, forbidden))
+    return terms
+
+
+def _negate(terms: List[Term]) -> List[Term]:
+    # Loi de De Morgan : non(t1 ou t2...) = non(t1) et non(t2)..., où non(t) est le "ou" des flags inversés
+    result: List[Term] = [(0, 0)]
+    for required, forbidden in terms:
+        literals = [(0, 1 << index) for index in range(required.bit_length()) if required >> index & 1]
+        literals += [(1 << index, 0) for index in range(forbidden.bit_length()) if forbidden >> index & 1]
+        result = _product(result, literals)
+    return result
+
+
+FLAG_REGISTRY = FlagRegistry()
@@ -1,7 +1,8 @@
 import logging
 from typing import Dict, Optional, List
 
-from ia.strategy.step import Step
+from ia.strategy.flag_registry import FLAG_REGISTRY, FlagCondition, FlagRegistry, FlagSet
+from ia.strategy.step import Step, _string
 
 
 class Objective:
@@ -23,7 +24,9 @@ class Objective:
     step_list : list
         List of steps associated with the objective.
     needed_flag : str, optional
-        Flag needed to execute the objective, default is None.
+        Flag condition needed to execute the objective (see FlagRegistry), default is None.
+    condition : FlagCondition, optional
+        needed_flag compiled on the flag registry.
     action_flag : str, optional
         Flag raised when objective is finished, default is None.
     clear_flags : list[str], optional
@@ -32,7 +35,10 @@ class Objective:
         Logger for the objective.
     """
 
-    def __init__(self, objective_config: Dict):
+    __slots__ = ("step_index", "description", "id", "points", "priority", "step_list", "needed_flag",
+                 "condition", "action_flag", "clear_flags", "logger")
+
+    def __init__(self, objective_config: Dict, flag_registry: Optional[FlagRegistry] = None):
         """
         Initialize an Objective with its configuration.
 
@@ -40,20 +46,47 @@ class Objective:
         ----------
         objective_config : Dict
             Dictionary containing the configuration for the objective.
+        flag_registry : FlagRegistry, optional
+            Registry the flag conditions are compiled on, the shared one by default.
         """
+        flag_registry = flag_registry or FLAG_REGISTRY
         self.step_index = -1
-        self.description = objective_config.get('description')
+        self.description = objective_config.get('desc', objective_config.get('description'))
         self.id = objective_config.get('id')
         self.points = objective_config.get('points')
         self.priority = objective_config.get('priority')
         self.step_list = []
         for step_config in objective_config.get('tasks'):
-            self.step_list.append(Step(step_config))
+            self.step_list.append(Step(step_config, flag_registry))
         self.needed_flag = objective_config.get('needed_flag', None)
+        self.condition: Optional[FlagCondition] = flag_registry.condition(self.needed_flag)
         self.action_flag = objective_config.get('action_flag', None)
         self.clear_flags = objective_config.get('clear_flags', None)
         self.logger = logging.getLogger(__name__)
 
+    @classmethod
+    def from_compiled(cls, fields: List, strings: List[str],
+                      flag_registry: Optional[FlagRegistry] = None) -> 'Objective':
+        """
+        Builds an objective and its steps from their compiled form (ia.strategy.compiled_strategy),
+        already validated.
+        """
+        flag_registry = flag_registry or FLAG_REGISTRY
+        description, objective_id, points, priority, needed_flag, action_flag, clear_flags, steps = fields
+        objective = cls.__new__(cls)
+        objective.step_index = -1
+        objective.description = _string(strings, description)
+        objective.id = objective_id
+        objective.points = points
+        objective.priority = priority
+        objective.step_list = [Step.from_compiled(step, strings, flag_registry) for step in steps]
+        objective.needed_flag = _string(strings, needed_flag)
+        objective.condition = flag_registry.condition(objective.needed_flag)
+        objective.action_flag = _string(strings, action_flag)
+        objective.clear_flags = None if clear_flags is None else [strings[flag] for flag in clear_flags]
+        objective.logger = logging.getLogger(__name__)
+        return objective
+
     def __str__(self):
         return (f"Objective(description={self.description}, objective_id={self.id}, "
             f"points={self.points}, priority={self.priority}, needed_flag={self.needed_flag}, "
@@ -68,9 +101,9 @@ class Objective:
         """
         return self.step_index < len(self.step_list) - 1
 
-    def get_next_step(self, flags: List[str]) -> Optional[Step]:
+    def get_next_step(self, flags: FlagSet) -> Optional[Step]:
         """
-        Get the next step in the step list, skipping those whose needed_flag is missing from the active flags.
+        Get the next step in the step list, skipping those whose needed_flag condition is not met by the active flags.
 
         Returns:
             step: The next step if available, otherwise None.
@@ -78,8 +111,8 @@ class Objective:
         self.step_index += 1
         step = self.step_list[self.step_index]
 
-        while step.needed_flag is not None and step.needed_flag not in flags:
-            self.logger.info(f'Skip step {step.description} (missing flag {step.needed_flag})')
+        while not flags.satisfies(step.condition):
+            self.logger.info(f'Skip step {step.description} (flag condition {step.needed_flag} not met)')
             if not self.has_next_step():
                 return None
             self.step_index += 1
@@ -0,0 +1,217 @@
+import logging
+import math
+from typing import Dict, List, Optional
+
+from ia.asservissement.trajectory_estimator import TrajectoryEstimator
+from ia.strategy.flag_registry import FlagSet
+from ia.strategy.objective import Objective
+from ia.strategy.step_sub_type import StepSubType
+from ia.strategy.step_type import StepType
+from ia.utils.position import Position
+
+
+class ObjectiveScheduler:
+    """
+    Choisit le prochain objectif en maximisant les points par seconde estimée.
+
+    Les objectifs à 0 point (ramassage, sortie de zone...) ne valent que par l'objectif
+    qui les suit dans le fichier de stratégie : ils sont donc évalués en "chaîne"
+    avec les objectifs suivants jusqu'au premier qui rapporte des points. Un objectif
+    qui suit directement un objectif à 0 point réalisable (flags présents) n'est choisi
+    qu'avec lui ; une chaîne à 0 point qui ne tient plus dans le temps restant est
+    abandonnée (marquée faite). Une fois une chaîne entamée, elle est terminée avant
+    d'en choisir une autre. Les autres dépendances doivent être exprimées avec needed_flag/action_flag.
+
+    Estimation de durée d'un objectif (TrajectoryEstimator)
+        - déplacements : profils de vitesse de l'asserv en ligne droite pour classer les
+          objectifs, rotations sur place comprises ; le pathfinding n'est calculé que pour
+          l'objectif retenu (premier GOTO_ASTAR depuis la pose courante), qui est écarté s'il
+          ne tient plus dans le temps restant
+        - manipulations : durée mesurée par l'ActionManager, sinon durée de l'estimateur
+        - WAIT : timeout, WAIT_CHRONO : attente jusqu'au temps de match visé
+
+    Une chaîne dont la durée estimée dépasse le temps de match restant est écartée.
+    À ratio égal, la priorité la plus haute l'emporte, puis l'ordre du fichier.
+
+    Activé par la clé "strategyScheduler" du config.json robot ({"active": bool}, lue par le
+    StrategyManager), paramètres de déplacement dans la clé "trajectoryEstimator".
+    """
+
+    def __init__(self, estimator: Optional[TrajectoryEstimator] = None) -> None:
+        self.estimator = estimator if estimator is not None else TrajectoryEstimator()
+        self.logger = logging.getLogger(__name__)
+
+    def select(
+        self,
+        objectives: List[Objective],
+        done: List[bool],
+        flags: FlagSet,
+        position: Position,
+        pathfinding=None,
+        elapsed_time: float = 0,
+        remaining_time: Optional[float] = None,
+        action_durations: Optional[Dict[str, float]] = None,
+    ) -> Optional[int]:
+        """
+        Retourne l'index du prochain objectif à réaliser, ou None si aucun n'est réalisable.
+
+        Parameters
+        ----------
+        objectives : liste complète des objectifs, dans l'ordre du fichier
+        done : done[i] vaut True si objectives[i] a déjà été lancé (ou abandonné, mis à jour ici)
+        flags : flags d'action actifs
+        position : pose courante du robot
+        pathfinding : VisibilityGraph optionnel pour vérifier le premier trajet de l'objectif retenu
+        elapsed_time : temps écoulé depuis le début du match (s)
+        remaining_time : temps de match restant (s), None pour ignorer le budget
+        action_durations : durées mesurées des actions (s) par id d'action
+        """
+        # Le premier objectif du fichier (sortie de la zone de départ) est réalisé en premier si ses flags le permettent
+        if objectives and not any(done) and flags.satisfies(objectives[0].condition):
+            return 0
+
+        # Classement sur des trajets en ligne droite : pas de pathfinding par candidat dans la boucle principale
+        candidates = []
+        for index, objective in enumerate(objectives):
+            if done[index]:
+                continue
+            if not flags.satisfies(objective.condition):
+                continue
+            if self._is_chained(objectives, done, flags, index):
+                # Objectif qui termine la chaîne d'un objectif à 0 point encore réalisable
+                continue
+
+            chain = self._chain(objectives, done, flags, index)
+            duration = self._chain_duration(chain, position, None, elapsed_time, action_durations)
+            if remaining_time is not None and duration > remaining_time:
+                self.logger.debug(
+                    f"Skip objective {objective.description}: {duration:.1f}s estimated, {remaining_time:.1f}s left"
+                )
+                if not objective.points:
+                    # Chaîne hors budget pour le reste du match : elle ne doit plus bloquer les objectifs suivants
+                    self.logger.info(f"Objective {objective.description} dropped: chain over the remaining time")
+                    done[index] = True
+                continue
+
+            points = sum(chained.points or 0 for chained in chain)
+            ratio = points / max(duration, 0.1)
+            self.logger.debug(
+                f"Objective {objective.description}: {points} pts in {duration:.1f}s ({len(chain)} chained) "
+                f"-> {ratio:.2f} pts/s"
+            )
+            candidates.append(((ratio, objective.priority or 0, -index), index, chain))
+
+        # Trajet réel (pathfinding) uniquement pour l'objectif retenu, pour vérifier qu'il tient dans le temps restant
+        for _, index, chain in sorted(candidates, key=lambda candidate: candidate[0], reverse=True):
+            if pathfinding is None or remaining_time is None:
+                return index
+            duration = self._chain_duration(chain, position, pathfinding, elapsed_time, action_durations)
+            if duration <= remaining_time:
+                return index
+            self.logger.debug(
+                f"Skip objective {objectives[index].description}: {duration:.1f}s with pathfinding, "
+                f"{remaining_time:.1f}s left"
+            )
+        return None
+
+    def _chain_duration(
+        self,
+        chain: List[Objective],
+        position: Position,
+        pathfinding,
+        elapsed_time: float,
+        action_durations: Optional[Dict[str, float]],
+    ) -> float:
+        duration = 0.0
+        current = position
+        for chained in chain:
+            objective_duration, current = self.estimate(
+                chained, current, pathfinding if chained is chain[0] else None,
+                elapsed_time + duration, action_durations
+            )
+            duration += objective_duration
+        return duration
+
+    @staticmethod
+    def _is_chained(objectives: List[Objective], done: List[bool], flags: FlagSet, index: int) -> bool:
+        """
+        True si l'objectif suit directement (objectifs faits ou irréalisables exclus) un objectif
+        à 0 point réalisable avec les flags actifs : il ne sera choisi qu'avec lui.
+        """
+        previous = next(
+            (i for i in range(index - 1, -1, -1) if not done[i] and flags.satisfies(objectives[i].condition)), None
+        )
+        return previous is not None and not objectives[previous].points
+
+    @staticmethod
+    def _chain(objectives: List[Objective], done: List[bool], flags: FlagSet, index: int) -> List[Objective]:
+        chain = [objectives[index]]
+        next_index = index + 1
+        while not chain[-1].points and next_index < len(objectives):
+            if not done[next_index] and flags.satisfies(objectives[next_index].condition):
+                chain.append(objectives[next_index])
+            next_index += 1
+        return chain
+
+    def estimate(
+        self,
+        objective: Objective,
+        start: Position,
+        pathfinding=None,
+        elapsed_time: float = 0,
+        action_durations: Optional[Dict[str, float]] = None,
+    ) -> tuple[float, Position]:
+        """
+        Estime la durée d'un objectif depuis une pose de départ.
+
+        Returns
+        -------
+        (durée estimée en secondes, pose estimée à la fin de l'objectif)
+        """
+        action_durations = action_durations or {}
+        estimator = self.estimator.fork()
+        estimator.elapsed = elapsed_time
+        position = Position(start.x, start.y, start.theta)
+        duration = 0.0
+        for step in objective.step_list:
+            if step.action_type == StepType.MANIPULATION:
+                if not step.instant_return:
+                    duration += action_durations.get(step.id_action, estimator.action_time(step.id_action))
+            elif step.action_type != StepType.MOVEMENT:
+                continue
+            elif step.sub_type == StepSubType.WAIT:
+                duration += step.timeout / 1000
+            elif step.sub_type == StepSubType.WAIT_CHRONO:
+                duration = max(duration, step.timeout - elapsed_time)
+            elif step.sub_type == StepSubType.SET_SPEED:
+                estimator.set_speed(step.distance)
+            elif step.sub_type == StepSubType.GO:
+                duration += estimator.straight_time(step.distance)
+                position = Position(
+                    position.x + step.distance * math.cos(position.theta),
+                    position.y + step.distance * math.sin(position.theta),
+                    position.theta
+                )
+            elif step.sub_type == StepSubType.FACE:
+                duration += estimator.face(position, step.position.x, step.position.y)
+                position.theta = math.atan2(step.position.y - position.y, step.position.x - position.x)
+            elif step.sub_type == StepSubType.SET_POSITION:
+                position = Position(step.position.x, step.position.y, step.distance)
+            elif step.sub_type == StepSubType.GOTO_ASTAR:
+                waypoints = [(step.position.x, step.position.y)]
+                if pathfinding is not None:
+                    pathfinding.compute_path(Position(position.x, position.y), step.position)
+                    if pathfinding.path:
+                        waypoints = [(p.x, p.y) for p in pathfinding.path[1:]]
+                    # Seul le premier trajet depuis la pose courante utilise le pathfinding
+                    pathfinding = None
+                travel, position = estimator.path(position, waypoints)
+                duration += travel
+            elif step.sub_type in (StepSubType.GOTO, StepSubType.GOTO_BACK, StepSubType.GOTO_CHAIN):
+                travel, position = estimator.goto(
+                    position, step.position.x, step.position.y,
+                    backward=step.sub_type == StepSubType.GOTO_BACK,
+                    chain=step.sub_type == StepSubType.GOTO_CHAIN,
+                )
+                duration += travel
+        return duration, position
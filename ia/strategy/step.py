@@ -1,5 +1,6 @@
-from typing import Dict
+from typing import Dict, List, Optional
 
+from ia.strategy.flag_registry import FLAG_REGISTRY, FlagCondition, FlagRegistry
 from ia.strategy.step_sub_type import StepSubType
 from ia.strategy.step_type import StepType
 from ia.utils.position import Position
@@ -28,10 +29,16 @@ class Step:
     item_id : int, optional
         Identifier of the item, if applicable.
     needed_flag : str, optional
-        Flag needed to execute the strategy, default is None.
+        Flag condition needed to execute the strategy (see FlagRegistry), default is None.
+    condition : FlagCondition, optional
+        needed_flag compiled on the flag registry.
     """
 
-    def __init__(self, config_node: Dict):
+    __slots__ = ("description", "id_action", "action_type", "sub_type", "distance", "timeout", "position",
+                 "item_id", "reset_flags", "forward", "on_right_wheel", "instant_return", "needed_flag",
+                 "condition")
+
+    def __init__(self, config_node: Dict, flag_registry: Optional[FlagRegistry] = None):
         """
         Represents a strategy in a process with various attributes and configurations.
 
@@ -39,19 +46,21 @@ class Step:
         ----------
         config_node : Dict
             Dictionary containing the configuration for the objective.
+        flag_registry : FlagRegistry, optional
+            Registry the needed_flag condition is compiled on, the shared one by default.
         """
 
         self.description = config_node["desc"]
         self.id_action = config_node["action_id"]
 
         if not config_node["type"].upper() in StepType._value2member_map_:
-            raise ValueError(f"Unknown action type: {self.action_type}")
+            raise ValueError(f"Unknown action type: {config_node['type']}")
         else:
             self.action_type = StepType[config_node["type"].upper()]
 
         if "subtype" in config_node:
             if not config_node["subtype"].upper() in StepSubType._value2member_map_:
-                raise ValueError(f"Unknown subtype: {self.sub_type}")
+                raise ValueError(f"Unknown subtype: {config_node['subtype']}")
             else:
                 self.sub_type = StepSubType[config_node["subtype"].upper()]
         else:
@@ -59,7 +68,6 @@ class Step:
         self.distance = config_node.get("dist", 0)
         self.timeout = config_node.get("timeout", 0)
         self.position = Position(config_node.get("position_x", 0), config_node.get("position_y", 0))
-        self.distance = config_node.get("dist", 0)
         self.item_id = config_node.get("item_id", None)
         self.reset_flags = config_node.get("reset_flags", None)
         self.forward = config_node.get("forward", None)
@@ -67,9 +75,44 @@ class Step:
         self.instant_return = config_node.get("instant_return", False)
 
         self.needed_flag = config_node.get("needed_flag", None)
+        self.condition: Optional[FlagCondition] = (flag_registry or FLAG_REGISTRY).condition(self.needed_flag)
+
+    @classmethod
+    def from_compiled(cls, fields: List, strings: List[str], flag_registry: Optional[FlagRegistry] = None) -> 'Step':
+        """
+        Builds a step from its compiled form (ia.strategy.compiled_strategy), already validated:
+        enums as indexes, strings as indexes in the interned strings table.
+        """
+        (description, id_action, action_type, sub_type, distance, timeout, x, y, item_id, reset_flags,
+         forward, on_right_wheel, instant_return, needed_flag) = fields
+        step = cls.__new__(cls)
+        step.description = strings[description]
+        step.id_action = _string(strings, id_action)
+        step.action_type = STEP_TYPES[action_type]
+        step.sub_type = None if sub_type is None else STEP_SUB_TYPES[sub_type]
+        step.distance = distance
+        step.timeout = timeout
+        step.position = Position(x, y)
+        step.item_id = _string(strings, item_id)
+        step.reset_flags = None if reset_flags is None else [strings[flag] for flag in reset_flags]
+        step.forward = forward
+        step.on_right_wheel = on_right_wheel
+        step.instant_return = instant_return
+        step.needed_flag = _string(strings, needed_flag)
+        step.condition = (flag_registry or FLAG_REGISTRY).condition(step.needed_flag)
+        return step
 
     def __str__(self):
         return (f"Step{{desc='{self.description}', id_action={self.id_action}, "
                 f"position={self.position}, action_type={self.action_type}, sub_type={self.sub_type}, "
                 f"distance={self.distance}, timeout={self.timeout}, item_id={self.item_id}, "
-                f"needed_flag={self.needed_flag}}}")
\ No newline at end of file
+                f"needed_flag={self.needed_flag}}}")
+
+
+# Ordre des enums dans le format compilé
+STEP_TYPES = list(StepType)
+STEP_SUB_TYPES = list(StepSubType)
+
+
+def _string(strings: List[str], index: Optional[int]) -> Optional[str]:
+    return None if index is None else strings[index]
@@ -2,6 +2,7 @@ import argparse
 import logging.handlers
 import sys
 
+from ia.tests.test_benchmark import DEFAULT_THRESHOLD, TestBenchmark
 from ia.tests.test_calage import TestCalage
 from ia.tests.test_pathfinding import TestPathfinding
 from ia.tests.test_srf08 import TestSrf08
@@ -27,6 +28,8 @@ if __name__ == "__main__":
     parser.add_argument("year", type=int, help="Year in integer format")
     parser.add_argument("robot", type=str, help="Robot type from Robot enum")
     parser.add_argument("log_level", type=str, help="Set log level among : CRITICAL, FATAL, ERROR, WARN, INFO, DEBUG")
+    parser.add_argument("--update-baseline", action="store_true", help="benchmark : enregistre les mesures comme référence")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="benchmark : régression tolérée (0.25 : 25 %%)")
     args = parser.parse_args()
 
     # set logger level
@@ -80,5 +83,8 @@ if __name__ == "__main__":
             TestPathfinding(config_data, args.year, robot).test()
         case 'strategy':
             TestStrategyManager(config_data, args.year, robot).test()
+        case 'benchmark':
+            TestBenchmark(config_data, args.year, robot, update_baseline=args.update_baseline,
+                          threshold=args.threshold).test()
         case default:
             raise logger.error(f"Mode {args.mode} does not exist")
\ No newline at end of file
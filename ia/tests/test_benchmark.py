@@ -0,0 +1,238 @@
+import contextlib
+import io
+import json
+import logging
+import math
+import os
+import sys
+import time
+from typing import Callable, List, Optional
+
+from ia.api.ax12.ax12_servo import AX12Servo
+from ia.api.ax12.enums.ax12_instr import AX12Instr
+from ia.api.detection.lidar.lidar_rpa2 import LidarRpA2
+from ia.asservissement.asser_message import AsservMessage
+from ia.asservissement.asserv_response_listener import AsservResponseListener
+from ia.manager.detection_manager import DetectionManager
+from ia.manager.strategy_manager import StrategyManager
+from ia.pathfinding.visibility_graph import VisibilityGraph
+from ia.simulation.fake_devices import SimulatedAX12Link, SimulatedLidar
+from ia.simulation.kinematic_asserv import AsservModel, SimulatedAsserv
+from ia.tests.abstract_test import AbstractTest
+from ia.utils.clock import SteppedClock
+from ia.utils.position import Position
+from ia.utils.robot import Robot
+
+# Nombre d'échantillons par benchmark et durée minimale d'un échantillon (s). On garde le meilleur
+# échantillon, le moins perturbé par le reste de la machine (comme timeit)
+REPEAT = 5
+MIN_SAMPLE_TIME = 0.05
+# Régression tolérée par défaut par rapport à la référence (0.25 : 25 % plus lent)
+DEFAULT_THRESHOLD = 0.25
+# Points par trame lidar (mode CLUSTERING_ONE_LINE)
+LIDAR_POINTS = 40
+
+
+class Benchmark:
+    """
+    Un chemin critique mesuré : op est chronométrée, setup (optionnel) est appelé avant chaque op
+    sans être chronométré (remise dans l'état de départ).
+    """
+
+    def __init__(self, name: str, op: Callable[[], object], setup: Optional[Callable[[], None]] = None) -> None:
+        self.name = name
+        self.op = op
+        self.setup = setup
+
+    def sample(self, number: int) -> float:
+        """Durée moyenne (s) d'un appel à op sur number appels."""
+        if self.setup is None:
+            start = time.perf_counter()
+            for _ in range(number):
+                self.op()
+            return (time.perf_counter() - start) / number
+        total = 0.0
+        for _ in range(number):
+            self.setup()
+            start = time.perf_counter()
+            self.op()
+            total += time.perf_counter() - start
+        return total / number
+
+    def measure(self) -> float:
+        """Durée d'un appel (µs), meilleure de REPEAT échantillons dont le nombre d'appels est calibré."""
+        first = self.sample(1)
+        number = max(1, int(MIN_SAMPLE_TIME / max(first, 1e-9)))
+        return min(self.sample(number) for _ in range(REPEAT)) * 1e6
+
+
+class TestBenchmark(AbstractTest):
+    """
+    Benchmark des chemins critiques de l'IA, sans matériel : asserv, lidar et bus AX12 simulés
+    (ia.simulation), config et stratégie de l'année.
+
+    Chemins mesurés
+    ---------------
+    - pathfinding : init du VisibilityGraph, désactivation et activation d'une zone dynamique,
+      calcul de chemin sans adversaire, avec un adversaire au centre de la table et avec deux adversaires
+      sur la ligne droite départ → arrivée (qui peuvent bloquer tout passage)
+    - asserv : décodage d'une trame de position (AsservResponseListener), encodage d'une commande (formatMsg)
+    - lidar : analyse d'une trame (LidarRpA2.parse_measures)
+    - détection : construction du masque des zones ignorées, trajectoire bloquée, arrêt d'urgence
+    - AX12 : envoi d'une requête (AX12Servo.send_request)
+    - stratégie : chargement de la stratégie compilée, sinon du strategy.json (StrategyManager.prepare_objectives)
+
+    Chaque mesure est comparée à la référence enregistrée sur cette machine
+    (logs/benchmark-<year>-<robot>.json) : le test échoue (code de sortie 1) si un chemin est plus lent
+    que la référence de plus de threshold. La référence est enregistrée si elle n'existe pas,
+    ou avec --update-baseline.
+
+    Lance via : python ia/test.py benchmark 2026 princess INFO [--update-baseline] [--threshold 0.25]
+    """
+
+    def __init__(self, config_data: dict, year: int, robot: Robot, update_baseline: bool = False,
+                 threshold: float = DEFAULT_THRESHOLD, baseline_path: Optional[str] = None) -> None:
+        super().__init__(config_data, year, robot)
+        self.update_baseline = update_baseline
+        self.threshold = threshold
+        self.baseline_path = baseline_path if baseline_path is not None \
+            else os.path.join("logs", f"benchmark-{year}-{robot.value}.json")
+        self.logger = logging.getLogger(__name__)
+
+    def benchmarks(self) -> List[Benchmark]:
+        table_config = self.config_data["table"]
+        benchmarks = []
+
+        # Pathfinding
+        graph = VisibilityGraph(table_config=table_config, active_color="color0")
+        benchmarks.append(Benchmark(
+            "pathfinding.init", lambda: VisibilityGraph(table_config=table_config, active_color="color0")
+        ))
+        zone_id = next((zone["id"] for zone in table_config["dynamicZones"] if zone["active"]), None)
+        if zone_id is not None:
+            benchmarks.append(Benchmark(
+                "pathfinding.deactivate",
+                lambda: graph.update_dynamic_zone(zone_id, False),
+                setup=lambda: graph.update_dynamic_zone(zone_id, True),
+            ))
+            benchmarks.append(Benchmark(
+                "pathfinding.activate",
+                lambda: graph.update_dynamic_zone(zone_id, True),
+                setup=lambda: graph.update_dynamic_zone(zone_id, False),
+            ))
+        start, goal = self._path_endpoints()
+        adversaries = {
+            "none": None,
+            "light": [{"x": table_config["sizeX"] // 2, "y": table_config["sizeY"] // 2}],
+            "heavy": [
+                {"x": int(start.x + (goal.x - start.x) * ratio), "y": int(start.y + (goal.y - start.y) * ratio)}
+                for ratio in (1 / 3, 2 / 3)
+            ],
+        }
+        for label, scenario in adversaries.items():
+            benchmarks.append(Benchmark(
+                f"pathfinding.compute_path.{label}",
+                lambda scenario=scenario: graph.compute_path(start, goal, adversaries=scenario)
+            ))
+
+        # Asserv : trames par le modèle cinématique à la place du port série
+        model = AsservModel(size_x=table_config["sizeX"], size_y=table_config["sizeY"])
+        asserv = SimulatedAsserv(model, self.config_data["asserv"]["goStart"], SteppedClock())
+        frame = model.encode_position()
+        listener = AsservResponseListener()
+
+        def decode_frame() -> dict:
+            for byte in frame:
+                listener.push_byte(byte)
+            return listener.pop_payload()
+
+        benchmarks.append(Benchmark("asserv.decode_frame", decode_frame))
+        command = {"cmd": AsservMessage.goto_front.value, "X": 1234.0, "Y": 2345.0, "ID": 42}
+        benchmarks.append(Benchmark("asserv.format_msg", lambda: asserv.formatMsg(command)))
+
+        # Lidar
+        line = "#".join(
+            f"{-math.pi + 2 * math.pi * index / LIDAR_POINTS:.4f};{300 + 37 * index % 1500}"
+            for index in range(LIDAR_POINTS)
+        )
+        robot_position = Position(1000, 1500, 0.5)
+        benchmarks.append(Benchmark("lidar.parse_measures", lambda: LidarRpA2.parse_measures(line, robot_position)))
+
+        # Détection
+        lidar = SimulatedLidar(asserv, [])
+        lidar.detected_points = LidarRpA2.parse_measures(line, robot_position)
+        detection_manager = DetectionManager(sensors=[], lidar=lidar, asserv=asserv, table_config=table_config)
+        benchmarks.append(Benchmark(
+            "detection.ignore_grid",
+            lambda: DetectionManager(sensors=[], lidar=None, asserv=asserv, table_config=table_config)
+        ))
+        trajectory = [goal, start, goal, start]
+        benchmarks.append(Benchmark(
+            "detection.is_trajectory_blocked", lambda: detection_manager.is_trajectory_blocked(trajectory)
+        ))
+        benchmarks.append(Benchmark(
+            "detection.must_stop", lambda: [detection_manager.must_stop(point) for point in lidar.detected_points]
+        ))
+
+        # AX12 : bus simulé
+        servo = AX12Servo(1, SimulatedAX12Link())
+        params = bytearray([0x1E, 0x00, 0x02])
+        benchmarks.append(Benchmark("ax12.send_request", lambda: servo.send_request(AX12Instr.AX12_INSTR_WRITE_DATA, params)))
+
+        # Stratégie
+        benchmarks.append(Benchmark(
+            "strategy.load", lambda: StrategyManager(year=self.year, robot=self.robot).prepare_objectives(True)
+        ))
+        return benchmarks
+
+    def _path_endpoints(self) -> tuple:
+        """Premier point de passage de la stratégie color0 et le point de passage le plus éloigné."""
+        with open(f'config/{self.year}/{self.robot.value}/strategy.json') as strategy_file:
+            strategy = json.load(strategy_file)['color0']
+        points = [
+            Position(task['position_x'], task['position_y'])
+            for objective in strategy for task in objective['tasks']
+            if task.get('subtype') in ('GOTO', 'GOTO_BACK', 'GOTO_CHAIN') and task.get('position_x') is not None
+        ]
+        if not points:
+            table_config = self.config_data["table"]
+            return Position(300, 300), Position(table_config["sizeX"] - 300, table_config["sizeY"] - 300)
+        return points[0], max(points, key=lambda point: math.hypot(point.x - points[0].x, point.y - points[0].y))
+
+    def test(self) -> None:
+        baseline = {}
+        if os.path.exists(self.baseline_path):
+            with open(self.baseline_path) as baseline_file:
+                baseline = json.load(baseline_file)
+
+        # Les logs (dont "No path found" si les adversaires bloquent le passage) et les sorties
+        # du pathfinding fausseraient les mesures
+        logging.disable(logging.ERROR)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                results = {benchmark.name: benchmark.measure() for benchmark in self.benchmarks()}
+        finally:
+            logging.disable(logging.NOTSET)
+
+        regressions = []
+        self.logger.info(f"  {'Chemin':<36} {'Durée':>12} {'Référence':>12} {'Ratio':>7}")
+        self.logger.info(f"  {'-' * 36} {'-' * 12} {'-' * 12} {'-' * 7}")
+        for name, duration in results.items():
+            reference = baseline.get(name)
+            if reference is None:
+                self.logger.info(f"  {name:<36} {duration:>10.1f}µs {'-':>12} {'-':>7}")
+                continue
+            ratio = duration / reference
+            regressed = ratio > 1 + self.threshold
+            if regressed:
+                regressions.append(name)
+            self.logger.info(f"  {name:<36} {duration:>10.1f}µs {reference:>10.1f}µs {ratio:>6.2f}x"
+                             f"{'  RÉGRESSION' if regressed else ''}")
+
+        if self.update_baseline or not baseline:
+            with open(self.baseline_path, 'w') as baseline_file:
+                json.dump({name: round(duration, 3) for name, duration in results.items()}, baseline_file, indent=2)
+            self.logger.info(f"Référence enregistrée dans {self.baseline_path}")
+        elif regressions:
+            self.logger.error(f"{len(regressions)} régression(s) de plus de {self.threshold:.0%} : {', '.join(regressions)}")
+            sys.exit(1)
@@ -14,9 +14,9 @@ class TestStrategyManager(AbstractTest):
         logger.info(strategy_manager)
         first_objective = strategy_manager.get_next_objective()
         logger.info(f'First objective: {first_objective}')
-        first_step = first_objective.get_next_step([])
+        first_step = first_objective.get_next_step(strategy_manager.action_flags)
         logger.info(f'First step: {first_step}')
-        second_step = first_objective.get_next_step([])
+        second_step = first_objective.get_next_step(strategy_manager.action_flags)
         logger.info(f'Second step: {second_step}')
         second_objective = strategy_manager.get_next_objective()
         logger.info(f'Second objective: {second_objective}')
@@ -27,9 +27,9 @@ class TestStrategyManager(AbstractTest):
         logger.info(strategy_manager)
         first_objective = strategy_manager.get_next_objective()
         logger.info(f'First objective: {first_objective}')
-        first_step = first_objective.get_next_step([])
+        first_step = first_objective.get_next_step(strategy_manager.action_flags)
         logger.info(f'First step: {first_step}')
-        second_step = first_objective.get_next_step([])
+        second_step = first_objective.get_next_step(strategy_manager.action_flags)
         logger.info(f'Second step: {second_step}')
         second_objective = strategy_manager.get_next_objective()
         logger.info(f'Second objective: {second_objective}')
\ No newline at end of file
@@ -0,0 +1,194 @@
+import heapq
+import itertools
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+
+class Clock:
+    """
+    Service d'horloge de l'IA : toutes les attentes et mesures de durée passent par lui.
+
+    Temps monotone en secondes (float, résolution milliseconde ou mieux). L'implémentation de
+    base suit le temps réel ; AcceleratedClock et SteppedClock permettent de jouer un match
+    plus vite que le temps réel (simulation, tests de non-régression).
+    """
+
+    def now(self) -> float:
+        """Temps monotone courant (s)."""
+        return time.monotonic()
+
+    def now_ms(self) -> int:
+        """Temps monotone courant (ms)."""
+        return int(self.now() * 1000)
+
+    def sleep(self, seconds: float) -> None:
+        """Suspend le thread appelant pendant seconds secondes d'horloge."""
+        time.sleep(max(seconds, 0))
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> threading.Timer:
+        """Appelle callback dans delay secondes d'horloge, depuis un autre thread. Retourne un objet annulable (cancel())."""
+        timer = threading.Timer(max(delay, 0), callback)
+        timer.daemon = True
+        timer.start()
+        return timer
+
+    def start_thread(self, target: Callable[[], None]) -> threading.Thread:
+        """Lance target dans un thread daemon qui attend sur cette horloge."""
+        thread = threading.Thread(target=target, daemon=True)
+        thread.start()
+        return thread
+
+    def join(self, thread: threading.Thread) -> None:
+        """Attend la fin d'un thread qui peut lui-même attendre sur cette horloge."""
+        thread.join()
+
+
+SYSTEM_CLOCK = Clock()
+
+
+class AcceleratedClock(Clock):
+    """
+    Horloge qui s'écoule speed fois plus vite que le temps réel : le code tourne tel quel,
+    toutes les attentes sont raccourcies d'autant.
+    """
+
+    def __init__(self, speed: float) -> None:
+        self.speed = speed
+        self._origin = time.monotonic()
+
+    def now(self) -> float:
+        return (time.monotonic() - self._origin) * self.speed
+
+    def sleep(self, seconds: float) -> None:
+        time.sleep(max(seconds, 0) / self.speed)
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> threading.Timer:
+        return super().call_later(delay / self.speed, callback)
+
+
+class _SteppedTimer:
+    def __init__(self) -> None:
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+class SteppedClock(Clock):
+    """
+    Horloge simulée avancée explicitement (advance), indépendante du temps réel.
+
+    Le thread pilote (celui qui crée l'horloge, modifiable via driver) fait avancer le temps :
+        - advance(dt) : avance de dt, appelle les listeners (modèles du monde simulé), déclenche
+          les call_later échus puis laisse tourner les threads dont l'échéance est passée
+        - sleep() appelé par le thread pilote avance lui-même le temps, par pas de tick au plus
+    Les autres threads (actions...) dorment jusqu'à ce que le temps simulé atteigne leur échéance.
+    Ils ne tournent jamais en même temps : ils sont réveillés un par un, par échéance puis par
+    ordre d'endormissement, et le pilote attend qu'ils se rendorment ou se terminent. Un match
+    simulé est ainsi reproductible à l'identique.
+    """
+
+    def __init__(self, tick: float = 0.01, settle_timeout: float = 1.0) -> None:
+        self.tick = tick
+        self.settle_timeout = settle_timeout
+        self.driver = threading.current_thread()
+        self._now = 0.0
+        self._condition = threading.Condition()
+        # Threads endormis : (échéance, numéro d'ordre)
+        self._sleepers: Dict[threading.Thread, Tuple[float, int]] = {}
+        # Threads qui attendent sur l'horloge, vivants
+        self._threads: Set[threading.Thread] = set()
+        self._released: Optional[threading.Thread] = None
+        self._timers: List[tuple] = []
+        self._sequence = itertools.count()
+        self._listeners: List[Callable[[float, float], None]] = []
+
+    def now(self) -> float:
+        return self._now
+
+    def add_listener(self, listener: Callable[[float, float], None]) -> None:
+        """listener(now, dt) est appelé à chaque pas, avant le réveil des threads."""
+        self._listeners.append(listener)
+
+    def advance(self, dt: float) -> None:
+        with self._condition:
+            # Les threads lancés depuis le dernier pas tournent d'abord jusqu'à leur première attente
+            self._settle()
+            self._now += dt
+            now = self._now
+        for listener in self._listeners:
+            listener(now, dt)
+        while self._timers and self._timers[0][0] <= now:
+            _, _, timer, callback = heapq.heappop(self._timers)
+            if not timer.cancelled:
+                callback()
+        with self._condition:
+            self._settle()
+
+    def _settle(self) -> None:
+        """Réveille un par un les threads dont l'échéance est passée, jusqu'à ce que tous attendent une échéance future."""
+        while True:
+            if self._released is not None or any(thread not in self._sleepers for thread in self._threads):
+                # Un thread tourne : on attend (en temps réel, borné) qu'il se rendorme ou se termine
+                if not self._condition.wait(self.settle_timeout):
+                    return
+                continue
+            due = [(entry, thread) for thread, entry in self._sleepers.items() if entry[0] <= self._now]
+            if not due:
+                return
+            self._released = min(due, key=lambda item: item[0])[1]
+            self._condition.notify_all()
+
+    def sleep(self, seconds: float) -> None:
+        thread = threading.current_thread()
+        if thread is self.driver:
+            deadline = self._now + max(seconds, 0)
+            while self._now < deadline - 1e-9:
+                self.advance(min(self.tick, deadline - self._now))
+            return
+        with self._condition:
+            self._threads.add(thread)
+            self._sleepers[thread] = (self._now + max(seconds, 0), next(self._sequence))
+            self._condition.notify_all()
+            while self._released is not thread:
+                self._condition.wait()
+            self._released = None
+            del self._sleepers[thread]
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> _SteppedTimer:
+        timer = _SteppedTimer()
+        with self._condition:
+            heapq.heappush(self._timers, (self._now + max(delay, 0), next(self._sequence), timer, callback))
+        return timer
+
+    def start_thread(self, target: Callable[[], None]) -> threading.Thread:
+        def run() -> None:
+            # Attend son tour avant de démarrer
+            self.sleep(0)
+            try:
+                target()
+            finally:
+                with self._condition:
+                    self._threads.discard(thread)
+                    self._condition.notify_all()
+
+        thread = threading.Thread(target=run, daemon=True)
+        with self._condition:
+            self._threads.add(thread)
+        thread.start()
+        return thread
+
+    def _waiting_on_clock(self, thread: threading.Thread) -> bool:
+        with self._condition:
+            return thread in self._threads
+
+    def join(self, thread: threading.Thread) -> None:
+        if not self._waiting_on_clock(thread):
+            thread.join()
+            return
+        while self._waiting_on_clock(thread):
+            if threading.current_thread() is self.driver:
+                self.advance(self.tick)
+            else:
+                self.sleep(self.tick)
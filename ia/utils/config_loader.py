@@ -12,6 +12,8 @@ def load_config(year: int, robot: str, config_base_path: str = "config") -> Dict
         table_data = json.load(f)
 
     table_data["marge"] = config_data["marge"]
+    # Réglages du pathfinding propres au robot (turnCost, collinearTolerance)
+    table_data.update(config_data.get("pathfinding", {}))
     config_data["table"] = table_data
 
     return config_data
\ No newline at end of file
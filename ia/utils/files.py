@@ -0,0 +1,22 @@
+import os
+import tempfile
+from typing import Union
+
+
+def write_atomic(path: str, content: Union[str, bytes]) -> None:
+    """
+    Écrit content dans path via un fichier temporaire du même dossier, renommé une fois complet :
+    un lecteur (robot au démarrage, simulateur, génération concurrente) ne voit jamais un fichier
+    à moitié écrit, et une génération interrompue laisse l'ancien fichier intact.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temporary_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb" if isinstance(content, bytes) else "w") as temporary_file:
+            temporary_file.write(content)
+        # mkstemp crée le fichier en 0600
+        os.chmod(temporary_path, 0o644)
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.unlink(temporary_path)
+        raise
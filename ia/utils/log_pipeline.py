@@ -0,0 +1,91 @@
+import logging
+import logging.handlers
+import queue
+import time
+from typing import List
+
+
+class RingBufferQueue(queue.Queue):
+    """
+    File bornée qui ne bloque jamais l'émetteur : quand elle est pleine,
+    l'enregistrement le plus ancien est jeté pour faire de la place.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        super().__init__(maxsize)
+        self.dropped = 0
+
+    def put(self, item, block: bool = True, timeout: float = None) -> None:
+        with self.mutex:
+            if 0 < self.maxsize <= self._qsize():
+                self._get()
+                self.dropped += 1
+            self._put(item)
+            self.unfinished_tasks += 1
+            self.not_empty.notify()
+
+
+class DropReportingListener(logging.handlers.QueueListener):
+    """
+    QueueListener qui signale dans les logs les enregistrements jetés par la file,
+    au plus une fois toutes les report_interval secondes.
+    """
+
+    def __init__(self, log_queue: RingBufferQueue, *handlers: logging.Handler, report_interval: float = 5.0) -> None:
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.report_interval = report_interval
+        self._reported = 0
+        self._last_report = 0.0
+
+    def handle(self, record: logging.LogRecord) -> None:
+        super().handle(record)
+        now = time.monotonic()
+        if now - self._last_report >= self.report_interval:
+            self._last_report = now
+            self.report_drops()
+
+    def report_drops(self) -> None:
+        dropped = self.queue.dropped
+        if dropped > self._reported:
+            super().handle(logging.makeLogRecord({
+                "name": __name__,
+                "levelno": logging.WARNING,
+                "levelname": "WARNING",
+                "msg": f"Log queue overloaded: {dropped - self._reported} records dropped ({dropped} total)",
+            }))
+            self._reported = dropped
+
+
+class LogPipeline:
+    """
+    Découple l'émission des logs de leur écriture (fichier, stdout, socket).
+
+    Le logger racine ne porte plus qu'un QueueHandler : un logger.info ne fait que
+    formater le message et l'ajouter à une file bornée. Un thread dédié (QueueListener)
+    vide la file vers les vrais handlers. Si ceux-ci ne suivent pas (lien Wi-Fi lent
+    vers le serveur de logs...), les enregistrements les plus anciens sont jetés et
+    comptés, la boucle de contrôle n'est jamais bloquée.
+    """
+
+    def __init__(self, handlers: List[logging.Handler], size: int = 10000) -> None:
+        self.queue = RingBufferQueue(size)
+        self.queue_handler = logging.handlers.QueueHandler(self.queue)
+        self.listener = DropReportingListener(self.queue, *handlers)
+
+    @property
+    def dropped_records(self) -> int:
+        return self.queue.dropped
+
+    def start(self, logger: logging.Logger = None) -> None:
+        logger = logger if logger is not None else logging.getLogger()
+        logger.addHandler(self.queue_handler)
+        self.listener.start()
+
+    def add_handler(self, handler: logging.Handler) -> None:
+        """Ajoute un handler de sortie (ex : socket, connu après le chargement de la config)."""
+        self.listener.handlers = self.listener.handlers + (handler,)
+
+    def stop(self) -> None:
+        """Vide la file puis arrête le thread d'écriture."""
+        self.listener.stop()
+        self.listener.report_drops()
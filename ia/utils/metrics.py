@@ -0,0 +1,198 @@
+import contextlib
+import threading
+import time
+from typing import Dict, Iterator, List, Union
+
+# Précision des histogrammes : 2^SUB_BUCKET_BITS sous-classes par puissance de 2 (erreur relative < 1/64)
+SUB_BUCKET_BITS = 7
+
+
+class Histogram:
+    """
+    Histogramme de durées à précision relative constante, à la manière de HdrHistogram : les valeurs
+    (secondes) sont comptées en µs dans des classes dont la largeur double à chaque puissance de 2,
+    chacune découpée en sous-classes linéaires. Enregistrer une valeur coûte O(1) et la mémoire ne
+    dépend que de la plage des valeurs ; les percentiles sont exacts à la largeur de classe près.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.count = 0
+            self.total = 0.0
+            self.min = None
+            self.max = None
+            self._buckets: Dict[int, int] = {}
+
+    @staticmethod
+    def _bucket(value_us: int) -> int:
+        """Borne basse (µs) de la classe de value_us."""
+        shift = max(value_us.bit_length() - SUB_BUCKET_BITS, 0)
+        return (value_us >> shift) << shift
+
+    @staticmethod
+    def _bucket_width(bucket: int) -> int:
+        return 1 << max(bucket.bit_length() - SUB_BUCKET_BITS, 0)
+
+    def record(self, seconds: float) -> None:
+        bucket = self._bucket(max(int(seconds * 1e6), 0))
+        with self._lock:
+            self.count += 1
+            self.total += seconds
+            self.min = seconds if self.min is None else min(self.min, seconds)
+            self.max = seconds if self.max is None else max(self.max, seconds)
+            self._buckets[bucket] = self._buckets.get(bucket, 0) + 1
+
+    def percentile(self, percent: float) -> float:
+        """Valeur (s) sous laquelle se trouvent percent % des enregistrements (milieu de sa classe)."""
+        with self._lock:
+            if self.count == 0:
+                return 0.0
+            rank = max(percent / 100 * self.count, 1)
+            seen = 0
+            for bucket in sorted(self._buckets):
+                seen += self._buckets[bucket]
+                if seen >= rank:
+                    value = (bucket + self._bucket_width(bucket) / 2) / 1e6
+                    return min(max(value, self.min), self.max)
+            return self.max
+
+    def snapshot(self) -> Dict:
+        """count, puis moyenne, min, p50, p90, p99 et max en ms."""
+        if self.count == 0:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count * 1000, 3),
+            "min_ms": round(self.min * 1000, 3),
+            "p50_ms": round(self.percentile(50) * 1000, 3),
+            "p90_ms": round(self.percentile(90) * 1000, 3),
+            "p99_ms": round(self.percentile(99) * 1000, 3),
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+    def summary(self) -> str:
+        if self.count == 0:
+            return f"{self.name} : aucune mesure"
+        snapshot = self.snapshot()
+        return (f"{self.name} : n={snapshot['count']} moy={snapshot['mean_ms']}ms p50={snapshot['p50_ms']}ms "
+                f"p90={snapshot['p90_ms']}ms p99={snapshot['p99_ms']}ms max={snapshot['max_ms']}ms")
+
+
+class Counter:
+    """Compteur d'évènements, avec son débit moyen depuis la création (ou la remise à zéro) du registre."""
+
+    def __init__(self, name: str, registry: 'MetricsRegistry') -> None:
+        self.name = name
+        self.registry = registry
+        self._lock = threading.Lock()
+        self.value = 0
+
+    def reset(self) -> None:
+        with self._lock:
+            self.value = 0
+
+    def inc(self, amount: int = 1) -> None:
+        with self._lock:
+            self.value += amount
+
+    def snapshot(self) -> Dict:
+        elapsed = self.registry.uptime()
+        return {"value": self.value, "per_second": round(self.value / elapsed, 3) if elapsed > 0 else None}
+
+    def summary(self) -> str:
+        snapshot = self.snapshot()
+        return f"{self.name} : {snapshot['value']} ({snapshot['per_second']}/s)"
+
+
+class Gauge:
+    """Dernière valeur mesurée d'une grandeur (taille de file, nombre de points...) et son maximum."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.reset()
+
+    def reset(self) -> None:
+        self.value = 0
+        self.max = 0
+
+    def set(self, value: float) -> None:
+        self.value = value
+        if value > self.max:
+            self.max = value
+
+    def snapshot(self) -> Dict:
+        return {"value": self.value, "max": self.max}
+
+    def summary(self) -> str:
+        return f"{self.name} : {self.value} (max {self.max})"
+
+
+Metric = Union[Histogram, Counter, Gauge]
+
+
+class MetricsRegistry:
+    """
+    Registre des métriques de l'IA, par sous-système (préfixe du nom : master_loop, asserv, lidar,
+    detection, actions, pathfinding, comm). Les métriques sont créées au premier usage ; enregistrer
+    une valeur est assez léger pour les boucles chaudes.
+
+    Exposé en JSON par MetricsServer (ia/api/metrics_server.py) et résumé dans les logs en fin de match.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+        self._start = time.monotonic()
+
+    def _get(self, name: str, factory) -> Metric:
+        metric = self._metrics.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.setdefault(name, factory())
+        return metric
+
+    def histogram(self, name: str) -> Histogram:
+        return self._get(name, lambda: Histogram(name))
+
+    def counter(self, name: str) -> Counter:
+        return self._get(name, lambda: Counter(name, self))
+
+    def gauge(self, name: str) -> Gauge:
+        return self._get(name, lambda: Gauge(name))
+
+    @contextlib.contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """Enregistre dans l'histogramme name la durée (temps réel) du bloc with."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.histogram(name).record(time.perf_counter() - start)
+
+    def uptime(self) -> float:
+        return time.monotonic() - self._start
+
+    def reset(self) -> None:
+        for metric in list(self._metrics.values()):
+            metric.reset()
+        self._start = time.monotonic()
+
+    def snapshot(self) -> Dict:
+        """Toutes les métriques, par type puis par nom."""
+        snapshot = {"uptime": round(self.uptime(), 3), "histograms": {}, "counters": {}, "gauges": {}}
+        for name, metric in sorted(self._metrics.items()):
+            kind = "histograms" if isinstance(metric, Histogram) else "counters" if isinstance(metric, Counter) else "gauges"
+            snapshot[kind][name] = metric.snapshot()
+        return snapshot
+
+    def summary(self) -> List[str]:
+        """Une ligne par métrique, pour les logs."""
+        return [metric.summary() for _, metric in sorted(self._metrics.items())]
+
+
+METRICS = MetricsRegistry()
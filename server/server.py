@@ -1,17 +1,27 @@
+import collections
 import logging
 import logging.handlers
 import os
 import pickle
+import selectors
 import socket
-import socketserver
 import struct
 import sys
-import threading
 import time
 
-log_listener = None
 _log_formatter = logging.Formatter('%(asctime)s - %(who)s - %(levelname)s - %(message)s')
 
+COMMUNICATION_PORT = 4269
+# Doit rester identique à ia/api/telemetry.py (le serveur ne dépend pas du package ia)
+TELEMETRY_PORT = 1665
+TELEMETRY_SUBSCRIBE = b"TMSUB"
+TELEMETRY_SUBSCRIPTION_TIMEOUT = 10
+
+# Messages en attente par client au-delà desquels les plus anciens sont jetés
+MAX_CLIENT_QUEUE = 1000
+STATS_INTERVAL = 30
+RECV_SIZE = 65536
+
 
 def setup_logging():
     os.makedirs('logs', exist_ok=True)
@@ -23,109 +33,237 @@ def setup_logging():
     root.addHandler(file_handler)
     root.addHandler(stdout_handler)
 
+
+class Client:
+    """
+    A connection handled by the server loop, with its own outbound queue and statistics.
+
+    kind is None until the handshake ("robot" or "logListener") is received on the communication
+    port, "logSource" for robots sending pickled LogRecords on the logging port.
+    """
+
+    def __init__(self, sock: socket.socket, address, kind: str = None) -> None:
+        self.sock = sock
+        self.address = address
+        self.kind = kind
+        # Client envoyant des messages terminés par '\n' (sinon un recv = un message, ancien protocole)
+        self.framed = False
+        self.inbound = bytearray()
+        self.outbound = collections.deque()  # (bytes, enqueue time)
+        self.out_offset = 0
+        self.sent = 0
+        self.dropped = 0
+        self.max_depth = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+
+    def __str__(self) -> str:
+        return f"{self.kind}{self.address}"
+
+    def stats(self) -> str:
+        latency_avg = self.latency_total / self.sent if self.sent else 0.0
+        return (f"{self}: depth={len(self.outbound)} max_depth={self.max_depth} sent={self.sent} "
+                f"dropped={self.dropped} latency avg={latency_avg * 1000:.1f}ms max={self.latency_max * 1000:.1f}ms")
+
+
 class Server:
     """
     A class to represent the server that handles communication with robots and logging.
+
+    Every socket (robot communication, log listeners, incoming robot logs, telemetry relay)
+    is non-blocking and handled by a single selectors loop. Each client has its own outbound
+    queue, written when its socket is ready: a slow or dead client only delays itself, and once
+    its queue is full its oldest messages are dropped.
     """
 
     def __init__(self) -> None:
         """
         Initializes the Server instance.
         """
-        self.robots = []
-        
+        self.selector = selectors.DefaultSelector()
+        self.clients: list[Client] = []
+        self.telemetry_subscribers = {}
+        self.last_stats = time.monotonic()
+
         self.init_communication_server()
-        self.tcpserver = LogRecordSocketReceiver()
-        print('About to start TCP server...')
-        self.tcpserver.serve_until_stopped()
+        self.init_log_server()
+        self.init_telemetry_relay()
+        print('About to start server loop...')
+        self.serve_forever()
+
+    @property
+    def robots(self) -> list[Client]:
+        return [client for client in self.clients if client.kind == "robot"]
+
+    @property
+    def log_listeners(self) -> list[Client]:
+        return [client for client in self.clients if client.kind == "logListener"]
+
+    def _listen(self, port: int, kind: str = None) -> None:
+        server_socket = socket.socket()
+        server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        server_socket.bind(('', port))  # empty host allow any ip to connect
+        server_socket.listen(10)
+        server_socket.setblocking(False)
+        self.selector.register(server_socket, selectors.EVENT_READ, ("accept", kind))
 
     def init_communication_server(self) -> None:
         """
-        Initializes the communication server socket and starts a thread to accept connections.
+        Initializes the communication server socket (robots and log listeners).
+        """
+        self._listen(COMMUNICATION_PORT)
+
+    def init_log_server(self) -> None:
+        """
+        Initializes the socket receiving the robots logs (pickled LogRecords from logging.handlers.SocketHandler).
+        """
+        self._listen(logging.handlers.DEFAULT_TCP_LOGGING_PORT, "logSource")
+
+    def init_telemetry_relay(self) -> None:
+        """
+        Initializes the UDP telemetry relay.
         """
-        self.communication_server_socket = socket.socket()
-        self.communication_server_socket.bind(('', 4269)) # empty host allow any ip to connect
-        self.communication_server_socket.listen(10)
-        comm_connection_thread = threading.Thread(target=self.accept_communication_connection)
-        comm_connection_thread.daemon = True
-        comm_connection_thread.start()
+        self.telemetry_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.telemetry_socket.bind(('', TELEMETRY_PORT))
+        self.telemetry_socket.setblocking(False)
+        self.selector.register(self.telemetry_socket, selectors.EVENT_READ, ("telemetry", None))
 
-    def accept_communication_connection(self) -> None:
+    def serve_forever(self) -> None:
         """
-        Accepts incoming connections and handles them based on the type of connection.
+        Runs the server loop: accepts connections, reads and dispatches messages and flushes the client queues.
         """
-        global log_listener
         while True:
-            conn, address = self.communication_server_socket.accept()
-            print("Connection from: " + str(address))
-            data = conn.recv(1024).decode()
-            if not data:
-                conn.close()
-                self.robots.remove(conn)
-                print("Accept connection closed")
-                break
-            print("from connected user: " + str(data))
-            if data == "robot":
-                self.robots.append(conn)
-                comm_robots_thread = threading.Thread(target=self.communication_between_robots, args=(conn,))
-                comm_robots_thread.daemon = True
-                comm_robots_thread.start()
-            elif data == "logListener":
-                log_listener = conn
-                print("logListener connected")
-                log_listener.send("logListener connected".encode())
+            for key, events in self.selector.select(timeout=1):
+                role, data = key.data
+                if role == "accept":
+                    self.accept_connection(key.fileobj, data)
+                elif role == "telemetry":
+                    self.relay_telemetry()
+                else:
+                    try:
+                        if events & selectors.EVENT_WRITE and data in self.clients:
+                            self.flush_client(data)
+                        if events & selectors.EVENT_READ and data in self.clients:
+                            self.read_client(data)
+                    except Exception as error:
+                        # Une erreur sur un client (log mal formé, message indécodable...) ne coupe que ce client
+                        print(f"Error on {data}, closing it: {error!r}")
+                        self.close_client(data)
+            if time.monotonic() - self.last_stats > STATS_INTERVAL:
+                self.last_stats = time.monotonic()
+                self.print_stats()
 
-    def communication_between_robots(self, conn: socket):
+    def accept_connection(self, server_socket: socket.socket, kind: str) -> None:
+        """
+        Accepts an incoming connection and registers it in the loop.
         """
-        Handles communication between connected robots.
+        try:
+            conn, address = server_socket.accept()
+        except BlockingIOError:
+            return
+        print("Connection from: " + str(address))
+        conn.setblocking(False)
+        conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        client = Client(conn, address, kind)
+        self.clients.append(client)
+        self.selector.register(conn, selectors.EVENT_READ, ("client", client))
 
-        This method continuously listens for messages from a connected robot
-        and forwards the received messages to all other connected robots.
+    def close_client(self, client: Client) -> None:
+        """
+        Unregisters and closes a client connection.
+        """
+        if client not in self.clients:
+            return
+        print(f"Connection closed: {client.stats()}")
+        self.clients.remove(client)
+        self.selector.unregister(client.sock)
+        client.sock.close()
 
-        Args:
-            conn (socket): The socket connection to the robot.
+    def read_client(self, client: Client) -> None:
         """
-        while True:
-            data = conn.recv(1024).decode()
-            print("from connected robot: " + str(data))
-            if not data:
-                conn.close()
-                self.robots.remove(conn)
-                print("Robot connection closed")
-                break
-            for robot in self.robots:
-                robot.send(data.encode())
+        Reads what is available on a client socket and dispatches the complete messages.
+        """
+        try:
+            data = client.sock.recv(RECV_SIZE)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b""
+        if not data:
+            self.close_client(client)
+            return
+        client.inbound += data
 
-class LogRecordStreamHandler(socketserver.StreamRequestHandler):
-    """
-    Handler for a streaming logging request.
+        if client.kind == "logSource":
+            self.read_log_records(client)
+            return
+        messages = []
+        if client.kind is None:
+            messages = self.handshake(client)
+        if client.kind == "robot":
+            for message in messages + self.pop_messages(client):
+                print("from connected robot: " + message.decode(errors='replace'))
+                self.broadcast(message, self.robots, exclude=client)
+        elif client.kind == "logListener":
+            client.inbound.clear()
 
-    This basically logs the record using whatever logging policy is
-    configured locally.
-    """
+    def handshake(self, client: Client) -> list[bytes]:
+        """
+        Identifies a new client from its first message ("robot" or "logListener").
 
-    def handle(self):
+        Returns the messages received in the same read after the handshake, to be dispatched by the caller.
         """
-        Handle multiple requests - each expected to be a 4-byte length,
-        followed by the LogRecord in pickle format. Logs the record
-        according to whatever policy is configured locally.
+        messages = self.pop_messages(client, first=True)
+        if not messages:
+            return []
+        name = messages[0].decode(errors='replace').strip()
+        print("from connected user: " + name)
+        if name == "robot":
+            client.kind = "robot"
+        elif name == "logListener":
+            client.kind = "logListener"
+            print("logListener connected")
+            self.enqueue(client, b"logListener connected\n")
+        else:
+            self.close_client(client)
+            return []
+        return messages[1:]
+
+    @staticmethod
+    def pop_messages(client: Client, first: bool = False) -> list[bytes]:
         """
+        Extracts complete messages from the client buffer.
 
-        global log_listener
-        while True:
-            chunk = self.connection.recv(4)
-            if len(chunk) < 4:
+        Messages are terminated by '\\n'. A client whose handshake has no terminator uses the former
+        protocol, where every read is a message.
+        """
+        if first:
+            client.framed = b"\n" in client.inbound
+        if not client.framed:
+            messages = [bytes(client.inbound)] if client.inbound else []
+            client.inbound.clear()
+            return messages
+        *messages, rest = bytes(client.inbound).split(b"\n")
+        client.inbound = bytearray(rest)
+        return [message for message in messages if message]
+
+    def read_log_records(self, client: Client) -> None:
+        """
+        Decodes the complete LogRecords (4-byte length followed by the pickle) received from a robot,
+        logs them locally and forwards them to the log listeners.
+        """
+        while len(client.inbound) >= 4:
+            slen = struct.unpack('>L', client.inbound[:4])[0]
+            if len(client.inbound) < 4 + slen:
                 break
-            slen = struct.unpack('>L', chunk)[0]
-            chunk = self.connection.recv(slen)
-            while len(chunk) < slen:
-                chunk = chunk + self.connection.recv(slen - len(chunk))
-            obj = self.unPickle(chunk)
+            obj = self.unPickle(bytes(client.inbound[4:4 + slen]))
+            del client.inbound[:4 + slen]
 
             record = logging.makeLogRecord(obj)
             logging.getLogger('').handle(record)
-            if log_listener is not None:
-                log_listener.send((_log_formatter.format(record) + '\n').encode())
+            if self.log_listeners:
+                line = (_log_formatter.format(record) + '\n').encode()
+                self.broadcast(line, self.log_listeners)
 
     def unPickle(self, data):
         """
@@ -139,47 +277,94 @@ class LogRecordStreamHandler(socketserver.StreamRequestHandler):
         """
         return pickle.loads(data)
 
-class LogRecordSocketReceiver(socketserver.ThreadingTCPServer):
-    """
-    Simple TCP socket-based logging receiver suitable for testing.
-    """
+    def broadcast(self, message: bytes, clients: list[Client], exclude: Client = None) -> None:
+        """
+        Queues a message for every given client, framed according to the protocol of each one.
+        """
+        for client in clients:
+            if client is exclude:
+                continue
+            if client.kind == "robot" and client.framed:
+                self.enqueue(client, message + b"\n")
+            else:
+                self.enqueue(client, message)
 
-    allow_reuse_address = True
+    def enqueue(self, client: Client, payload: bytes) -> None:
+        """
+        Adds a message to the client outbound queue, dropping the oldest one if the queue is full.
+        """
+        if len(client.outbound) >= MAX_CLIENT_QUEUE:
+            # Le message en cours d'envoi doit être terminé, on jette le suivant
+            index = 1 if client.out_offset else 0
+            if index < len(client.outbound):
+                del client.outbound[index]
+                client.dropped += 1
+        client.outbound.append((payload, time.monotonic()))
+        client.max_depth = max(client.max_depth, len(client.outbound))
+        self.selector.modify(client.sock, selectors.EVENT_READ | selectors.EVENT_WRITE, ("client", client))
 
-    def __init__(self, host='',
-                 port=logging.handlers.DEFAULT_TCP_LOGGING_PORT,
-                 handler=LogRecordStreamHandler) -> None:
+    def flush_client(self, client: Client) -> None:
         """
-        Simple TCP socket-based logging receiver suitable for testing.
+        Writes as much of the client outbound queue as its socket accepts.
         """
+        while client.outbound:
+            payload, enqueued = client.outbound[0]
+            try:
+                sent = client.sock.send(memoryview(payload)[client.out_offset:])
+            except BlockingIOError:
+                return
+            except OSError:
+                self.close_client(client)
+                return
+            client.out_offset += sent
+            if client.out_offset < len(payload):
+                return
+            client.outbound.popleft()
+            client.out_offset = 0
+            latency = time.monotonic() - enqueued
+            client.sent += 1
+            client.latency_total += latency
+            client.latency_max = max(client.latency_max, latency)
+        self.selector.modify(client.sock, selectors.EVENT_READ, ("client", client))
 
-        socketserver.ThreadingTCPServer.__init__(self, (host, port), handler)
-        self.abort = 0
-        self.timeout = 1
-        self.logname = None
+    def relay_telemetry(self) -> None:
+        """
+        Forwards robot telemetry datagrams to every subscriber without decoding them.
 
-    def serve_until_stopped(self):
+        A client subscribes (or renews its subscription) by sending TELEMETRY_SUBSCRIBE,
+        subscriptions expire after TELEMETRY_SUBSCRIPTION_TIMEOUT seconds.
         """
-        Serve requests until the server is stopped.
+        while True:
+            try:
+                data, address = self.telemetry_socket.recvfrom(65535)
+            except (BlockingIOError, ConnectionResetError):
+                return
+            now = time.monotonic()
+            if data == TELEMETRY_SUBSCRIBE:
+                if address not in self.telemetry_subscribers:
+                    print("Telemetry subscriber: " + str(address))
+                self.telemetry_subscribers[address] = now
+                continue
+            for subscriber, last_seen in list(self.telemetry_subscribers.items()):
+                if now - last_seen > TELEMETRY_SUBSCRIPTION_TIMEOUT:
+                    del self.telemetry_subscribers[subscriber]
+                    continue
+                try:
+                    self.telemetry_socket.sendto(data, subscriber)
+                except BlockingIOError:
+                    pass
+                except OSError:
+                    del self.telemetry_subscribers[subscriber]
 
-        This method uses the `select` module to wait for incoming connections
-        and handle them. It continues to serve requests until the `abort`
-        attribute is set to a non-zero value.
+    def print_stats(self) -> None:
+        """
+        Prints the queue depth, drops and latency of every client.
         """
+        for client in self.clients:
+            if client.kind in ("robot", "logListener"):
+                print(client.stats())
 
-        import select
-        abort = 0
-        while not abort:
-            rd, wr, ex = select.select([self.socket.fileno()],
-                                       [], [],
-                                       self.timeout)
-            if rd:
-                self.handle_request()
-            abort = self.abort
 
 if __name__ == '__main__':
     setup_logging()
     server = Server()
-    while True:
-        time.sleep(1)
-        pass
\ No newline at end of file
@@ -0,0 +1,256 @@
+"""
+Index des fichiers de log pour la relecture dans le simulateur.
+
+Un passage unique sur le fichier (projeté en mémoire avec mmap) construit des tableaux NumPy :
+offset et instant de chaque ligne, émetteur, type de ligne, ainsi que les pistes de positions
+("Position : {...}" de l'asserv) et de détections (SRF, lidar). La relecture et la recherche d'un
+instant (O(log n), np.searchsorted) n'ont plus besoin d'analyser les lignes.
+L'index est mis en cache à côté du log (<log>.idx.npz) et reconstruit si le log a changé.
+"""
+
+import mmap
+import os
+from datetime import datetime
+
+import numpy as np
+
+INDEX_VERSION = 1
+INDEX_SUFFIX = ".idx.npz"
+
+# Type de chaque ligne
+KIND_TEXT = 0
+KIND_POSE = 1
+KIND_DETECTION = 2
+KIND_DEBUG = 3
+
+# Les temps morts du log sont ramenés à MAX_GAP secondes sur la ligne de temps de relecture
+MAX_GAP = 0.5
+
+MATCH_WAIT = "Attente lancement match".encode()
+MATCH_START = "Match lancé".encode()
+SEPARATOR = b" - "
+POSE_PREFIX = b"Position :"
+SRF_DETECTION = b"at position ("
+LIDAR_DETECTION = b"Lidar detection: Position(x="
+
+
+class LogIndex:
+    """
+    Index d'un fichier de log au format '%(asctime)s - %(name)s - %(levelname)s - %(message)s'.
+
+    Tableaux (une entrée par ligne non vide) :
+        offsets, lengths : position de la ligne dans le fichier
+        times : instant de la ligne (s, epoch), celui de la ligne précédente pour les lignes sans horodatage
+        timeline : instant de relecture (s depuis la première ligne), temps morts plafonnés à MAX_GAP
+                   et attente de la tirette supprimée
+        robots : indice de l'émetteur dans names
+        kinds : KIND_TEXT, KIND_POSE, KIND_DETECTION ou KIND_DEBUG
+    Pistes : poses (line, x, y, theta) et detections (line, x, y), line étant l'indice de la ligne.
+    """
+
+    def __init__(self, path: str, arrays: dict) -> None:
+        self.path = path
+        self.names = [str(name) for name in arrays["names"]]
+        self.offsets = arrays["offsets"]
+        self.lengths = arrays["lengths"]
+        self.times = arrays["times"]
+        self.timeline = arrays["timeline"]
+        self.robots = arrays["robots"]
+        self.kinds = arrays["kinds"]
+        self.poses = arrays["poses"]
+        self.detections = arrays["detections"]
+        self._file = open(path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if len(self.offsets) else None
+        # Poses de chaque émetteur, pour pose_at
+        self._robot_poses = {
+            robot: self.poses[self.robots[self.poses["line"]] == robot]
+            for robot in np.unique(self.robots[self.poses["line"]])
+        }
+
+    @classmethod
+    def open(cls, path: str, use_cache: bool = True) -> 'LogIndex':
+        """Charge l'index en cache s'il correspond au fichier, sinon le construit (et le met en cache)."""
+        stat = os.stat(path)
+        signature = np.array([INDEX_VERSION, stat.st_size, stat.st_mtime_ns], dtype=np.int64)
+        cache_path = path + INDEX_SUFFIX
+        if use_cache and os.path.exists(cache_path):
+            try:
+                with np.load(cache_path) as cached:
+                    if np.array_equal(cached["signature"], signature):
+                        return cls(path, {key: cached[key] for key in cached.files})
+            except (OSError, ValueError, KeyError):
+                pass
+        arrays = cls.build(path)
+        if use_cache:
+            try:
+                with open(cache_path, "wb") as cache_file:
+                    np.savez(cache_file, signature=signature, **arrays)
+            except OSError:
+                pass
+        return cls(path, arrays)
+
+    @staticmethod
+    def build(path: str) -> dict:
+        """Construit les tableaux de l'index en un passage sur le fichier."""
+        offsets, lengths, times, timeline, robots, kinds = [], [], [], [], [], []
+        poses, detections = [], []
+        names: dict[bytes, int] = {}
+        hours: dict[bytes, float] = {}
+
+        size = os.path.getsize(path)
+        with open(path, "rb") as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+            try:
+                previous = None
+                elapsed = 0.0
+                waiting = False
+                start = 0
+                while start < size:
+                    end = data.find(b"\n", start)
+                    if end < 0:
+                        end = size
+                    line = data[start:end].rstrip(b"\r")
+                    offset, start = start, end + 1
+                    stripped = line.strip()
+                    if not stripped:
+                        continue
+
+                    timestamp = _parse_timestamp(stripped, hours)
+                    if timestamp is None:
+                        timestamp = previous if previous is not None else 0.0
+                    # Saut de l'attente de la tirette, comme la relecture ligne à ligne
+                    if MATCH_WAIT in stripped:
+                        waiting = True
+                    if previous is not None and not waiting:
+                        elapsed += min(max(timestamp - previous, 0.0), MAX_GAP)
+                    if waiting and MATCH_START in stripped:
+                        waiting = False
+                    previous = timestamp
+
+                    parts = stripped.split(SEPARATOR, 3)
+                    who, level, message = (parts[1].strip(), parts[2].strip(), parts[3]) if len(parts) == 4 else (b"", b"", stripped)
+                    robot = names.setdefault(who, len(names))
+                    line_index = len(offsets)
+                    kind = KIND_DEBUG if level == b"DEBUG" else KIND_TEXT
+                    if message.startswith(POSE_PREFIX):
+                        pose = _parse_pose(message)
+                        if pose is not None:
+                            poses.append((line_index, *pose))
+                            kind = KIND_POSE
+                    elif SRF_DETECTION in message or message.startswith(LIDAR_DETECTION):
+                        point = _parse_detection(message)
+                        if point is not None:
+                            detections.append((line_index, *point))
+                            kind = KIND_DETECTION
+
+                    offsets.append(offset)
+                    lengths.append(len(line))
+                    times.append(timestamp)
+                    timeline.append(elapsed)
+                    robots.append(robot)
+                    kinds.append(kind)
+            finally:
+                if size:
+                    data.close()
+
+        return {
+            "names": np.array([name.decode(errors="replace") for name in names] or [""]),
+            "offsets": np.array(offsets, dtype=np.int64),
+            "lengths": np.array(lengths, dtype=np.int32),
+            "times": np.array(times, dtype=np.float64),
+            "timeline": np.array(timeline, dtype=np.float64),
+            "robots": np.array(robots, dtype=np.int16),
+            "kinds": np.array(kinds, dtype=np.uint8),
+            "poses": np.array(poses, dtype=[("line", np.int32), ("x", np.float32), ("y", np.float32), ("theta", np.float32)]),
+            "detections": np.array(detections, dtype=[("line", np.int32), ("x", np.float32), ("y", np.float32)]),
+        }
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    @property
+    def duration(self) -> float:
+        """Durée de la ligne de temps de relecture (s)."""
+        return float(self.timeline[-1]) if len(self.timeline) else 0.0
+
+    def seek(self, t: float) -> int:
+        """Indice de la première ligne d'instant de relecture strictement supérieur à t."""
+        return int(np.searchsorted(self.timeline, t, side="right"))
+
+    def line(self, index: int) -> str:
+        start = int(self.offsets[index])
+        return self._mmap[start:start + int(self.lengths[index])].decode("utf-8", errors="replace").strip()
+
+    def name(self, index: int) -> str:
+        """Émetteur de la ligne."""
+        return self.names[self.robots[index]]
+
+    def pose_at(self, robot: str, t: float):
+        """Dernière position (x, y, theta) de l'émetteur robot à l'instant de relecture t, None s'il n'en a pas."""
+        if robot not in self.names:
+            return None
+        poses = self._robot_poses.get(self.names.index(robot))
+        if poses is None:
+            return None
+        position = int(np.searchsorted(self.timeline[poses["line"]], t, side="right"))
+        if position == 0:
+            return None
+        pose = poses[position - 1]
+        return float(pose["x"]), float(pose["y"]), float(pose["theta"])
+
+    def pose(self, index: int):
+        """Position (x, y, theta) portée par une ligne KIND_POSE."""
+        pose = self.poses[np.searchsorted(self.poses["line"], index)]
+        return float(pose["x"]), float(pose["y"]), float(pose["theta"])
+
+    def detection(self, index: int):
+        """Point (x, y) porté par une ligne KIND_DETECTION."""
+        point = self.detections[np.searchsorted(self.detections["line"], index)]
+        return float(point["x"]), float(point["y"])
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+        self._file.close()
+
+
+def _parse_timestamp(line: bytes, hours: dict) -> float | None:
+    """Horodatage 'AAAA-MM-JJ HH:MM:SS,mmm' en début de ligne, sans strptime (heure locale mise en cache)."""
+    if len(line) < 23 or line[4:5] != b"-" or line[10:11] != b" " or line[19:20] != b",":
+        return None
+    hour = line[:13]
+    base = hours.get(hour)
+    try:
+        if base is None:
+            base = datetime.strptime(hour.decode(), "%Y-%m-%d %H").timestamp()
+            hours[hour] = base
+        return base + int(line[14:16]) * 60 + int(line[17:19]) + int(line[20:23]) / 1000
+    except ValueError:
+        return None
+
+
+def _number_after(message: bytes, key: bytes) -> float:
+    start = message.index(key) + len(key)
+    end = start
+    while end < len(message) and message[end] not in b",})":
+        end += 1
+    return float(message[start:end])
+
+
+def _parse_pose(message: bytes):
+    """x, y, theta d'une ligne "Position : {'x': ..., 'y': ..., 'theta': ...}"."""
+    try:
+        return _number_after(message, b"'x': "), _number_after(message, b"'y': "), _number_after(message, b"'theta': ")
+    except ValueError:
+        return None
+
+
+def _parse_detection(message: bytes):
+    """x, y d'une détection SRF "... at position (x,y)" ou lidar "Lidar detection: Position(x=X, y=Y, ...)"."""
+    try:
+        if SRF_DETECTION in message:
+            x, _, y = message[message.index(SRF_DETECTION) + len(SRF_DETECTION):].partition(b",")
+            return float(x), float(y.partition(b")")[0])
+        return _number_after(message, b"Position(x="), _number_after(message, b"y=")
+    except ValueError:
+        return None
@@ -11,10 +11,13 @@ import os
 import re
 import socket
 import sys
+import threading
 import time
 from datetime import datetime
 
-from PySide6.QtCore import QRectF, QPointF, QTimer, QElapsedTimer, Qt, QLocale, QObject, QThread, Signal
+import numpy as np
+
+from PySide6.QtCore import QLineF, QRectF, QPointF, QTimer, QElapsedTimer, Qt, QLocale, QObject, QThread, Signal
 from PySide6.QtGui import QPainter, QColor, QPen, QBrush, QPolygonF, QPixmap, QFont
 from PySide6.QtSvg import QSvgRenderer
 from PySide6.QtWidgets import (
@@ -24,6 +27,16 @@ from PySide6.QtWidgets import (
     QFileDialog, QSlider,
 )
 
+try:
+    from simulator.log_index import KIND_DETECTION, KIND_POSE, KIND_TEXT, LogIndex
+except ImportError:
+    # Lancé en script depuis le dossier simulator : la racine du dépôt donne aussi accès au package ia
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from log_index import KIND_DETECTION, KIND_POSE, KIND_TEXT, LogIndex
+
+# Protocole de télémétrie binaire défini une seule fois, côté robot
+from ia.api.telemetry import SUBSCRIBE as TELEMETRY_SUBSCRIBE, RecordType, decode_batch
+
 # Chemin du dossier simulation, relatif à ce fichier
 SIMULATION_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "")
 
@@ -41,11 +54,21 @@ ROBOT_TRAIL_COLORS = [
     QColor(200, 100, 255),  # violet
 ]
 
+# Traces : un point intermédiaire à moins de TRAIL_TOLERANCE mm de la ligne simplifiée est supprimé
+TRAIL_TOLERANCE = 2.0
+TRAIL_MAX_RUN = 64
+
 # Paramètres d'animation
 ANIM_INTERVAL_MS = 16        # ~60 FPS
 ANIM_ROTATION_SPEED = 3.0   # radians / seconde
 ANIM_MOVE_SPEED = 1500.0     # unités table / seconde (1 unité = 1 mm → 1.5 m/s)
 
+# Renouvellement (s) de l'abonnement au relais de télémétrie du serveur
+TELEMETRY_SUBSCRIBE_INTERVAL = 2.0
+
+# Relecture de logs : lignes du journal réaffichées après un déplacement sur la ligne de temps
+REPLAY_CONTEXT_LINES = 100
+
 
 def normalize_angle(angle: float) -> float:
     """Normalise un angle dans l'intervalle ]-π, π]."""
@@ -56,6 +79,16 @@ def normalize_angle(angle: float) -> float:
     return angle
 
 
+def _distance_to_line(px: float, py: float, x1: float, y1: float, x2: float, y2: float) -> float:
+    """Distance du point (px, py) au segment (x1, y1) - (x2, y2)."""
+    dx, dy = x2 - x1, y2 - y1
+    length_sq = dx * dx + dy * dy
+    if length_sq == 0:
+        return math.hypot(px - x1, py - y1)
+    t = max(0.0, min(1.0, ((px - x1) * dx + (py - y1) * dy) / length_sq))
+    return math.hypot(px - (x1 + t * dx), py - (y1 + t * dy))
+
+
 def get_available_years():
     """Retourne la liste des années pour lesquelles un fichier table.svg existe."""
     years = []
@@ -156,9 +189,15 @@ class TableWidget(QWidget):
         # Cache du fond (SVG + zones) — invalide quand zoom/pan/zones changent
         self._bg_cache: QPixmap | None = None
 
-        # Traces persistantes : liste de (x1, y1, x2, y2, QColor) en coords table
+        # Traces persistantes : liste de (x1, y1, x2, y2, QColor) en coords table, simplifiées à l'ajout
         self._trails: list[tuple[float, float, float, float, QColor]] = []
         self._active_trails: dict[int, tuple] = {}  # robot_idx → trace en cours
+        # robot_idx → (indice dans _trails du dernier segment, points qu'il remplace)
+        self._trail_runs: dict[int, tuple[int, list[tuple[float, float]]]] = {}
+        # Calque des traces persistantes, complété à chaque frame par les segments en attente
+        self._trail_cache: QPixmap | None = None
+        self._trail_cache_key: tuple | None = None
+        self._trail_pending: list[tuple[float, float, float, float, QColor]] = []
 
         # Animation — une file et une étape courante par robot
         self._anim_queues: dict[int, list[dict]] = {}    # robot_idx → steps en attente
@@ -171,6 +210,8 @@ class TableWidget(QWidget):
 
         # Détections temps réel : liste de {x, y, color, expire} en coords table
         self._detections: list[dict] = []
+        # Hachage spatial pour la déduplication : (couleur, case x, case y) → détections
+        self._detection_grid: dict[tuple[str, int, int], list[dict]] = {}
         self._detection_cleanup_timer = QTimer(self)
         self._detection_cleanup_timer.setInterval(100)
         self._detection_cleanup_timer.timeout.connect(self._cleanup_detections)
@@ -189,8 +230,7 @@ class TableWidget(QWidget):
         self._pan = QPointF(0.0, 0.0)
         self._bg_cache = None
         self._speed_factor = 1.0
-        self._trails.clear()
-        self._active_trails.clear()
+        self._clear_trails()
         self._anim_queues.clear()
         self._anim_currents.clear()
         self._anim_timer.stop()
@@ -333,27 +373,42 @@ class TableWidget(QWidget):
     _DETECTION_DISPLAY_RADIUS = 200   # mm — rayon du cercle affiché
     _DETECTION_DEDUP_RADIUS_SQ = 150 * 150  # mm² — seuil de déduplication spatiale
     _DETECTION_LIFETIME = 1.0         # secondes
+    _DETECTION_GRID_CELL = 150        # mm — côté d'une case du hachage spatial (= rayon de déduplication)
 
     def add_detection(self, x: float, y: float, color: QColor):
         """
         Ajoute une détection d'obstacle à afficher pendant 1 s.
         Si une détection de même couleur existe déjà à moins de 150 mm,
         son timer est simplement rafraîchi (évite de surcharger l'affichage).
+        Seules les 9 cases du hachage spatial autour du point sont parcourues.
         """
         now = time.monotonic()
         expire = now + self._DETECTION_LIFETIME
-        for det in self._detections:
-            if det["color"].name() == color.name():
-                dx = det["x"] - x
-                dy = det["y"] - y
-                if dx * dx + dy * dy <= self._DETECTION_DEDUP_RADIUS_SQ:
-                    det["expire"] = expire
-                    return
-        self._detections.append({"x": x, "y": y, "color": QColor(color), "expire": expire})
+        color_name = color.name()
+        cell_x = int(x // self._DETECTION_GRID_CELL)
+        cell_y = int(y // self._DETECTION_GRID_CELL)
+        for neighbour_x in (cell_x - 1, cell_x, cell_x + 1):
+            for neighbour_y in (cell_y - 1, cell_y, cell_y + 1):
+                for det in self._detection_grid.get((color_name, neighbour_x, neighbour_y), ()):
+                    dx = det["x"] - x
+                    dy = det["y"] - y
+                    if dx * dx + dy * dy <= self._DETECTION_DEDUP_RADIUS_SQ:
+                        det["expire"] = expire
+                        return
+        det = {"x": x, "y": y, "color": QColor(color), "expire": expire}
+        self._detections.append(det)
+        self._detection_grid.setdefault((color_name, cell_x, cell_y), []).append(det)
         if not self._detection_cleanup_timer.isActive():
             self._detection_cleanup_timer.start()
         self.update()
 
+    def clear_detections(self):
+        """Efface toutes les détections affichées."""
+        self._detections.clear()
+        self._detection_grid.clear()
+        self._detection_cleanup_timer.stop()
+        self.update()
+
     def _cleanup_detections(self):
         """Retire les détections expirées et arrête le timer si la liste est vide."""
         now = time.monotonic()
@@ -362,6 +417,11 @@ class TableWidget(QWidget):
         if not self._detections:
             self._detection_cleanup_timer.stop()
         if len(self._detections) != before:
+            self._detection_grid = {}
+            for det in self._detections:
+                key = (det["color"].name(), int(det["x"] // self._DETECTION_GRID_CELL),
+                       int(det["y"] // self._DETECTION_GRID_CELL))
+                self._detection_grid.setdefault(key, []).append(det)
             self.update()
 
     def _draw_detections(self, painter: QPainter, scale: float,
@@ -416,15 +476,72 @@ class TableWidget(QWidget):
 
     # --- Traces persistantes ---------------------------------------------------
 
+    def _clear_trails(self):
+        self._trails.clear()
+        self._active_trails.clear()
+        self._trail_runs.clear()
+        self._trail_pending.clear()
+        self._trail_cache = None
+
+    def _add_trail(self, robot_idx: int, x1: float, y1: float, x2: float, y2: float, color: QColor):
+        """
+        Ajoute un segment de trace persistante en le fusionnant si possible avec le précédent
+        du même robot (simplification incrémentale façon Douglas-Peucker) : tant que tous les
+        points remplacés restent à moins de TRAIL_TOLERANCE mm de la ligne, un seul segment est gardé.
+        """
+        run = self._trail_runs.get(robot_idx)
+        if run is not None:
+            index, points = run
+            px1, py1, px2, py2, pcolor = self._trails[index]
+            if (px2, py2) == (x1, y1) and pcolor == color and len(points) < TRAIL_MAX_RUN:
+                points.append((x1, y1))
+                if all(_distance_to_line(px, py, px1, py1, x2, y2) <= TRAIL_TOLERANCE for px, py in points):
+                    merged = (px1, py1, x2, y2, color)
+                    self._trails[index] = merged
+                    self._trail_pending.append(merged)
+                    return
+        segment = (x1, y1, x2, y2, color)
+        self._trail_runs[robot_idx] = (len(self._trails), [])
+        self._trails.append(segment)
+        self._trail_pending.append(segment)
+
+    def _draw_segments(self, painter: QPainter, segments: list, scale: float,
+                       offset_x: float, offset_y: float):
+        """Dessine des segments en un appel drawLines par couleur."""
+        lines_by_color: dict[int, tuple[QColor, list[QLineF]]] = {}
+        for x1, y1, x2, y2, color in segments:
+            lines = lines_by_color.setdefault(color.rgba(), (color, []))[1]
+            lines.append(QLineF(offset_x + y1 * scale, offset_y + x1 * scale,
+                                offset_x + y2 * scale, offset_y + x2 * scale))
+        for color, lines in lines_by_color.values():
+            painter.setPen(QPen(color, 2))
+            painter.drawLines(lines)
+
     def _draw_trails(self, painter: QPainter, scale: float,
                      offset_x: float, offset_y: float):
-        """Dessine les traces de déplacement (lignes persistantes + trace en cours)."""
-        all_trails = list(self._trails) + list(self._active_trails.values())
-        for x1, y1, x2, y2, color in all_trails:
-            p1 = self._to_screen(x1, y1, scale, offset_x, offset_y)
-            p2 = self._to_screen(x2, y2, scale, offset_x, offset_y)
-            painter.setPen(QPen(color, 2))
-            painter.drawLine(p1, p2)
+        """
+        Dessine les traces de déplacement : les traces persistantes viennent d'un calque mis en cache,
+        complété par les seuls nouveaux segments et redessiné entièrement quand la vue change ;
+        la trace en cours est dessinée directement.
+        """
+        key = (self.width(), self.height(), scale, offset_x, offset_y)
+        if self._trail_cache is None or self._trail_cache_key != key:
+            self._trail_cache = QPixmap(self.size())
+            self._trail_cache.fill(Qt.GlobalColor.transparent)
+            self._trail_cache_key = key
+            pending = self._trails
+        else:
+            pending = self._trail_pending
+        if pending:
+            trail_painter = QPainter(self._trail_cache)
+            trail_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            self._draw_segments(trail_painter, pending, scale, offset_x, offset_y)
+            trail_painter.end()
+        self._trail_pending = []
+
+        painter.drawPixmap(0, 0, self._trail_cache)
+        if self._active_trails:
+            self._draw_segments(painter, list(self._active_trails.values()), scale, offset_x, offset_y)
 
     # --- Animation -------------------------------------------------------------
 
@@ -465,6 +582,20 @@ class TableWidget(QWidget):
         if not self._anim_timer.isActive():
             self._anim_timer.start(ANIM_INTERVAL_MS)
 
+    def place_robot(self, robot_id: str, x: float, y: float, theta: float):
+        """Place un robot sans animation (annule ses animations en cours et en attente)."""
+        robot_idx = next(
+            (i for i, r in enumerate(self._robots) if r["id"] == robot_id), None
+        )
+        if robot_idx is None:
+            return
+        self._anim_queues.pop(robot_idx, None)
+        self._anim_currents.pop(robot_idx, None)
+        self._active_trails.pop(robot_idx, None)
+        robot = self._robots[robot_idx]
+        robot["x"], robot["y"], robot["theta"] = x, y, theta
+        self.update()
+
     def animate_robot_orbital(self, robot_id: str, degrees: float, forward: bool,
                               on_right_wheel: bool, trail_color: QColor):
         """Enfile une animation de rotation orbitale autour d'une roue codeuse."""
@@ -589,20 +720,13 @@ class TableWidget(QWidget):
                 robot["y"] = anim["center_y"] + anim["radius"] * math.sin(angle)
                 robot["theta"] = anim["from_theta"] + anim["rot"] * t
                 if anim.get("trail_color"):
-                    # Persister chaque petit segment pour dessiner l'arc
-                    self._trails.append((
-                        prev_x, prev_y,
-                        robot["x"], robot["y"],
-                        anim["trail_color"],
-                    ))
+                    # Persister chaque petit segment pour dessiner l'arc (simplifié à l'ajout)
+                    self._add_trail(robot_idx, prev_x, prev_y, robot["x"], robot["y"], anim["trail_color"])
 
             if t >= 1.0:
                 if anim["type"] == "move" and anim.get("trail_color"):
-                    self._trails.append((
-                        anim["from_x"], anim["from_y"],
-                        anim["to_x"], anim["to_y"],
-                        anim["trail_color"],
-                    ))
+                    self._add_trail(robot_idx, anim["from_x"], anim["from_y"], anim["to_x"], anim["to_y"],
+                                    anim["trail_color"])
                     self._active_trails.pop(robot_idx, None)
                 self._start_next_anim(robot_idx)
 
@@ -613,8 +737,7 @@ class TableWidget(QWidget):
         self._anim_timer.stop()
         self._anim_queues.clear()
         self._anim_currents.clear()
-        self._active_trails.clear()
-        self._trails.clear()
+        self._clear_trails()
         self._speed_factor = 1.0
         for robot in self._robots:
             robot["x"] = robot.get("init_x", robot["x"])
@@ -1021,8 +1144,9 @@ class StrategyWindow(QWidget):
         )
         color = robot.get("trail_color", QColor(200, 200, 200)) if robot else QColor(200, 200, 200)
 
-        # Log dans la couleur du robot
-        self._log_text(f"[{robot_id}]  {task}  :  {command}", color)
+        # Log dans la couleur du robot (avec l'ETA estimée par le générateur de stratégie si présente)
+        eta = f"  (ETA {instr['eta']:.1f}s)" if "eta" in instr else ""
+        self._log_text(f"[{robot_id}]  {task}  :  {command}{eta}", color)
 
         # --- Commandes spéciales ---
         if command.startswith("delete-zone#"):
@@ -1205,10 +1329,76 @@ class LogSocketWorker(QObject):
                 pass
 
 
+class TelemetryWorker(QObject):
+    """
+    Worker tournant dans un QThread séparé.
+    S'abonne au relais de télémétrie du serveur (UDP) et décode les poses et détections.
+    """
+    pose_received = Signal(str, float, float, float)        # robot, x, y, theta
+    detections_received = Signal(str, list)                 # robot, [(x, y)]
+
+    def __init__(self, host: str, port: int):
+        super().__init__()
+        self._host = host
+        self._port = port
+        self._running = False
+        self._sock = None
+
+    def start_listening(self):
+        self._running = True
+        try:
+            self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self._sock.settimeout(0.5)
+            last_subscribe = 0.0
+            while self._running:
+                # L'abonnement expire côté serveur, on le renouvelle régulièrement
+                if time.monotonic() - last_subscribe > TELEMETRY_SUBSCRIBE_INTERVAL:
+                    self._sock.sendto(TELEMETRY_SUBSCRIBE, (self._host, self._port))
+                    last_subscribe = time.monotonic()
+                try:
+                    data, _ = self._sock.recvfrom(65535)
+                except socket.timeout:
+                    continue
+                self._decode(data)
+        except OSError:
+            pass
+        finally:
+            if self._sock:
+                try:
+                    self._sock.close()
+                except OSError:
+                    pass
+
+    def _decode(self, data: bytes):
+        decoded = decode_batch(data)
+        if decoded is None:
+            return
+        robot_id, records = decoded
+        pose = None
+        detections = []
+        for record_type, _timestamp, values in records:
+            if record_type == RecordType.POSE:
+                pose = values
+            elif record_type == RecordType.DETECTION:
+                _source, x, y = values
+                detections.append((x, y))
+            elif record_type == RecordType.LIDAR_FRAME:
+                detections.extend(values)
+        # Seule la dernière pose du lot est animée
+        if pose is not None:
+            self.pose_received.emit(robot_id, float(pose[0]), float(pose[1]), float(pose[2]))
+        if detections:
+            self.detections_received.emit(robot_id, detections)
+
+    def stop(self):
+        self._running = False
+
+
 class RealtimeLogWindow(QWidget):
     """Fenêtre d'affichage des logs en temps réel depuis le serveur."""
 
-    def __init__(self, host: str, port: int, robots: list[dict], table_widget: "TableWidget", parent=None):
+    def __init__(self, host: str, port: int, robots: list[dict], table_widget: "TableWidget", parent=None,
+                 telemetry_port: int | None = None):
         super().__init__(parent)
         self.setWindowTitle("Logs temps réel")
         self.setWindowFlag(Qt.WindowType.Window)
@@ -1222,6 +1412,10 @@ class RealtimeLogWindow(QWidget):
         self._table_widget = table_widget
         self._worker: LogSocketWorker | None = None
         self._thread: QThread | None = None
+        self._telemetry_worker: TelemetryWorker | None = None
+        self._telemetry_thread: QThread | None = None
+        # Robots dont la position arrive par la télémétrie : les logs de position sont ignorés
+        self._telemetry_robots: set[str] = set()
 
         layout = QVBoxLayout(self)
 
@@ -1241,6 +1435,8 @@ class RealtimeLogWindow(QWidget):
         layout.addWidget(self._log, stretch=1)
 
         self._start_connection(host, port)
+        if telemetry_port is not None:
+            self._start_telemetry(host, telemetry_port)
 
     def _start_connection(self, host: str, port: int):
         self._thread = QThread()
@@ -1251,6 +1447,15 @@ class RealtimeLogWindow(QWidget):
         self._worker.connection_status.connect(self._on_status)
         self._thread.start()
 
+    def _start_telemetry(self, host: str, port: int):
+        self._telemetry_thread = QThread()
+        self._telemetry_worker = TelemetryWorker(host, port)
+        self._telemetry_worker.moveToThread(self._telemetry_thread)
+        self._telemetry_thread.started.connect(self._telemetry_worker.start_listening)
+        self._telemetry_worker.pose_received.connect(self._on_telemetry_pose)
+        self._telemetry_worker.detections_received.connect(self._on_telemetry_detections)
+        self._telemetry_thread.start()
+
     def _parse_line(self, line: str) -> tuple[str, str, str, str] | None:
         """
         Parse une ligne de log au format "timestamp - who - level - message".
@@ -1279,6 +1484,8 @@ class RealtimeLogWindow(QWidget):
 
         # Filtrer les DEBUG (mais traiter quand même les positions et détections)
         if level == "DEBUG":
+            if who in self._telemetry_robots:
+                return
             if message.startswith("Position :"):
                 self._handle_position(who, message)
             elif "detected an obstacle at position" in message or message.startswith("Lidar detection:"):
@@ -1287,11 +1494,22 @@ class RealtimeLogWindow(QWidget):
 
         # Déplacement du robot si c'est une ligne de position
         if message.startswith("Position :"):
-            self._handle_position(who, message)
+            if who not in self._telemetry_robots:
+                self._handle_position(who, message)
             return
 
         self._log_text(line, self._color_for_robot(who))
 
+    def _on_telemetry_pose(self, robot_id: str, x: float, y: float, theta: float):
+        self._telemetry_robots.add(robot_id)
+        self._table_widget.animate_robot_move(robot_id, x, y, theta, self._color_for_robot(robot_id))
+
+    def _on_telemetry_detections(self, robot_id: str, points: list):
+        self._telemetry_robots.add(robot_id)
+        color = self._color_for_robot(robot_id)
+        for x, y in points:
+            self._table_widget.add_detection(float(x), float(y), color)
+
     def _handle_position(self, robot_id: str, message: str):
         """Parse la position et anime le robot correspondant sur la table."""
         try:
@@ -1334,90 +1552,106 @@ class RealtimeLogWindow(QWidget):
         if self._thread:
             self._thread.quit()
             self._thread.wait(2000)
+        if self._telemetry_worker:
+            self._telemetry_worker.stop()
+        if self._telemetry_thread:
+            self._telemetry_thread.quit()
+            self._telemetry_thread.wait(2000)
         super().closeEvent(event)
 
 
 class LogFileWorker(QObject):
-    """Worker qui lit un fichier de log et émet les lignes en respectant les timestamps."""
-    message_received = Signal(str)
+    """
+    Worker qui rejoue un log indexé (LogIndex) en respectant les timestamps.
+
+    Les lignes sont émises par lots : toutes celles dont l'instant de relecture est atteint,
+    sans analyse de texte (positions et détections viennent des pistes de l'index).
+    Un événement est ("text", émetteur, ligne), ("pose", émetteur, x, y, theta) ou ("detection", émetteur, x, y).
+    """
+    events_received = Signal(list)
+    position_changed = Signal(float)
     playback_finished = Signal()
 
-    def __init__(self, filepath: str, speed: float = 1.0):
+    def __init__(self, index: LogIndex, speed: float = 1.0, start: float = 0.0):
         super().__init__()
-        self._filepath = filepath
+        self._index = index
         self._speed = speed
         self._running = False
         self._paused = False
+        self._seek_to: float | None = start
+        self._wake = threading.Event()
 
     def set_speed(self, speed: float):
         self._speed = max(0.1, speed)
+        self._wake.set()
 
     def pause(self):
         self._paused = True
 
     def resume(self):
         self._paused = False
+        self._wake.set()
 
     def stop(self):
         self._running = False
         self._paused = False
+        self._wake.set()
+
+    def seek(self, t: float):
+        """Reprend la relecture à l'instant t (s depuis le début du log)."""
+        self._seek_to = t
+        self._wake.set()
 
     def start_playback(self):
         self._running = True
-        self._paused = False
-        prev_ts = None
-        skip_until_match = False
+        index = self._index
+        timeline = index.timeline
+        position = 0
+        # Instant de relecture atteint au temps réel ref_real, à la vitesse speed
+        ref_t, ref_real, speed = 0.0, time.monotonic(), self._speed
 
         try:
-            with open(self._filepath, "r", encoding="utf-8", errors="replace") as f:
-                for line in f:
-                    if not self._running:
-                        break
-                    line = line.strip()
-                    if not line:
+            while self._running and position < len(index):
+                if self._seek_to is not None:
+                    ref_t, self._seek_to = self._seek_to, None
+                    position = index.seek(ref_t)
+                    ref_real = time.monotonic()
+                if self._paused or speed != self._speed:
+                    # Pause ou changement de vitesse : on repart de l'instant courant
+                    ref_t = min(ref_t + (time.monotonic() - ref_real) * speed, float(timeline[position]))
+                    ref_real, speed = time.monotonic(), self._speed
+                    if self._paused:
+                        self._wake.wait(0.05)
+                        self._wake.clear()
+                        ref_real = time.monotonic()
                         continue
 
-                    # Skip entre "Attente lancement match" et "Match lancé"
-                    if "Attente lancement match" in line:
-                        skip_until_match = True
-                    if skip_until_match:
-                        if "Match lancé" in line:
-                            skip_until_match = False
-                            prev_ts = self._parse_timestamp(line)
-                        self.message_received.emit(line)
-                        continue
-
-                    # Respecter les timestamps (plafonné à 0.5s réel pour skip les temps morts)
-                    ts = self._parse_timestamp(line)
-                    if ts is not None and prev_ts is not None:
-                        delay = min((ts - prev_ts) / self._speed, 0.5)
-                        if delay > 0:
-                            deadline = time.monotonic() + delay
-                            while time.monotonic() < deadline and self._running:
-                                time.sleep(0.005)
-                    if ts is not None:
-                        prev_ts = ts
-
-                    # Attente si en pause
-                    while self._paused and self._running:
-                        time.sleep(0.05)
-
-                    if self._running:
-                        self.message_received.emit(line)
+                now_t = ref_t + (time.monotonic() - ref_real) * speed
+                end = index.seek(now_t)
+                if end > position:
+                    self.events_received.emit(self._events(position, end))
+                    self.position_changed.emit(float(timeline[end - 1]))
+                    position = end
+                    continue
+                self._wake.wait(min((float(timeline[position]) - now_t) / speed, 0.1))
+                self._wake.clear()
         except Exception:
             pass
         finally:
             self.playback_finished.emit()
 
-    @staticmethod
-    def _parse_timestamp(line: str) -> float | None:
-        parts = line.split(' - ', 1)
-        if len(parts) < 2:
-            return None
-        try:
-            return datetime.strptime(parts[0].strip(), "%Y-%m-%d %H:%M:%S,%f").timestamp()
-        except ValueError:
-            return None
+    def _events(self, start: int, end: int) -> list:
+        index = self._index
+        events = []
+        for i in range(start, end):
+            kind = index.kinds[i]
+            if kind == KIND_POSE:
+                events.append(("pose", index.name(i), *index.pose(i)))
+            elif kind == KIND_DETECTION:
+                events.append(("detection", index.name(i), *index.detection(i)))
+            elif kind == KIND_TEXT:
+                events.append(("text", index.name(i), index.line(i)))
+        return events
 
 
 class LogReplayWindow(QWidget):
@@ -1434,6 +1668,8 @@ class LogReplayWindow(QWidget):
             self._robot_colors[robot["id"]] = robot.get("trail_color", ROBOT_TRAIL_COLORS[0])
 
         self._table_widget = table_widget
+        self._index: LogIndex | None = None
+        self._start_time = 0.0
         self._worker: LogFileWorker | None = None
         self._thread: QThread | None = None
 
@@ -1472,7 +1708,7 @@ class LogReplayWindow(QWidget):
         controls.addWidget(QLabel("Vitesse:"))
         self._speed_slider = QSlider(Qt.Orientation.Horizontal)
         self._speed_slider.setMinimum(1)
-        self._speed_slider.setMaximum(100)
+        self._speed_slider.setMaximum(1000)
         self._speed_slider.setValue(10)
         self._speed_slider.setFixedWidth(120)
         self._speed_slider.valueChanged.connect(self._on_speed_changed)
@@ -1483,6 +1719,17 @@ class LogReplayWindow(QWidget):
         controls.addStretch()
         layout.addLayout(controls)
 
+        # Ligne de temps (pas de 0.1 s)
+        timeline = QHBoxLayout()
+        self._timeline = QSlider(Qt.Orientation.Horizontal)
+        self._timeline.setEnabled(False)
+        self._timeline.sliderMoved.connect(self._on_timeline_moved)
+        self._timeline.sliderReleased.connect(self._on_timeline_released)
+        timeline.addWidget(self._timeline, stretch=1)
+        self._time_label = QLabel("0.0 / 0.0 s")
+        timeline.addWidget(self._time_label)
+        layout.addLayout(timeline)
+
         # Zone de log
         self._log = QTextEdit()
         self._log.setReadOnly(True)
@@ -1495,9 +1742,18 @@ class LogReplayWindow(QWidget):
         path, _ = QFileDialog.getOpenFileName(self, "Ouvrir un fichier de log", "", "Log files (*.log);;All files (*)")
         if path:
             self._on_stop()
+            if self._index is not None:
+                self._index.close()
             self._filepath = path
             self._log.clear()
-            self._log_text(f"Fichier chargé : {path}", QColor(100, 210, 100))
+            self._index = LogIndex.open(path)
+            self._start_time = 0.0
+            self._timeline.setRange(0, int(self._index.duration * 10))
+            self._timeline.setValue(0)
+            self._timeline.setEnabled(True)
+            self._update_time_label(0.0)
+            self._log_text(f"Fichier chargé : {path} ({len(self._index)} lignes, {len(self._index.poses)} positions, "
+                           f"{self._index.duration:.1f}s)", QColor(100, 210, 100))
             self._btn_play.setEnabled(True)
 
     def _on_play(self):
@@ -1505,15 +1761,16 @@ class LogReplayWindow(QWidget):
             # Resume from pause
             self._worker.resume()
         else:
-            if self._filepath is None:
+            if self._index is None:
                 return
-            self._log.clear()
             self._thread = QThread()
-            self._worker = LogFileWorker(self._filepath, self._current_speed())
+            self._worker = LogFileWorker(self._index, self._current_speed(), self._start_time)
             self._worker.moveToThread(self._thread)
             self._thread.started.connect(self._worker.start_playback)
-            self._worker.message_received.connect(self._on_message)
+            self._worker.events_received.connect(self._on_events)
+            self._worker.position_changed.connect(self._on_position_changed)
             self._worker.playback_finished.connect(self._on_finished)
+            self._table_widget.set_anim_speed(self._current_speed())
             self._thread.start()
         self._btn_play.setEnabled(False)
         self._btn_pause.setEnabled(True)
@@ -1533,13 +1790,14 @@ class LogReplayWindow(QWidget):
             self._thread.wait(2000)
             self._thread = None
             self._worker = None
-        self._btn_play.setEnabled(self._filepath is not None)
+        self._btn_play.setEnabled(self._index is not None)
         self._btn_pause.setEnabled(False)
         self._btn_stop.setEnabled(False)
 
     def _on_finished(self):
         self._log_text("Relecture terminée.", QColor(100, 210, 100))
-        self._btn_play.setEnabled(self._filepath is not None)
+        self._start_time = 0.0
+        self._btn_play.setEnabled(self._index is not None)
         self._btn_pause.setEnabled(False)
         self._btn_stop.setEnabled(False)
 
@@ -1549,14 +1807,45 @@ class LogReplayWindow(QWidget):
     def _on_speed_changed(self, value: int):
         speed = value / 10.0
         self._speed_label.setText(f"x{speed:.1f}")
+        self._table_widget.set_anim_speed(speed)
         if self._worker:
             self._worker.set_speed(speed)
 
-    def _parse_line(self, line: str) -> tuple[str, str, str, str] | None:
-        parts = line.split(' - ', 3)
-        if len(parts) == 4:
-            return parts[0].strip(), parts[1].strip(), parts[2].strip(), parts[3].strip()
-        return None
+    # --- Ligne de temps ---------------------------------------------------------
+
+    def _update_time_label(self, t: float):
+        duration = self._index.duration if self._index is not None else 0.0
+        self._time_label.setText(f"{t:.1f} / {duration:.1f} s")
+
+    def _on_position_changed(self, t: float):
+        self._start_time = t
+        if not self._timeline.isSliderDown():
+            self._timeline.setValue(int(t * 10))
+        self._update_time_label(t)
+
+    def _on_timeline_moved(self, value: int):
+        self._update_time_label(value / 10.0)
+
+    def _on_timeline_released(self):
+        self._seek(self._timeline.value() / 10.0)
+
+    def _seek(self, t: float):
+        """Place les robots et le journal à l'instant t, la relecture reprend de là."""
+        self._start_time = t
+        if self._worker:
+            self._worker.seek(t)
+        for name in self._index.names:
+            pose = self._index.pose_at(name, t)
+            if pose is not None:
+                self._table_widget.place_robot(name, *pose)
+        self._table_widget.clear_detections()
+        # Dernières lignes affichables avant t
+        self._log.clear()
+        end = self._index.seek(t)
+        text_lines = np.flatnonzero(self._index.kinds[max(0, end - 5000):end] == KIND_TEXT)[-REPLAY_CONTEXT_LINES:]
+        for i in text_lines + max(0, end - 5000):
+            self._log_text(self._index.line(i), self._color_for_robot(self._index.name(i)))
+        self._update_time_label(t)
 
     def _color_for_robot(self, robot_id: str) -> QColor:
         if robot_id in self._robot_colors:
@@ -1566,48 +1855,15 @@ class LogReplayWindow(QWidget):
                 return color
         return QColor(200, 200, 200)
 
-    def _on_message(self, line: str):
-        parsed = self._parse_line(line)
-        if parsed is None:
-            self._log_text(line, QColor(200, 200, 200))
-            return
-
-        _timestamp, who, level, message = parsed
-
-        if level == "DEBUG":
-            if message.startswith("Position :"):
-                self._handle_position(who, message)
-            elif "detected an obstacle at position" in message or message.startswith("Lidar detection:"):
-                self._handle_detection(who, message)
-            return
-
-        if message.startswith("Position :"):
-            self._handle_position(who, message)
-            return
-
-        self._log_text(line, self._color_for_robot(who))
-
-    def _handle_position(self, robot_id: str, message: str):
-        try:
-            dict_str = message[len("Position :"):].strip()
-            pos = ast.literal_eval(dict_str)
-            x = float(pos["x"])
-            y = float(pos["y"])
-            theta = float(pos["theta"])
-            color = self._color_for_robot(robot_id)
-            self._table_widget.animate_robot_move(robot_id, x, y, theta, color)
-        except (ValueError, KeyError, SyntaxError):
-            pass
-
-    def _handle_detection(self, robot_id: str, message: str):
-        color = self._color_for_robot(robot_id)
-        m = re.search(r'at position \((-?\d+),(-?\d+)\)', message)
-        if m:
-            self._table_widget.add_detection(float(m.group(1)), float(m.group(2)), color)
-            return
-        m = re.search(r'Lidar detection: Position\(x=(-?\d+), y=(-?\d+)', message)
-        if m:
-            self._table_widget.add_detection(float(m.group(1)), float(m.group(2)), color)
+    def _on_events(self, events: list):
+        for event in events:
+            kind, who = event[0], event[1]
+            if kind == "pose":
+                self._table_widget.animate_robot_move(who, event[2], event[3], event[4], self._color_for_robot(who))
+            elif kind == "detection":
+                self._table_widget.add_detection(event[2], event[3], self._color_for_robot(who))
+            else:
+                self._log_text(event[2], self._color_for_robot(who))
 
     def _log_text(self, message: str, color: QColor):
         escaped = html_module.escape(message)
@@ -1617,6 +1873,9 @@ class LogReplayWindow(QWidget):
 
     def closeEvent(self, event):
         self._on_stop()
+        if self._index is not None:
+            self._index.close()
+            self._index = None
         super().closeEvent(event)
 
 
@@ -1755,7 +2014,10 @@ class SimulatorWindow(QMainWindow):
         com = self._sim_config.get("comSocket", {})
         host = com.get("host", "localhost")
         port = com.get("port", 4269)
-        self._realtime_window = RealtimeLogWindow(host, port, self.table_widget._robots, self.table_widget, self)
+        telemetry_port = self._sim_config.get("telemetry", {}).get("port")
+        self._realtime_window = RealtimeLogWindow(
+            host, port, self.table_widget._robots, self.table_widget, self, telemetry_port=telemetry_port
+        )
         self._realtime_window.show()
 
     def _on_replay_click(self):
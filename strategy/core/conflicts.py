@@ -0,0 +1,288 @@
+import argparse
+import glob
+import json
+import math
+import os
+import re
+import sys
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ia.asservissement.trajectory_estimator import TrajectoryEstimator
+from ia.utils.config_loader import load_config
+from ia.utils.position import Position
+
+SUFFIXES = ("0", "3000")
+STRATEGY_FILE = re.compile(r"^strategy-(?P<robot>.+)-(?P<suffix>\d+)\.json$")
+
+
+class RobotTimeline:
+    """
+    Trajectoire horodatée d'un robot, reconstruite depuis les commandes simulées de sa stratégie
+    (simulator/{annee}/strategy-{robot}-{suffixe}.json) avec le TrajectoryEstimator du robot :
+    rotations sur place, profils de vitesse des lignes droites (go_to_chain compris), durées des
+    actions, wait et wait-chrono. Entre deux instants clés la position est interpolée linéairement.
+    L'empreinte du robot est un disque de rayon radius.
+    """
+
+    def __init__(self, name: str, radius: float, times: List[float], xs: List[float], ys: List[float]) -> None:
+        self.name = name
+        self.radius = radius
+        self.times = np.asarray(times, dtype=float)
+        self.xs = np.asarray(xs, dtype=float)
+        self.ys = np.asarray(ys, dtype=float)
+
+    @property
+    def end(self) -> float:
+        return float(self.times[-1])
+
+    @classmethod
+    def from_commands(cls, name: str, commands: List[Dict], radius: float,
+                      estimator: Optional[TrajectoryEstimator] = None) -> 'RobotTimeline':
+        estimator = estimator.fork() if estimator is not None else TrajectoryEstimator()
+        elapsed = 0.0
+        pose: Optional[Position] = None
+        times, xs, ys = [], [], []
+
+        def key(position: Position) -> None:
+            times.append(elapsed)
+            xs.append(position.x)
+            ys.append(position.y)
+
+        for index, entry in enumerate(commands):
+            command, _, argument = entry["command"].partition("#")
+            target = Position(entry["position"]["x"], entry["position"]["y"], entry["position"].get("theta", 0.0))
+            if pose is None or command in ("start", "position"):
+                pose = target
+                key(pose)
+                continue
+
+            if command in ("goto", "goto-back", "goto-chain", "goto-astar"):
+                distance = math.hypot(target.x - pose.x, target.y - pose.y)
+                if distance > 0:
+                    # Même découpage que TrajectoryEstimator.goto : rotation à l'arrêt puis ligne droite
+                    heading = math.atan2(target.y - pose.y, target.x - pose.x)
+                    if command == "goto-back":
+                        heading = math.atan2(pose.y - target.y, pose.x - target.x)
+                    if estimator.current_speed == 0:
+                        elapsed += estimator.turn_time(heading - pose.theta)
+                        key(pose)
+                    elapsed += estimator.straight_time(distance, chain=cls._is_chained(command, commands, index))
+                pose = target
+            elif command == "go":
+                elapsed += estimator.straight_time(float(argument))
+                pose = target
+            elif command == "orbital-turn":
+                # Le robot décrit un arc autour de la roue pivot : rayon déduit de la corde et de l'angle
+                angle = math.radians(abs(float(argument.split(";")[0])))
+                chord = math.hypot(target.x - pose.x, target.y - pose.y)
+                if angle > 0:
+                    pivot_offset = chord / (2 * math.sin(angle / 2)) if math.sin(angle / 2) > 0 else 0
+                    elapsed += estimator.straight_time(2 * pivot_offset * angle)
+                pose = target
+            elif command == "face":
+                x, y = (float(value) for value in argument.split(";"))
+                elapsed += estimator.face(pose, x, y)
+                pose = Position(pose.x, pose.y, target.theta)
+            elif command == "action":
+                elapsed += estimator.action_time(argument)
+            elif command == "wait":
+                elapsed += float(argument) / 1000
+            elif command == "wait-chrono":
+                elapsed = max(elapsed, float(argument))
+            elif command == "speed":
+                estimator.set_speed(float(argument))
+            key(pose)
+
+        return cls(name, radius, times, xs, ys)
+
+    @staticmethod
+    def _is_chained(command: str, commands: List[Dict], index: int) -> bool:
+        """go_to_chain sauf sur le dernier point d'un trajet du pathfinding (cf. GoToAstar.execute)."""
+        if command == "goto-chain":
+            return True
+        if command != "goto-astar" or index + 1 >= len(commands):
+            return False
+        # Un nouveau trajet commence par la position courante
+        current, following = commands[index]["position"], commands[index + 1]["position"]
+        return (commands[index + 1]["command"].startswith("goto-astar#")
+                and (following["x"], following["y"]) != (current["x"], current["y"]))
+
+    def sample(self, times: np.ndarray) -> np.ndarray:
+        """Positions (N, 2) aux instants donnés ; le robot reste à sa dernière pose après la fin."""
+        return np.stack((np.interp(times, self.times, self.xs), np.interp(times, self.times, self.ys)), axis=1)
+
+
+class ConflictChecker:
+    """
+    Détecte les collisions entre robots d'une même équipe jouant leurs stratégies générées en même temps.
+
+    1. Les trajectoires sont échantillonnées sur une base de temps commune (pas dt).
+    2. Grille spatio-temporelle : pour chaque robot et chaque tranche de slot secondes, la boîte
+       englobante de son empreinte balayée est rangée dans les cellules (cell_size mm) qu'elle couvre.
+       Seules les paires de robots partageant une cellule sur une tranche sont comparées, ce qui
+       garde le coût proche du linéaire avec beaucoup de robots ou de variantes.
+    3. Test exact, vectorisé sur tous les intervalles retenus d'une paire : entre deux échantillons
+       les deux robots se déplacent en ligne droite, la distance minimale entre leurs centres sur
+       l'intervalle est calculée en forme close et comparée à la somme des rayons.
+
+    Les intervalles en collision consécutifs forment un conflit : début, fin, distance minimale,
+    instant et positions des deux robots à ce moment.
+    """
+
+    def __init__(self, timelines: List[RobotTimeline], dt: float = 0.05, cell_size: float = 500.0,
+                 slot: float = 1.0, horizon: Optional[float] = None) -> None:
+        self.timelines = timelines
+        self.dt = dt
+        self.cell_size = cell_size
+        self.slot = max(1, int(round(slot / dt)))
+        end = horizon if horizon is not None else max((timeline.end for timeline in timelines), default=0.0)
+        self.times = np.arange(0.0, end + dt, dt)
+        self.positions = np.stack([timeline.sample(self.times) for timeline in timelines]) if timelines \
+            else np.zeros((0, len(self.times), 2))
+        # Statistiques de la dernière vérification
+        self.candidate_pairs = 0
+        self.checked_intervals = 0
+
+    def _grid(self) -> Dict[Tuple[int, int, int], List[int]]:
+        """(tranche, cellule x, cellule y) → robots dont l'empreinte balayée touche la cellule."""
+        grid: Dict[Tuple[int, int, int], List[int]] = defaultdict(list)
+        intervals = len(self.times) - 1
+        if intervals <= 0:
+            return grid
+        starts = np.arange(0, intervals, self.slot)
+        for robot, timeline in enumerate(self.timelines):
+            points = self.positions[robot]
+            # Boîte de chaque intervalle (deux échantillons), puis de chaque tranche
+            low = np.minimum.reduceat(np.minimum(points[:-1], points[1:]), starts, axis=0) - timeline.radius
+            high = np.maximum.reduceat(np.maximum(points[:-1], points[1:]), starts, axis=0) + timeline.radius
+            low_cells = np.floor(low / self.cell_size).astype(int)
+            high_cells = np.floor(high / self.cell_size).astype(int)
+            for slot, ((x0, y0), (x1, y1)) in enumerate(zip(low_cells, high_cells)):
+                for cell_x in range(x0, x1 + 1):
+                    for cell_y in range(y0, y1 + 1):
+                        grid[(slot, cell_x, cell_y)].append(robot)
+        return grid
+
+    def _candidates(self) -> Dict[Tuple[int, int], List[int]]:
+        """Paire de robots → tranches où leurs empreintes partagent une cellule."""
+        slots: Dict[Tuple[int, int], set] = defaultdict(set)
+        for (slot, _, _), robots in self._grid().items():
+            for i, first in enumerate(robots):
+                for second in robots[i + 1:]:
+                    slots[(first, second)].add(slot)
+        return {pair: sorted(pair_slots) for pair, pair_slots in slots.items()}
+
+    def _min_distances(self, first: int, second: int, intervals: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Distance minimale entre les centres sur chaque intervalle, et sa position relative dans l'intervalle."""
+        relative = self.positions[first] - self.positions[second]
+        start = relative[intervals]
+        motion = relative[intervals + 1] - start
+        squared = np.einsum("ij,ij->i", motion, motion)
+        ratio = np.divide(-np.einsum("ij,ij->i", start, motion), squared,
+                          out=np.zeros_like(squared), where=squared > 0)
+        ratio = np.clip(ratio, 0.0, 1.0)
+        return np.linalg.norm(start + ratio[:, None] * motion, axis=1), ratio
+
+    def check(self) -> List[Dict]:
+        """Conflits de toutes les paires de robots, triés par instant de début."""
+        conflicts = []
+        intervals_count = len(self.times) - 1
+        candidates = self._candidates()
+        self.candidate_pairs = len(candidates)
+        self.checked_intervals = 0
+        for (first, second), slots in candidates.items():
+            intervals = np.concatenate([
+                np.arange(slot * self.slot, min((slot + 1) * self.slot, intervals_count)) for slot in slots
+            ])
+            self.checked_intervals += len(intervals)
+            distances, ratios = self._min_distances(first, second, intervals)
+            limit = self.timelines[first].radius + self.timelines[second].radius
+            hits = np.flatnonzero(distances < limit)
+            if not len(hits):
+                continue
+            # Intervalles en collision consécutifs → un conflit
+            breaks = np.flatnonzero(np.diff(intervals[hits]) != 1) + 1
+            for group in np.split(hits, breaks):
+                closest = group[np.argmin(distances[group])]
+                interval = intervals[closest]
+                at = self.times[interval] + ratios[closest] * self.dt
+                conflicts.append({
+                    "robots": [self.timelines[first].name, self.timelines[second].name],
+                    "start": round(float(self.times[intervals[group[0]]]), 2),
+                    "end": round(float(self.times[intervals[group[-1]] + 1]), 2),
+                    "at": round(float(at), 2),
+                    "min_distance": round(float(distances[closest]), 1),
+                    "clearance": round(float(limit), 1),
+                    "positions": {
+                        timeline.name: [round(float(value), 1) for value in timeline.sample(np.array([at]))[0]]
+                        for timeline in (self.timelines[first], self.timelines[second])
+                    },
+                })
+        return sorted(conflicts, key=lambda conflict: (conflict["start"], conflict["robots"]))
+
+
+def load_timelines(year: int, suffix: str, robots: Optional[List[str]] = None, config_path: str = "config",
+                   simulator_path: str = "simulator") -> List[RobotTimeline]:
+    """
+    Trajectoires des robots d'une couleur (suffixe 0 ou 3000) depuis les fichiers du simulateur, avec
+    le TrajectoryEstimator et le rayon de l'empreinte de la config de chaque robot (footprintRadius,
+    la marge du pathfinding à défaut, qui inclut une distance de sécurité).
+    Tous les robots ayant un fichier pour cette couleur par défaut.
+    """
+    if robots is None:
+        robots = sorted(
+            match.group("robot")
+            for match in (STRATEGY_FILE.match(os.path.basename(path))
+                          for path in glob.glob(os.path.join(simulator_path, str(year), f"strategy-*-{suffix}.json")))
+            if match is not None and match.group("suffix") == suffix
+        )
+    timelines = []
+    for robot in robots:
+        config_data = load_config(year, robot, config_base_path=config_path)
+        with open(os.path.join(simulator_path, str(year), f"strategy-{robot}-{suffix}.json")) as strategy_file:
+            commands = json.load(strategy_file)
+        timelines.append(RobotTimeline.from_commands(
+            robot, commands, radius=config_data.get("footprintRadius", config_data["marge"]),
+            estimator=TrajectoryEstimator.from_config(config_data.get("trajectoryEstimator")),
+        ))
+    return timelines
+
+
+def check_year(year: int, robots: Optional[List[str]] = None, config_path: str = "config",
+               simulator_path: str = "simulator", **checker_args) -> Dict[str, List[Dict]]:
+    """Conflits de chaque couleur, par suffixe."""
+    return {
+        suffix: ConflictChecker(load_timelines(year, suffix, robots, config_path, simulator_path), **checker_args).check()
+        for suffix in SUFFIXES
+    }
+
+
+def format_conflict(conflict: Dict) -> str:
+    first, second = conflict["robots"]
+    return (f"{first} / {second} : {conflict['start']:.2f}s -> {conflict['end']:.2f}s, "
+            f"{conflict['min_distance']:.0f} mm (< {conflict['clearance']:.0f}) à {conflict['at']:.2f}s "
+            f"({first} {conflict['positions'][first]}, {second} {conflict['positions'][second]})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Collisions entre les stratégies générées des robots d'une équipe.")
+    parser.add_argument("year", type=int, help="Year in integer format")
+    parser.add_argument("robots", type=str, nargs="*", help="Robots à comparer (tous par défaut)")
+    parser.add_argument("--dt", type=float, default=0.05, help="Pas d'échantillonnage (s)")
+    parser.add_argument("--cell", type=float, default=500.0, help="Taille des cellules de la grille (mm)")
+    parser.add_argument("--slot", type=float, default=1.0, help="Durée des tranches de la grille (s)")
+    parser.add_argument("--json", type=str, help="Écrit le rapport JSON dans ce fichier")
+    args = parser.parse_args()
+
+    report = check_year(args.year, args.robots or None, dt=args.dt, cell_size=args.cell, slot=args.slot)
+    for suffix, conflicts in report.items():
+        print(f"Couleur {suffix} : {len(conflicts)} conflit(s)")
+        for conflict in conflicts:
+            print(f"  {format_conflict(conflict)}")
+    if args.json:
+        with open(args.json, "w") as report_file:
+            json.dump(report, report_file, indent=4)
+    sys.exit(1 if any(report.values()) else 0)
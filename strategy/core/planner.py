@@ -0,0 +1,272 @@
+import contextlib
+import copy
+import io
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from ia.asservissement.trajectory_estimator import TrajectoryEstimator
+from ia.pathfinding.visibility_graph import VisibilityGraph
+from ia.strategy.flag_registry import FlagCondition, FlagRegistry
+from ia.utils.position import Position
+from strategy.core.objective import Objective
+from strategy.task.wait_chrono import WaitChrono
+
+# (durée avant le dernier wait-chrono, instant du wait-chrono ou None, durée après)
+BlockCost = Tuple[float, Optional[float], float]
+
+
+class MatchPlanner:
+    """
+    Planificateur hors ligne de l'ordre des objectifs.
+
+    Les objectifs sont regroupés en blocs : un objectif à 0 point (ramassage, sortie de zone...)
+    reste collé aux objectifs qui le suivent jusqu'au premier qui rapporte des points.
+    Le premier objectif (sortie de la zone de départ) et les blocs contenant un WaitChrono
+    (retour au nid...) gardent leur place, les autres sont réordonnés. Les autres dépendances
+    entre objectifs doivent être exprimées avec needed_flag/action_flag.
+
+    1. Matrice de coûts : durée estimée (TrajectoryEstimator) de chaque bloc exécuté juste après
+       chacun des autres (pathfinding réel, zones dynamiques dans l'état laissé par le bloc précédent).
+       Une ligne par prédécesseur, calculée en parallèle.
+    2. Recuit simulé sur cette matrice, plusieurs redémarrages en parallèle : chaque ordre est
+       évalué en points marqués avant la fin du match, puis en temps total.
+    """
+
+    def __init__(
+        self,
+        objectives: List[Objective],
+        start_point: Position,
+        table_config: Dict,
+        color: str,
+        match_duration: float,
+        estimator: Optional[TrajectoryEstimator] = None,
+    ):
+        self.objectives = objectives
+        self.start_point = start_point
+        self.table_config = table_config
+        self.color = color
+        self.match_duration = match_duration
+        self.estimator = estimator if estimator is not None else TrajectoryEstimator()
+
+        self.blocks: List[List[Objective]] = self._make_blocks(objectives)
+        self.fixed_head: List[int] = [0] if self.blocks else []
+        self.fixed_tail: List[int] = [
+            index for index, block in enumerate(self.blocks)
+            if index not in self.fixed_head and any(isinstance(task, WaitChrono) for o in block for task in o.tasks)
+        ]
+        self.free: List[int] = [
+            index for index in range(len(self.blocks))
+            if index not in self.fixed_head and index not in self.fixed_tail
+        ]
+        self.costs: List[List[Optional[BlockCost]]] = []
+        # Par objectif de chaque bloc : condition needed_flag, masques action_flag et clear_flags
+        flag_registry = FlagRegistry()
+        self.block_flags: List[List[Tuple[Optional[FlagCondition], int, int]]] = [
+            [
+                (flag_registry.condition(objective.needed_flag),
+                 flag_registry.mask([objective.action_flag] if objective.action_flag is not None else None),
+                 flag_registry.mask(objective.clear_flags))
+                for objective in block
+            ]
+            for block in self.blocks
+        ]
+
+    @staticmethod
+    def _make_blocks(objectives: List[Objective]) -> List[List[Objective]]:
+        # Le premier objectif (sortie de la zone de départ) forme toujours un bloc à lui seul
+        blocks = [objectives[:1]] if objectives else []
+        current = []
+        for objective in objectives[1:]:
+            current.append(objective)
+            if objective.points:
+                blocks.append(current)
+                current = []
+        if current:
+            blocks.append(current)
+        return blocks
+
+    def plan(self, iterations: int = 20000, restarts: Optional[int] = None, workers: Optional[int] = None, seed: int = 0) -> dict:
+        """
+        Cherche le meilleur ordre des objectifs.
+
+        Returns
+        -------
+        dict avec les clés :
+            objectives : objectifs dans le meilleur ordre trouvé
+            score, time : points marqués avant la fin du match et durée estimée du match
+            timeline : [{"desc", "points", "start", "end", "score"}] du meilleur ordre
+            baseline : {"score", "time"} de l'ordre du fichier
+            evaluations : nombre d'ordres évalués
+        """
+        restarts = restarts if restarts is not None else (os.cpu_count() or 1)
+        for objective in self.objectives:
+            for task in objective.tasks:
+                task.path_finding = None
+                task.estimator = None
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            rows = [
+                pool.submit(_block_costs_row, self, predecessor)
+                for predecessor in [None] + list(range(len(self.blocks)))
+            ]
+            # Ligne 0 : départ, ligne i + 1 : après le bloc i
+            self.costs = [row.result() for row in rows]
+
+            searches = [
+                pool.submit(_anneal, self, iterations, seed + restart, restart == 0)
+                for restart in range(restarts)
+            ]
+            results = [search.result() for search in searches]
+
+        best_order, best_value = max(results, key=lambda result: result[1])
+        baseline_order = self.fixed_head + self.free + self.fixed_tail
+        baseline_score, baseline_time, _ = self.evaluate(baseline_order)
+        score, total_time, timeline = self.evaluate(best_order)
+        return {
+            "objectives": [objective for index in best_order for objective in self.blocks[index]],
+            "score": score,
+            "time": total_time,
+            "timeline": timeline,
+            "baseline": {"score": baseline_score, "time": baseline_time},
+            "evaluations": restarts * iterations,
+        }
+
+    def evaluate(self, order: List[int]) -> Tuple[int, float, List[dict]]:
+        """
+        Joue un ordre de blocs sur la matrice de coûts.
+        Un bloc dont un needed_flag n'est pas vérifié est sauté, comme le fait le StrategyManager.
+        Le match s'arrête au premier bloc qui ne termine pas avant matchDuration.
+        """
+        elapsed = 0.0
+        score = 0
+        flags = 0
+        timeline = []
+        previous = None
+        for index in order:
+            cost = self.costs[0 if previous is None else previous + 1][index]
+            if cost is None:
+                continue
+            block = self.blocks[index]
+            block_flags = self.block_flags[index]
+            if any(condition is not None and not condition.matches(flags) for condition, _, _ in block_flags):
+                continue
+            before, chrono, after = cost
+            end = elapsed + before
+            if chrono is not None:
+                end = max(end, chrono)
+            end += after
+            if end > self.match_duration:
+                break
+            for _, action_mask, clear_mask in block_flags:
+                flags = (flags | action_mask) & ~clear_mask
+            points = sum(objective.points or 0 for objective in block)
+            score += points
+            timeline.append({
+                "desc": " + ".join(objective.desc for objective in block),
+                "points": points,
+                "start": round(elapsed, 2),
+                "end": round(end, 2),
+                "score": score,
+            })
+            elapsed = end
+            previous = index
+        return score, elapsed, timeline
+
+    @staticmethod
+    def estimate_entries(entries: List[dict]) -> BlockCost:
+        """
+        Durée des commandes simulées d'un bloc, à partir des durées annotées par le TrajectoryEstimator.
+        Le temps après le dernier wait-chrono est séparé car il dépend de l'heure de départ du bloc.
+        """
+        before = 0.0
+        before_chrono = 0.0
+        chrono = None
+        for entry in entries:
+            command, _, args = entry["command"].partition("#")
+            if command != "wait-chrono":
+                before += entry.get("duration", 0.0)
+            else:
+                # Seul le dernier wait-chrono est retenu, les précédents sont considérés comme passés
+                chrono = float(args)
+                before_chrono += before
+                before = 0.0
+        if chrono is None:
+            return before, None, 0.0
+        return before_chrono, chrono, before
+
+
+def _run_block(
+    block: List[Objective], start_point: Position, path_finding: VisibilityGraph, estimator: TrajectoryEstimator
+) -> Tuple[List[dict], Position]:
+    entries = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for objective in block:
+            for task in objective.tasks:
+                task.path_finding = path_finding
+                task.estimator = estimator
+                execution = task.execute(start_point)
+                if isinstance(execution, list):
+                    entries.extend(execution)
+                else:
+                    entries.append(execution)
+                start_point = task.end_point
+    return entries, start_point
+
+
+def _block_costs_row(planner: MatchPlanner, predecessor: Optional[int]) -> List[Optional[BlockCost]]:
+    """Coûts de tous les blocs exécutés juste après predecessor (None : depuis le départ)."""
+    path_finding = VisibilityGraph(table_config=planner.table_config, active_color=planner.color)
+    start_point = planner.start_point
+    if predecessor is not None:
+        try:
+            _, start_point = _run_block(planner.blocks[predecessor], start_point, path_finding, planner.estimator.fork())
+        except RuntimeError:
+            return [None] * len(planner.blocks)
+
+    row = []
+    for index, block in enumerate(planner.blocks):
+        if index == predecessor:
+            row.append(None)
+            continue
+        try:
+            entries, _ = _run_block(block, start_point, copy.deepcopy(path_finding), planner.estimator.fork())
+        except RuntimeError:
+            # Pathfinding impossible depuis ce prédécesseur
+            row.append(None)
+            continue
+        row.append(planner.estimate_entries(entries))
+    return row
+
+
+def _anneal(planner: MatchPlanner, iterations: int, seed: int, from_file_order: bool) -> Tuple[List[int], float]:
+    """Recuit simulé sur l'ordre des blocs libres. Retourne (meilleur ordre, valeur)."""
+    rng = random.Random(seed)
+    free = list(planner.free)
+    if not from_file_order:
+        rng.shuffle(free)
+
+    def value(candidate: List[int]) -> float:
+        score, total_time, _ = planner.evaluate(planner.fixed_head + candidate + planner.fixed_tail)
+        # Les points d'abord, le temps départage
+        return score - total_time / (planner.match_duration * 10)
+
+    current_value = value(free)
+    best, best_value = list(free), current_value
+    max_points = max((o.points or 0 for o in planner.objectives), default=1) or 1
+    for iteration in range(iterations if len(free) > 1 else 0):
+        temperature = max_points * (1 - iteration / iterations) + 1e-3
+        candidate = list(free)
+        i, j = rng.sample(range(len(candidate)), 2)
+        if rng.random() < 0.5:
+            candidate[i], candidate[j] = candidate[j], candidate[i]
+        else:
+            candidate.insert(j, candidate.pop(i))
+        candidate_value = value(candidate)
+        if candidate_value >= current_value or rng.random() < math.exp((candidate_value - current_value) / temperature):
+            free, current_value = candidate, candidate_value
+            if current_value > best_value:
+                best, best_value = list(free), current_value
+    return planner.fixed_head + best + planner.fixed_tail, best_value
@@ -1,7 +1,8 @@
-import importlib
 import logging
 import sys
 
+from strategy.main.generation import GenerationDriver
+
 if __name__ == "__main__":
     logging.getLogger('').setLevel(logging.getLevelNamesMapping()['DEBUG'])
     stdout_handler = logging.StreamHandler(sys.stdout)
@@ -18,6 +19,5 @@ if __name__ == "__main__":
         ('strategy.main.2026.pami_5',          'Pami5'),
     ]
 
-    for module_path, class_name in strategies:
-        module = importlib.import_module(module_path)
-        getattr(module, class_name)().generate()
\ No newline at end of file
+    # Robots et couleurs générés en parallèle, robots inchangés sautés (--force pour tout régénérer)
+    GenerationDriver(strategies, force='--force' in sys.argv).run()
\ No newline at end of file
@@ -34,7 +34,7 @@ class HipposPrincess(AbstractMain):
 
         self.distance_photo = 380
 
-    def generate(self):
+    def generate(self, plan: bool = False, simulate: int = 0):
         self.quitter_depart()
         self.get_caisse_3()
         self.depose_garde_manger_centre_1()
@@ -44,7 +44,12 @@ class HipposPrincess(AbstractMain):
         self.get_caisse_1()
         self.depose_garde_manger_couleur_4()
         self.retour_au_nid()
-        self.generate_strategy('princess')
+        if plan:
+            self.plan_strategy('princess')
+        else:
+            self.generate_strategy('princess')
+        if simulate:
+            self.simulate_strategy('princess', simulate)
 
     def quitter_depart(self):
         score = 0
@@ -299,13 +304,15 @@ class HipposPrincess(AbstractMain):
             name='Ramassage caisses 4',
             id=4,
             score=score,
-            priority=1
+            priority=1,
+            action_flag='caisses_4'
         ))
         self.objectifs_couleur_3000.append(tasks_list.generate_mirror_objective(
             name='Ramassage caisses 4',
             id=4,
             score=score,
-            priority=1
+            priority=1,
+            action_flag='caisses_4'
         ))
 
     def depose_garde_manger_centre_1(self):
@@ -503,13 +510,15 @@ class HipposPrincess(AbstractMain):
             name='Largage garde manger jaune 3',
             id=5,
             score=score,
-            priority=1
+            priority=1,
+            needed_flag='caisses_4'
         ))
         self.objectifs_couleur_3000.append(tasks_list.generate_mirror_objective(
             name='Largage garde manger bleu 3',
             id=5,
             score=score,
-            priority=1
+            priority=1,
+            needed_flag='caisses_4'
         ))
 
     def depose_garde_manger_couleur_4(self):
@@ -773,4 +782,5 @@ if __name__ == "__main__":
     logger.info("init logger")
 
     strategy = HipposPrincess()
-    strategy.generate()
\ No newline at end of file
+    simulate = next((int(arg.split('=', 1)[1]) for arg in sys.argv if arg.startswith('--simulate=')), 0)
+    strategy.generate(plan='--plan' in sys.argv, simulate=simulate)
\ No newline at end of file
@@ -1,11 +1,15 @@
 import json
 import os
-from typing import List
+from typing import List, Optional
 
+from ia.asservissement.trajectory_estimator import TrajectoryEstimator
 from ia.pathfinding.visibility_graph import VisibilityGraph
+from ia.strategy.compiled_strategy import compile_strategy_file
 from ia.utils.config_loader import load_config
+from ia.utils.files import write_atomic
 from ia.utils.position import Position
 from strategy.core.objective import Objective
+from strategy.core.planner import MatchPlanner
 from strategy.core.strat import Strat
 
 
@@ -28,7 +32,24 @@ class AbstractMain:
         self.config_path = "../../../config"
         self.simulator_path = "../../../simulator"
 
+        # Génération pilotée par le GenerationDriver (all.py) : generate_strategy note seulement le robot,
+        # l'écriture et les tests sont faits par le driver
+        self.defer_generation = False
+        self.generated_robot: Optional[str] = None
+
+    def strategy_json(self) -> str:
+        """Contenu du strategy.json des objectifs des deux couleurs."""
+        strat = Strat(
+            couleur0=self.objectifs_couleur_0,
+            couleur3000=self.objectifs_couleur_3000
+        )
+        return json.dumps(strat.to_dict(), indent=4)
+
     def generate_strategy(self, robot : str):
+        if self.defer_generation:
+            self.generated_robot = robot
+            return
+
         # Création de la stratégie complète
         strat = Strat(
             couleur0=self.objectifs_couleur_0,
@@ -40,8 +61,9 @@ class AbstractMain:
         print("#########################")
 
         os.makedirs(f"{self.config_path}/{self.year}", exist_ok=True)
-        with open(f"{self.config_path}/{self.year}/{robot}/strategy.json", "w") as json_file:
-            json.dump(strat.to_dict(), json_file, indent=4)
+        write_atomic(f"{self.config_path}/{self.year}/{robot}/strategy.json", self.strategy_json())
+        # Version compilée chargée par le robot au démarrage (validée ici plutôt qu'au boot)
+        print(f"Compilation : {compile_strategy_file(f'{self.config_path}/{self.year}/{robot}')}")
 
         print("Test de la strat 0")
         self.test_strategy(
@@ -65,22 +87,89 @@ class AbstractMain:
             self.color3000
         )
 
-    def test_strategy(self, objectives, start_x, start_y, start_theta, robot : str, suffix, color):
+    def plan_strategy(self, robot: str, iterations: int = 20000, restarts: Optional[int] = None, workers: Optional[int] = None):
+        """
+        Réordonne les objectifs de chaque couleur avec le MatchPlanner puis génère la stratégie.
+        Un rapport score / temps est écrit à côté des fichiers du simulateur.
+        """
+        config_data = load_config(self.year, robot, config_base_path=self.config_path)
+
+        for suffix, color, attribute, start in (
+            ('0', self.color0, 'objectifs_couleur_0', Position(self.start_x_0, self.start_y_0, self.start_theta_0)),
+            ('3000', self.color3000, 'objectifs_couleur_3000', Position(self.start_x_3000, self.start_y_3000, self.start_theta_3000)),
+        ):
+            planner = MatchPlanner(
+                objectives=getattr(self, attribute),
+                start_point=start,
+                table_config=config_data['table'],
+                color=color,
+                match_duration=config_data['matchDuration'],
+                estimator=TrajectoryEstimator.from_config(config_data.get('trajectoryEstimator')),
+            )
+            result = planner.plan(iterations=iterations, restarts=restarts, workers=workers)
+            setattr(self, attribute, result['objectives'])
+
+            print(f"Planification {color} : {result['evaluations']} ordres évalués, "
+                  f"{result['score']} points en {result['time']:.1f}s "
+                  f"(ordre du fichier : {result['baseline']['score']} points en {result['baseline']['time']:.1f}s)")
+            for step in result['timeline']:
+                print(f"  {step['start']:6.1f}s -> {step['end']:6.1f}s  +{step['points']:3d} = {step['score']:4d}  {step['desc']}")
+
+            report = {key: value for key, value in result.items() if key != 'objectives'}
+            write_atomic(f'{self.simulator_path}/{self.year}/planner-{robot}-{suffix}.json', json.dumps(report, indent=4))
+
+        self.generate_strategy(robot)
+
+    def simulate_strategy(self, robot: str, matches: int, workers: Optional[int] = None, seed: int = 0):
+        """
+        Joue la stratégie générée (strategy.json) sur matches matchs simulés en parallèle, avec des adversaires,
+        couleurs et bruits capteurs variés. Le rapport est écrit à côté des fichiers du simulateur.
+        """
+        # Importé ici : la simulation dépend de toute la pile de l'IA, inutile pour générer une stratégie
+        from ia.simulation.farm import SimulationFarm
+
+        farm = SimulationFarm(self.year, robot, matches, seed=seed, root=os.path.dirname(os.path.abspath(self.config_path)))
+        report = farm.run(workers=workers)
+
+        score = report.get('score')
+        if score is not None:
+            print(f"Simulation de {matches} matchs : score médian {score['median']} (min {score['min']}, max {score['max']}), "
+                  f"{report['emergency_stops']['mean']} arrêts d'urgence et {report['replans']['mean']} recalculs en moyenne")
+        for failure in report['failures']:
+            print(f"Match {failure['index']} en erreur : {failure['error']}")
+        write_atomic(f'{self.simulator_path}/{self.year}/farm-{robot}.json', json.dumps(report, indent=4))
+
+    def test_strategy(self, objectives, start_x, start_y, start_theta, robot : str, suffix, color,
+                      path_finding: Optional[VisibilityGraph] = None, verbose: bool = True) -> float:
+        """
+        Déroule les objectifs d'une couleur depuis la position de départ et écrit les commandes simulées
+        (fichier strategy-{robot}-{suffix}.json du simulateur). path_finding est un graphe déjà calculé
+        pour cette table et cette couleur, modifié par les tâches ; verbose affiche chaque commande.
+
+        Returns:
+            float: Durée estimée de la stratégie (s).
+        """
         config_data = load_config(self.year, robot, config_base_path=self.config_path)
-        path_finding = VisibilityGraph(table_config=config_data['table'], active_color=color)
+        if path_finding is None:
+            path_finding = VisibilityGraph(table_config=config_data['table'], active_color=color)
+        estimator = TrajectoryEstimator.from_config(config_data.get('trajectoryEstimator'))
         start_point = Position(start_x, start_y, start_theta)
         strat_simu = [{"task": "Position de départ", "command": "start", "position": start_point.to_dict()}]
 
         for objective in objectives:
             for task in objective.tasks:
                 task.path_finding = path_finding
+                task.estimator = estimator
                 execution = task.execute(start_point)
-                print(execution)
+                if verbose:
+                    print(execution)
                 if isinstance(execution, list):
                     strat_simu.extend(execution)
                 else:
                     strat_simu.append(execution)
                 start_point = task.end_point
+        if verbose:
+            print(f"Durée estimée de la stratégie {color} : {estimator.elapsed:.1f}s")
 
-        with open(f'{self.simulator_path}/{self.year}/strategy-{robot}-{suffix}.json', "w") as strat_file:
-            json.dump(strat_simu, strat_file, indent=4)
\ No newline at end of file
+        write_atomic(f'{self.simulator_path}/{self.year}/strategy-{robot}-{suffix}.json', json.dumps(strat_simu, indent=4))
+        return estimator.elapsed
\ No newline at end of file
@@ -0,0 +1,188 @@
+import glob
+import hashlib
+import importlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from ia.pathfinding.visibility_graph import VisibilityGraph
+from ia.strategy.compiled_strategy import compile_strategy_file
+from ia.utils.config_loader import load_config
+from ia.utils.files import write_atomic
+from strategy.core.conflicts import check_year, format_conflict
+from strategy.main.abstract_main import AbstractMain
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Code dont dépendent les fichiers générés en plus de la stratégie elle-même : le modifier régénère tout
+CODE_DEPENDENCIES = (
+    "strategy/core/*.py",
+    "strategy/task/*.py",
+    "strategy/main/abstract_main.py",
+    "ia/pathfinding/visibility_graph.py",
+    "ia/asservissement/trajectory_estimator.py",
+    "ia/strategy/compiled_strategy.py",
+    "ia/strategy/objective.py",
+    "ia/strategy/step.py",
+)
+
+# Graphes précalculés transmis une fois à chaque worker, par clé (table, couleur)
+_worker_graphs: Dict[Tuple[str, str], VisibilityGraph] = {}
+
+
+def code_fingerprint() -> str:
+    digest = hashlib.sha256()
+    for pattern in CODE_DEPENDENCIES:
+        for path in sorted(glob.glob(os.path.join(ROOT, pattern))):
+            with open(path, "rb") as source_file:
+                digest.update(source_file.read())
+    return digest.hexdigest()
+
+
+def _init_worker(graphs: Dict[Tuple[str, str], VisibilityGraph]) -> None:
+    _worker_graphs.update(graphs)
+
+
+def _test_color(generator: AbstractMain, robot: str, suffix: str, graph_key: Tuple[str, str]) -> Tuple[str, str, float, float]:
+    """Déroule une couleur sur une copie du graphe partagé : (robot, suffixe, durée du test, durée estimée du match)."""
+    start = time.perf_counter()
+    if suffix == '0':
+        objectives, start_pose, color = generator.objectifs_couleur_0, (generator.start_x_0, generator.start_y_0, generator.start_theta_0), generator.color0
+    else:
+        objectives, start_pose, color = generator.objectifs_couleur_3000, (generator.start_x_3000, generator.start_y_3000, generator.start_theta_3000), generator.color3000
+    estimated = generator.test_strategy(objectives, *start_pose, robot, suffix, color,
+                                        path_finding=_worker_graphs[graph_key].copy(), verbose=False)
+    return robot, suffix, time.perf_counter() - start, estimated
+
+
+class GenerationDriver:
+    """
+    Génère les stratégies de plusieurs robots (strategy/main/{annee}/all.py).
+
+    1. Chaque générateur construit ses objectifs (rapide, dans ce process) ; l'empreinte de son
+       strategy.json, de la config robot utilisée (table, trajectoryEstimator), des positions de départ
+       et du code de génération est comparée à celle de la génération précédente
+       (simulator/{annee}/strategy-{robot}.sha256) : un robot inchangé n'est pas régénéré.
+    2. strategy.json et strategy.cbor des robots modifiés sont écrits (écriture atomique).
+    3. Le test de chaque couleur (commandes simulées, pathfinding compris) tourne dans un pool de
+       process. Le graphe de visibilité est calculé une seule fois par (table, couleur) puis transmis
+       aux workers, chaque test partant d'une copie.
+
+    Un rapport de temps par robot est affiché à la fin, suivi des collisions entre les stratégies des
+    robots jouées en même temps (strategy.core.conflicts).
+    """
+
+    def __init__(self, strategies: List[Tuple[str, str]], workers: Optional[int] = None, force: bool = False) -> None:
+        """
+        Args:
+            strategies: (module, classe) des générateurs, AbstractMain dont generate() appelle generate_strategy.
+            workers: Taille du pool de process, nombre de CPU par défaut.
+            force: Régénère aussi les robots dont l'empreinte n'a pas changé.
+        """
+        self.strategies = strategies
+        self.workers = workers
+        self.force = force
+
+    @staticmethod
+    def _fingerprint(generator: AbstractMain, source: str, config_data: Dict, code: str) -> str:
+        digest = hashlib.sha256()
+        digest.update(source.encode())
+        digest.update(json.dumps({
+            "table": config_data['table'],
+            "trajectoryEstimator": config_data.get('trajectoryEstimator'),
+            "start": [generator.start_x_0, generator.start_y_0, generator.start_theta_0,
+                      generator.start_x_3000, generator.start_y_3000, generator.start_theta_3000],
+            "colors": [generator.color0, generator.color3000],
+        }, sort_keys=True).encode())
+        digest.update(code.encode())
+        return digest.hexdigest()
+
+    @staticmethod
+    def _outputs(generator: AbstractMain, robot: str) -> List[str]:
+        return [
+            f"{generator.config_path}/{generator.year}/{robot}/strategy.json",
+            f"{generator.config_path}/{generator.year}/{robot}/strategy.cbor",
+            f"{generator.simulator_path}/{generator.year}/strategy-{robot}-0.json",
+            f"{generator.simulator_path}/{generator.year}/strategy-{robot}-3000.json",
+        ]
+
+    def run(self) -> List[Dict]:
+        """
+        Returns:
+            Rapport par robot : robot, status ("inchangé" ou "généré"), build (s), test par couleur (s),
+            durée de match estimée par couleur (s).
+        """
+        start = time.perf_counter()
+        code = code_fingerprint()
+        reports: Dict[str, Dict] = {}
+        graphs: Dict[Tuple[str, str], VisibilityGraph] = {}
+        pending = []
+        generator: Optional[AbstractMain] = None
+
+        for module_path, class_name in self.strategies:
+            build_start = time.perf_counter()
+            generator = getattr(importlib.import_module(module_path), class_name)()
+            generator.defer_generation = True
+            generator.generate()
+            robot = generator.generated_robot
+            if robot is None:
+                raise ValueError(f"{module_path}.{class_name}.generate() n'appelle pas generate_strategy")
+
+            config_data = load_config(generator.year, robot, config_base_path=generator.config_path)
+            source = generator.strategy_json()
+            fingerprint = self._fingerprint(generator, source, config_data, code)
+            fingerprint_path = f"{generator.simulator_path}/{generator.year}/strategy-{robot}.sha256"
+            report = reports[robot] = {"robot": robot, "status": "inchangé", "test": {}, "estimated": {}}
+
+            unchanged = not self.force and all(os.path.exists(path) for path in self._outputs(generator, robot))
+            if unchanged and os.path.exists(fingerprint_path):
+                with open(fingerprint_path) as fingerprint_file:
+                    unchanged = fingerprint_file.read().strip() == fingerprint
+            else:
+                unchanged = False
+
+            if not unchanged:
+                report["status"] = "généré"
+                write_atomic(f"{generator.config_path}/{generator.year}/{robot}/strategy.json", source)
+                compile_strategy_file(f"{generator.config_path}/{generator.year}/{robot}")
+                table_key = json.dumps(config_data['table'], sort_keys=True)
+                for suffix, color in (('0', generator.color0), ('3000', generator.color3000)):
+                    graph_key = (table_key, color)
+                    if graph_key not in graphs:
+                        graphs[graph_key] = VisibilityGraph(table_config=config_data['table'], active_color=color)
+                    pending.append((generator, robot, suffix, graph_key))
+                report["fingerprint"] = (fingerprint_path, fingerprint)
+            report["build"] = time.perf_counter() - build_start
+
+        if pending:
+            with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker, initargs=(graphs,)) as pool:
+                futures = [pool.submit(_test_color, *task) for task in pending]
+                for future in futures:
+                    robot, suffix, elapsed, estimated = future.result()
+                    reports[robot]["test"][suffix] = elapsed
+                    reports[robot]["estimated"][suffix] = estimated
+
+        # Empreintes écrites une fois toutes les sorties du robot à jour
+        for report in reports.values():
+            fingerprint = report.pop("fingerprint", None)
+            if fingerprint is not None:
+                write_atomic(*fingerprint)
+
+        total = time.perf_counter() - start
+        for report in reports.values():
+            tests = " ".join(f"test {suffix} {elapsed:.2f}s (match {report['estimated'][suffix]:.1f}s)"
+                             for suffix, elapsed in sorted(report["test"].items()))
+            print(f"{report['robot']:<10} {report['status']:<9} build {report['build']:.2f}s {tests}")
+        print(f"{len(reports)} robots en {total:.2f}s ({len(pending)} tests de couleur, "
+              f"{len(graphs)} graphes de visibilité calculés)")
+
+        if generator is not None:
+            conflicts = check_year(generator.year, list(reports), config_path=generator.config_path,
+                                   simulator_path=generator.simulator_path)
+            for suffix, color_conflicts in conflicts.items():
+                print(f"Couleur {suffix} : {len(color_conflicts)} conflit(s) entre robots")
+                for conflict in color_conflicts:
+                    print(f"  {format_conflict(conflict)}")
+        return list(reports.values())
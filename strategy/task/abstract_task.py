@@ -21,11 +21,19 @@ class AbstractTask:
         self.instant_return = instant_return
         self.needed_flag = None
         self.path_finding = None
+        self.estimator = None
         self.end_point = None
 
     def execute(self, start_point: Position):
         return ""
 
+    def annotate(self, entry: dict, duration: float) -> dict:
+        """Ajoute la durée estimée et l'ETA (temps de match estimé en fin de commande) si un estimateur est fourni."""
+        if self.estimator is not None:
+            entry["duration"] = round(duration, 3)
+            entry["eta"] = round(self.estimator.advance(duration), 3)
+        return entry
+
     def calculate_theta(self, current_position, final_x, final_y):
             return math.atan2(final_y - current_position.y, final_x - current_position.x)
 
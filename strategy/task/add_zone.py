@@ -19,8 +19,8 @@ class AddZone(AbstractTask):
     def execute(self, start_point: Position):
         self.end_point = start_point
         self.path_finding.update_dynamic_zone(self.item_id, True)
-        return {
+        return self.annotate({
             "task": self.desc,
             "command": f"add-zone#{self.item_id}",
             "position": self.end_point.to_dict()
-        }
\ No newline at end of file
+        }, 0)
\ No newline at end of file
@@ -17,8 +17,8 @@ class DeleteZone(AbstractTask):
     def execute(self, start_point: Position):
         self.end_point = start_point
         self.path_finding.update_dynamic_zone(self.item_id, False)
-        return {
+        return self.annotate({
             "task": self.desc,
             "command": f"delete-zone#{self.item_id}",
             "position": self.end_point.to_dict()
-        }
\ No newline at end of file
+        }, 0)
\ No newline at end of file
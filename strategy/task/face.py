@@ -17,10 +17,11 @@ class Face(AbstractTask):
         )
 
     def execute(self, start_point: Position):
+        duration = self.estimator.face(start_point, self.position_x, self.position_y) if self.estimator is not None else 0
         self.end_point = start_point
         self.end_point.theta = self.calculate_theta(start_point, self.position_x, self.position_y)
-        return {
+        return self.annotate({
             "task": self.desc,
             "command": f"face#{self.position_x};{self.position_y}",
             "position": self.end_point.to_dict()
-        }
\ No newline at end of file
+        }, duration)
\ No newline at end of file
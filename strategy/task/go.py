@@ -23,8 +23,9 @@ class Go(AbstractTask):
         new_x = start_point.x + int(self.dist * math.cos(start_point.theta))
         new_y = start_point.y + int(self.dist * math.sin(start_point.theta))
         self.end_point = Position(new_x, new_y, start_point.theta)
-        return {
+        duration = self.estimator.straight_time(self.dist) if self.estimator is not None else 0
+        return self.annotate({
             "task": self.desc,
             "command": f"go#{self.dist}",
             "position": self.end_point.to_dict()
-        }
\ No newline at end of file
+        }, duration)
\ No newline at end of file
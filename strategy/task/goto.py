@@ -17,13 +17,16 @@ class GoTo(AbstractTask):
         )
 
     def execute(self, start_point: Position):
+        duration = 0
+        if self.estimator is not None:
+            duration, _ = self.estimator.goto(start_point, self.position_x, self.position_y)
         self.end_point = Position(
             self.position_x,
             self.position_y,
             self.calculate_theta(start_point, self.position_x, self.position_y)
         )
-        return {
+        return self.annotate({
             "task": self.desc,
             "command": f"goto#{self.position_x};{self.position_y}",
             "position": self.end_point.to_dict()
-        }
\ No newline at end of file
+        }, duration)
\ No newline at end of file
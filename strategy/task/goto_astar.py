@@ -37,14 +37,18 @@ class GoToAstar(AbstractTask):
                 f"Pathfinding impossible de {start_point} vers ({self.position_x},{self.position_y})"
             )
 
-        for p in path:
+        for index, p in enumerate(path):
+            duration = 0
             if self.end_point.x != p.x or self.end_point.y != p.y:
+                if self.estimator is not None:
+                    # Points intermédiaires en go_to_chain, goto précis sur le dernier (cf. MovementManager)
+                    duration, _ = self.estimator.goto(self.end_point, p.x, p.y, chain=index < len(path) - 1)
                 self.end_point = Position(p.x, p.y, self.calculate_theta(self.end_point, p.x, p.y))
             result.append(
-                {
+                self.annotate({
                     "task": self.desc,
                     "command": f"goto-astar#{p.x};{p.y}",
                     "position": self.end_point.to_dict()
-                }
+                }, duration)
             )
         return result
\ No newline at end of file
@@ -17,8 +17,11 @@ class Manipulation(AbstractTask):
 
     def execute(self, start_point: Position):
         self.end_point = start_point
-        return {
+        duration = 0
+        if self.estimator is not None and not self.instant_return:
+            duration = self.estimator.action_time(self.action_id)
+        return self.annotate({
             "task": self.desc,
             "command": f"action#{self.action_id}",
             "position": self.end_point.to_dict()
-        }
\ No newline at end of file
+        }, duration)
\ No newline at end of file
@@ -45,8 +45,10 @@ class OrbitalTurn(AbstractTask):
         new_theta = theta + rot
 
         self.end_point = Position(int(new_x), int(new_y), new_theta)
-        return {
+        # La roue extérieure parcourt un arc de rayon 2 * pivot_offset
+        duration = self.estimator.straight_time(2 * self.pivot_offset * angle_rad) if self.estimator is not None else 0
+        return self.annotate({
             "task": self.desc,
             "command": f"orbital-turn#{self.dist};{1 if self.forward else 0};{1 if self.on_right_wheel else 0}",
             "position": self.end_point.to_dict()
-        }
\ No newline at end of file
+        }, duration)
\ No newline at end of file
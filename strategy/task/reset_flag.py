@@ -17,8 +17,8 @@ class ResetFlag(AbstractTask):
 
     def execute(self, start_point: Position):
         self.end_point = start_point
-        return {
+        return self.annotate({
             "task": self.desc,
             "command": f"reset-flag#{','.join(self.reset_flags)}",
             "position": self.end_point.to_dict()
-        }
\ No newline at end of file
+        }, 0)
\ No newline at end of file
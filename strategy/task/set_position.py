@@ -19,8 +19,8 @@ class SetPosition(AbstractTask):
 
     def execute(self, start_point: Position):
         self.end_point = Position(self.position_x, self.position_y, self.dist)
-        return {
+        return self.annotate({
             "task": self.desc,
             "command": f"position#{self.position_x};{self.position_y};{self.dist}",
             "position": self.end_point.to_dict()
-        }
\ No newline at end of file
+        }, 0)
\ No newline at end of file
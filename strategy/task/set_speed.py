@@ -17,8 +17,10 @@ class SetSpeed(AbstractTask):
 
     def execute(self, start_point: Position):
         self.end_point = start_point
-        return {
+        if self.estimator is not None:
+            self.estimator.set_speed(self.dist)
+        return self.annotate({
             "task": self.desc,
             "command": f"speed#{self.dist}",
             "position": self.end_point.to_dict()
-        }
\ No newline at end of file
+        }, 0)
\ No newline at end of file
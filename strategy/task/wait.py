@@ -17,8 +17,8 @@ class Wait(AbstractTask):
 
     def execute(self, start_point: Position):
         self.end_point = start_point
-        return {
+        return self.annotate({
             "task": self.desc,
             "command": f"wait#{self.timeout}",
             "position": self.end_point.to_dict()
-        }
\ No newline at end of file
+        }, self.timeout / 1000)
\ No newline at end of file
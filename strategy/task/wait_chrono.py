@@ -17,8 +17,9 @@ class WaitChrono(AbstractTask):
 
     def execute(self, start_point: Position):
         self.end_point = start_point
-        return {
+        duration = max(0.0, self.timeout - self.estimator.elapsed) if self.estimator is not None else 0
+        return self.annotate({
             "task": self.desc,
             "command": f"wait-chrono#{self.timeout}",
             "position": self.end_point.to_dict()
-        }
\ No newline at end of file
+        }, duration)
\ No newline at end of file